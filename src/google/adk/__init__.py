@@ -12,9 +12,36 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+
 from . import version
-from .agents.llm_agent import Agent
-from .runners import Runner
+
+if TYPE_CHECKING:
+  from .agents.llm_agent import Agent
+  from .runners import Runner
 
 __version__ = version.__version__
 __all__ = ["Agent", "Runner"]
+
+# The exported names are imported on first access, so that importing a
+# submodule doesn't import the whole package.
+_LAZY_IMPORTS = {
+    "Agent": ".agents.llm_agent",
+    "Runner": ".runners",
+}
+
+
+def __getattr__(name: str):
+  module_name = _LAZY_IMPORTS.get(name)
+  if module_name is None:
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+  value = getattr(importlib.import_module(module_name, __name__), name)
+  globals()[name] = value
+  return value
+
+
+def __dir__():
+  return sorted(set(globals()) | set(__all__))
@@ -12,26 +12,49 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from .base_agent import BaseAgent
-from .invocation_context import InvocationContext
-from .live_request_queue import LiveRequest
-from .live_request_queue import LiveRequestQueue
-from .llm_agent import Agent
-from .llm_agent import LlmAgent
-from .loop_agent import LoopAgent
-from .parallel_agent import ParallelAgent
-from .run_config import RunConfig
-from .sequential_agent import SequentialAgent
-
-__all__ = [
-    'Agent',
-    'BaseAgent',
-    'LlmAgent',
-    'LoopAgent',
-    'ParallelAgent',
-    'SequentialAgent',
-    'InvocationContext',
-    'LiveRequest',
-    'LiveRequestQueue',
-    'RunConfig',
-]
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+  from .base_agent import BaseAgent
+  from .invocation_context import InvocationContext
+  from .live_request_queue import LiveRequest
+  from .live_request_queue import LiveRequestQueue
+  from .llm_agent import Agent
+  from .llm_agent import LlmAgent
+  from .loop_agent import LoopAgent
+  from .parallel_agent import ParallelAgent
+  from .run_config import RunConfig
+  from .sequential_agent import SequentialAgent
+
+# The exported names are imported on first access, so that importing a module
+# of this package doesn't import all the agents.
+_LAZY_IMPORTS = {
+    'Agent': '.llm_agent',
+    'BaseAgent': '.base_agent',
+    'LlmAgent': '.llm_agent',
+    'LoopAgent': '.loop_agent',
+    'ParallelAgent': '.parallel_agent',
+    'SequentialAgent': '.sequential_agent',
+    'InvocationContext': '.invocation_context',
+    'LiveRequest': '.live_request_queue',
+    'LiveRequestQueue': '.live_request_queue',
+    'RunConfig': '.run_config',
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name: str):
+  module_name = _LAZY_IMPORTS.get(name)
+  if module_name is None:
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+  value = getattr(importlib.import_module(module_name, __name__), name)
+  globals()[name] = value
+  return value
+
+
+def __dir__():
+  return sorted(set(globals()) | set(__all__))
@@ -209,6 +209,16 @@ class InvocationContext(BaseModel):
   of this invocation.
   """
 
+  _realtime_cache_bytes: dict[str, int] = PrivateAttr(default_factory=dict)
+  """The number of bytes in the input and output realtime caches, keyed by
+  cache type. Owned by the audio cache manager.
+  """
+
+  _contents_caches: dict[Optional[str], Any] = PrivateAttr(default_factory=dict)
+  """Caches of the session events filtered for the LLM requests of this
+  invocation, keyed by branch. Owned by the contents request processor.
+  """
+
   @property
   def is_resumable(self) -> bool:
     """Returns whether the current invocation is resumable."""
@@ -15,6 +15,9 @@
 from __future__ import annotations
 
 import asyncio
+import collections
+from enum import Enum
+import time
 from typing import Optional
 
 from google.genai import types
@@ -41,10 +44,166 @@ class LiveRequest(BaseModel):
   """If set, close the queue. queue.shutdown() is only supported in Python 3.13+."""
 
 
+class OverflowPolicy(Enum):
+  """What a bounded LiveRequestQueue does with a realtime blob when full."""
+
+  BLOCK = 'block'
+  """`send_async` waits for capacity, the sync senders raise QueueFull."""
+  DROP_OLDEST = 'drop_oldest'
+  """Drops the oldest queued blob, so that stale audio is not sent."""
+  COALESCE_AUDIO = 'coalesce_audio'
+  """Appends the audio to the newest queued blob if it is adjacent, of the
+  same mime type and the merged blob doesn't exceed `max_coalesced_blob_bytes`,
+  and drops the oldest queued blob otherwise."""
+
+
+_DEFAULT_MAX_COALESCED_BLOB_BYTES = 256 * 1024
+
+
+class LiveRequestQueueStats(BaseModel):
+  """Metrics of a LiveRequestQueue."""
+
+  depth: int
+  """The number of queued requests."""
+  queued_blobs: int
+  """The number of queued realtime blobs."""
+  dropped_blobs: int
+  """The number of realtime blobs dropped because the queue was full."""
+  coalesced_blobs: int
+  """The number of realtime blobs merged into a queued blob."""
+  oldest_request_age_seconds: float
+  """How long the oldest queued request has been waiting."""
+  last_request_lag_seconds: float
+  """How long the last dequeued request waited in the queue."""
+
+
+class _LiveRequestBuffer(asyncio.Queue):
+  """An asyncio.Queue bounding the number of queued realtime blobs.
+
+  Requests that are not blobs, e.g. content or close, are never dropped nor
+  counted against the bound.
+  """
+
+  def __init__(
+      self,
+      max_queued_blobs: Optional[int],
+      overflow_policy: OverflowPolicy,
+      max_coalesced_blob_bytes: int = _DEFAULT_MAX_COALESCED_BLOB_BYTES,
+  ):
+    super().__init__()
+    self.max_queued_blobs = max_queued_blobs
+    self.overflow_policy = overflow_policy
+    self.max_coalesced_blob_bytes = max_coalesced_blob_bytes
+    self.enqueue_times = collections.deque()
+    self.queued_blobs = 0
+    self.dropped_blobs = 0
+    self.coalesced_blobs = 0
+    self.last_request_lag_seconds = 0.0
+    self.blob_dequeued = asyncio.Event()
+
+  def is_full_for(self, req: LiveRequest) -> bool:
+    return (
+        req.blob is not None
+        and self.max_queued_blobs is not None
+        and self.queued_blobs >= self.max_queued_blobs
+    )
+
+  def put_nowait(self, item: LiveRequest):
+    if self.is_full_for(item):
+      if self.overflow_policy == OverflowPolicy.BLOCK:
+        raise asyncio.QueueFull()
+      if self.overflow_policy == OverflowPolicy.COALESCE_AUDIO and (
+          self._coalesce(item)
+      ):
+        # Merged into a queued request, so there is no new task to join.
+        return
+      self._drop_oldest_blob()
+      # The dropped blob will never be gotten, so its task is done.
+      self.task_done()
+    super().put_nowait(item)
+
+  def _put(self, item: LiveRequest):
+    self._queue.append(item)
+    self.enqueue_times.append(time.monotonic())
+    if item.blob is not None:
+      self.queued_blobs += 1
+
+  def _get(self) -> LiveRequest:
+    item = self._queue.popleft()
+    self.last_request_lag_seconds = (
+        time.monotonic() - self.enqueue_times.popleft()
+    )
+    if item.blob is not None:
+      self.queued_blobs -= 1
+      self.blob_dequeued.set()
+    return item
+
+  def _coalesce(self, item: LiveRequest) -> bool:
+    """Appends the blob to the newest queued request if it is a blob too."""
+    if not self._queue:
+      return False
+    last = self._queue[-1]
+    if (
+        last.blob is None
+        or last.blob.mime_type != item.blob.mime_type
+        or not (item.blob.mime_type or '').startswith('audio/')
+    ):
+      return False
+    # Bounds both the memory of a queued request and the bytes copied by
+    # each merge.
+    if (
+        len(last.blob.data or b'') + len(item.blob.data or b'')
+        > self.max_coalesced_blob_bytes
+    ):
+      return False
+    self._queue[-1] = LiveRequest(
+        blob=types.Blob(
+            data=(last.blob.data or b'') + (item.blob.data or b''),
+            mime_type=last.blob.mime_type,
+        )
+    )
+    self.coalesced_blobs += 1
+    return True
+
+  def _drop_oldest_blob(self):
+    for i, queued in enumerate(self._queue):
+      if queued.blob is not None:
+        del self._queue[i]
+        del self.enqueue_times[i]
+        self.queued_blobs -= 1
+        self.dropped_blobs += 1
+        return
+
+
 class LiveRequestQueue:
-  """Queue used to send LiveRequest in a live(bidirectional streaming) way."""
+  """Queue used to send LiveRequest in a live(bidirectional streaming) way.
+
+  By default the queue is unbounded. With `max_queued_blobs`, at most that many
+  realtime blobs are queued and `overflow_policy` decides what happens to new
+  ones, so that a producer faster than the model connection neither grows the
+  memory nor the latency without limit.
+  """
+
+  def __init__(
+      self,
+      max_queued_blobs: Optional[int] = None,
+      overflow_policy: OverflowPolicy = OverflowPolicy.BLOCK,
+      max_coalesced_blob_bytes: int = _DEFAULT_MAX_COALESCED_BLOB_BYTES,
+  ):
+    """Initializes the queue.
+
+    Args:
+      max_queued_blobs: The maximum number of queued realtime blobs. `None`
+        means unbounded.
+      overflow_policy: What to do with a realtime blob when the queue is full.
+      max_coalesced_blob_bytes: The maximum size of a blob merged by the
+        COALESCE_AUDIO policy. Past it, the oldest queued blob is dropped.
+    """
+    if max_queued_blobs is not None and max_queued_blobs < 1:
+      raise ValueError('max_queued_blobs must be at least 1.')
+    if max_coalesced_blob_bytes < 1:
+      raise ValueError('max_coalesced_blob_bytes must be at least 1.')
 
-  def __init__(self):
     # Ensure there's an event loop available in this thread
     try:
       asyncio.get_running_loop()
@@ -54,7 +213,9 @@ class LiveRequestQueue:
       asyncio.set_event_loop(loop)
 
     # Now create the queue (it will use the event loop we just ensured exists)
-    self._queue = asyncio.Queue()
+    self._queue = _LiveRequestBuffer(
+        max_queued_blobs, overflow_policy, max_coalesced_blob_bytes
+    )
 
   def close(self):
     self._queue.put_nowait(LiveRequest(close=True))
@@ -63,6 +224,11 @@ class LiveRequestQueue:
     self._queue.put_nowait(LiveRequest(content=content))
 
   def send_realtime(self, blob: types.Blob):
+    """Sends a realtime blob.
+
+    Raises:
+      asyncio.QueueFull: If the queue is full and the overflow policy is BLOCK.
+    """
     self._queue.put_nowait(LiveRequest(blob=blob))
 
   def send_activity_start(self):
@@ -76,5 +242,29 @@ class LiveRequestQueue:
   def send(self, req: LiveRequest):
     self._queue.put_nowait(req)
 
+  async def send_async(self, req: LiveRequest):
+    """Sends a request, waiting for capacity under the BLOCK policy."""
+    while (
+        self._queue.overflow_policy == OverflowPolicy.BLOCK
+        and self._queue.is_full_for(req)
+    ):
+      self._queue.blob_dequeued.clear()
+      await self._queue.blob_dequeued.wait()
+    self._queue.put_nowait(req)
+
   async def get(self) -> LiveRequest:
     return await self._queue.get()
+
+  def get_stats(self) -> LiveRequestQueueStats:
+    """Returns the current depth, drop and lag metrics of the queue."""
+    enqueue_times = self._queue.enqueue_times
+    return LiveRequestQueueStats(
+        depth=self._queue.qsize(),
+        queued_blobs=self._queue.queued_blobs,
+        dropped_blobs=self._queue.dropped_blobs,
+        coalesced_blobs=self._queue.coalesced_blobs,
+        oldest_request_age_seconds=(
+            time.monotonic() - enqueue_times[0] if enqueue_times else 0.0
+        ),
+        last_request_lag_seconds=self._queue.last_request_lag_seconds,
+    )
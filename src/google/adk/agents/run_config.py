@@ -26,6 +26,8 @@ from pydantic import ConfigDict
 from pydantic import Field
 from pydantic import field_validator
 
+from .tool_execution_config import ToolExecutionConfig
+
 logger = logging.getLogger('google_adk.' + __name__)
 
 
@@ -122,6 +124,12 @@ class RunConfig(BaseModel):
   custom_metadata: Optional[dict[str, Any]] = None
   """Custom metadata for the current invocation."""
 
+  tool_execution_config: Optional[ToolExecutionConfig] = None
+  """The default execution config of synchronous function tools.
+
+  A tool's own execution config takes precedence over this one.
+  """
+
   @field_validator('max_llm_calls', mode='after')
   @classmethod
   def validate_max_llm_calls(cls, value: int) -> int:
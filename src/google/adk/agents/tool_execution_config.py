@@ -0,0 +1,96 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+from enum import Enum
+from typing import Optional
+
+from pydantic import BaseModel
+from pydantic import ConfigDict
+from pydantic import Field
+
+from ..utils.feature_decorator import experimental
+
+
+class ToolExecutionMode(Enum):
+  """Where synchronous function tools are executed."""
+
+  INLINE = "inline"
+  """Call the function directly on the event loop."""
+
+  THREAD = "thread"
+  """Run the function in a worker thread pool."""
+
+  PROCESS = "process"
+  """Run the function in a worker process pool.
+
+  The function and its arguments must be picklable. Functions that take a
+  `tool_context` run in the thread pool instead.
+  """
+
+
+@experimental
+class ToolExecutionConfig(BaseModel):
+  """Configuration for executing synchronous function tools.
+
+  By default, synchronous function tools are called on the event loop, so a
+  blocking tool stalls every other coroutine on the worker, including the
+  other function calls of a parallel function call. With a thread or process
+  mode, synchronous tools run off the event loop and parallel function calls
+  run concurrently. Asynchronous tools are not affected.
+
+  The thread and process pools are process-wide and shared by all the tools
+  whose configurations have the same `mode` and `max_workers`, whichever agent
+  or run they belong to. `Runner.close` and the interpreter exit shut them
+  down; they are recreated by the next tool calls.
+
+  Attributes:
+      mode: Where synchronous function tools are executed.
+      max_workers: The size of the shared pool the tools run in. It bounds the
+        number of calls running at the same time across all the tools sharing
+        the pool, not per tool.
+      timeout_seconds: The max time to wait for a tool before returning an
+        error to the model.
+  """
+
+  model_config = ConfigDict(
+      extra="forbid",
+  )
+
+  mode: ToolExecutionMode = Field(
+      default=ToolExecutionMode.INLINE,
+      description="Where synchronous function tools are executed.",
+  )
+
+  max_workers: Optional[int] = Field(
+      default=None,
+      ge=1,
+      description=(
+          "The size of the pool shared by all the tools with the same mode and"
+          " max_workers. It bounds the number of their calls running at the"
+          " same time across all of them, not per tool. Defaults to the"
+          " executor's default pool size."
+      ),
+  )
+
+  timeout_seconds: Optional[float] = Field(
+      default=None,
+      gt=0,
+      description=(
+          "The max time to wait for a tool before returning an error to the"
+          " model. A timed-out tool is not interrupted, it keeps its worker"
+          " until it returns."
+      ),
+  )
@@ -0,0 +1,483 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""An artifact service implementation using the local filesystem.
+
+The directory layout depends on whether the filename has a user namespace:
+  - For files with user namespace (starting with "user:"):
+    {root_dir}/{app_name}/{user_id}/user/artifacts/{filename}/{version}
+  - For regular session-scoped files:
+    {root_dir}/{app_name}/{user_id}/sessions/{session_id}/artifacts/{filename}/{version}
+
+Every path segment is percent-encoded, so filenames containing slashes map to
+a single directory. Each scope directory also holds an `index.json` file with
+the metadata of all its artifact versions, so listing artifacts and versions
+never walks the directory tree.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+from pathlib import Path
+import shutil
+import tempfile
+import threading
+from typing import Any
+from typing import Literal
+from typing import Optional
+from urllib.parse import quote
+
+from google.genai import types
+from pydantic import BaseModel
+from pydantic import Field
+from typing_extensions import override
+
+from . import artifact_util
+from .base_artifact_service import ArtifactVersion
+from .base_artifact_service import BaseArtifactService
+
+logger = logging.getLogger("google_adk." + __name__)
+
+_INDEX_FILENAME = "index.json"
+
+
+class _StoredVersion(BaseModel):
+  """The index entry of a single artifact version."""
+
+  artifact_version: ArtifactVersion
+  payload: Literal["inline_data", "text", "file_data"]
+  """How the part was serialized into the version file."""
+
+
+class _ScopeIndex(BaseModel):
+  """The metadata index of all the artifacts of a user or session scope."""
+
+  artifacts: dict[str, list[_StoredVersion]] = Field(default_factory=dict)
+
+
+def _encode_path_segment(value: str) -> str:
+  """Encodes a value so that it maps to exactly one path segment."""
+  segment = quote(value, safe="")
+  if segment in (".", ".."):
+    segment = segment.replace(".", "%2E")
+  return segment
+
+
+def _write_atomically(path: Path, data: bytes) -> None:
+  """Writes a file so that readers never observe a partial write."""
+  path.parent.mkdir(parents=True, exist_ok=True)
+  fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+  try:
+    with os.fdopen(fd, "wb") as f:
+      f.write(data)
+      f.flush()
+      os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+  except BaseException:
+    os.unlink(tmp_path)
+    raise
+
+
+class FileArtifactService(BaseArtifactService):
+  """An artifact service implementation using the local filesystem.
+
+  Artifact bytes are only read from disk when loaded, so large artifacts don't
+  stay resident in the process memory. Version files and indexes are written
+  atomically. The indexes are cached in memory and reloaded when they are
+  modified on disk, but concurrent writers to the same scope from several
+  processes are not supported.
+  """
+
+  def __init__(self, root_dir: str | os.PathLike[str]):
+    """Initializes the FileArtifactService.
+
+    Args:
+        root_dir: The directory under which the artifacts are stored. It is
+          created if it doesn't exist.
+    """
+    self.root_dir = Path(root_dir).resolve()
+    self.root_dir.mkdir(parents=True, exist_ok=True)
+    self._lock = threading.Lock()
+    # Maps index paths to their (mtime_ns, size) signature and content.
+    self._index_cache: dict[Path, tuple[tuple[int, int], _ScopeIndex]] = {}
+
+  @override
+  async def save_artifact(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      filename: str,
+      artifact: types.Part,
+      session_id: Optional[str] = None,
+      custom_metadata: Optional[dict[str, Any]] = None,
+  ) -> int:
+    return await asyncio.to_thread(
+        self._save_artifact,
+        app_name,
+        user_id,
+        session_id,
+        filename,
+        artifact,
+        custom_metadata,
+    )
+
+  @override
+  async def load_artifact(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      filename: str,
+      session_id: Optional[str] = None,
+      version: Optional[int] = None,
+  ) -> Optional[types.Part]:
+    artifact = await asyncio.to_thread(
+        self._load_artifact,
+        app_name,
+        user_id,
+        session_id,
+        filename,
+        version,
+    )
+    # Resolve artifact reference if needed.
+    if artifact is not None and artifact_util.is_artifact_ref(artifact):
+      parsed_uri = artifact_util.parse_artifact_uri(artifact.file_data.file_uri)
+      if not parsed_uri:
+        raise ValueError(
+            f"Invalid artifact reference URI: {artifact.file_data.file_uri}"
+        )
+      return await self.load_artifact(
+          app_name=parsed_uri.app_name,
+          user_id=parsed_uri.user_id,
+          filename=parsed_uri.filename,
+          session_id=parsed_uri.session_id,
+          version=parsed_uri.version,
+      )
+    return artifact
+
+  @override
+  async def list_artifact_keys(
+      self, *, app_name: str, user_id: str, session_id: Optional[str] = None
+  ) -> list[str]:
+    return await asyncio.to_thread(
+        self._list_artifact_keys, app_name, user_id, session_id
+    )
+
+  @override
+  async def delete_artifact(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      filename: str,
+      session_id: Optional[str] = None,
+  ) -> None:
+    return await asyncio.to_thread(
+        self._delete_artifact, app_name, user_id, session_id, filename
+    )
+
+  @override
+  async def list_versions(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      filename: str,
+      session_id: Optional[str] = None,
+  ) -> list[int]:
+    artifact_versions = await self.list_artifact_versions(
+        app_name=app_name,
+        user_id=user_id,
+        filename=filename,
+        session_id=session_id,
+    )
+    return [artifact_version.version for artifact_version in artifact_versions]
+
+  @override
+  async def list_artifact_versions(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      filename: str,
+      session_id: Optional[str] = None,
+  ) -> list[ArtifactVersion]:
+    return await asyncio.to_thread(
+        self._list_artifact_versions, app_name, user_id, session_id, filename
+    )
+
+  @override
+  async def get_artifact_version(
+      self,
+      *,
+      app_name: str,
+      user_id: str,
+      filename: str,
+      session_id: Optional[str] = None,
+      version: Optional[int] = None,
+  ) -> Optional[ArtifactVersion]:
+    stored_version = await asyncio.to_thread(
+        self._get_stored_version,
+        app_name,
+        user_id,
+        session_id,
+        filename,
+        version,
+    )
+    return stored_version.artifact_version if stored_version else None
+
+  def _file_has_user_namespace(self, filename: str) -> bool:
+    """Checks if the filename has a user namespace.
+
+    Args:
+        filename: The filename to check.
+
+    Returns:
+        True if the filename has a user namespace (starts with "user:"),
+        False otherwise.
+    """
+    return filename.startswith("user:")
+
+  def _get_user_scope_dir(self, app_name: str, user_id: str) -> Path:
+    return (
+        self.root_dir
+        / _encode_path_segment(app_name)
+        / _encode_path_segment(user_id)
+        / "user"
+    )
+
+  def _get_session_scope_dir(
+      self, app_name: str, user_id: str, session_id: str
+  ) -> Path:
+    return (
+        self.root_dir
+        / _encode_path_segment(app_name)
+        / _encode_path_segment(user_id)
+        / "sessions"
+        / _encode_path_segment(session_id)
+    )
+
+  def _get_scope_dir(
+      self,
+      app_name: str,
+      user_id: str,
+      filename: str,
+      session_id: Optional[str],
+  ) -> Path:
+    """Returns the directory of the scope the artifact belongs to."""
+    if self._file_has_user_namespace(filename):
+      return self._get_user_scope_dir(app_name, user_id)
+
+    if session_id is None:
+      raise ValueError(
+          "Session ID must be provided for session-scoped artifacts."
+      )
+    return self._get_session_scope_dir(app_name, user_id, session_id)
+
+  def _get_version_path(
+      self, scope_dir: Path, filename: str, version: int
+  ) -> Path:
+    return (
+        scope_dir / "artifacts" / _encode_path_segment(filename) / str(version)
+    )
+
+  def _read_index(self, scope_dir: Path) -> _ScopeIndex:
+    """Reads the index of a scope, reusing the cached copy if up to date."""
+    index_path = scope_dir / _INDEX_FILENAME
+    try:
+      stat = index_path.stat()
+    except FileNotFoundError:
+      self._index_cache.pop(index_path, None)
+      return _ScopeIndex()
+    signature = (stat.st_mtime_ns, stat.st_size)
+    cached = self._index_cache.get(index_path)
+    if cached and cached[0] == signature:
+      return cached[1]
+    index = _ScopeIndex.model_validate_json(index_path.read_bytes())
+    self._index_cache[index_path] = (signature, index)
+    return index
+
+  def _write_index(self, scope_dir: Path, index: _ScopeIndex) -> None:
+    index_path = scope_dir / _INDEX_FILENAME
+    _write_atomically(index_path, index.model_dump_json().encode("utf-8"))
+    stat = index_path.stat()
+    self._index_cache[index_path] = ((stat.st_mtime_ns, stat.st_size), index)
+
+  def _save_artifact(
+      self,
+      app_name: str,
+      user_id: str,
+      session_id: Optional[str],
+      filename: str,
+      artifact: types.Part,
+      custom_metadata: Optional[dict[str, Any]] = None,
+  ) -> int:
+    scope_dir = self._get_scope_dir(app_name, user_id, filename, session_id)
+
+    if artifact.inline_data is not None:
+      payload = "inline_data"
+      data = artifact.inline_data.data or b""
+      mime_type = artifact.inline_data.mime_type
+    elif artifact.text is not None:
+      payload = "text"
+      data = artifact.text.encode("utf-8")
+      mime_type = "text/plain"
+    elif artifact.file_data is not None:
+      payload = "file_data"
+      data = artifact.file_data.model_dump_json().encode("utf-8")
+      if artifact_util.is_artifact_ref(artifact):
+        if not artifact_util.parse_artifact_uri(artifact.file_data.file_uri):
+          raise ValueError(
+              f"Invalid artifact reference URI: {artifact.file_data.file_uri}"
+          )
+        # We don't know the mime type of a reference until we load it.
+        mime_type = None
+      else:
+        mime_type = artifact.file_data.mime_type
+    else:
+      raise ValueError("Not supported artifact type.")
+
+    with self._lock:
+      index = self._read_index(scope_dir).model_copy(deep=True)
+      stored_versions = index.artifacts.setdefault(filename, [])
+      version = (
+          stored_versions[-1].artifact_version.version + 1
+          if stored_versions
+          else 0
+      )
+      version_path = self._get_version_path(scope_dir, filename, version)
+      _write_atomically(version_path, data)
+
+      artifact_version = ArtifactVersion(
+          version=version,
+          canonical_uri=version_path.as_uri(),
+          mime_type=mime_type,
+      )
+      if custom_metadata:
+        artifact_version.custom_metadata = custom_metadata
+      stored_versions.append(
+          _StoredVersion(artifact_version=artifact_version, payload=payload)
+      )
+      self._write_index(scope_dir, index)
+    return version
+
+  def _get_stored_version(
+      self,
+      app_name: str,
+      user_id: str,
+      session_id: Optional[str],
+      filename: str,
+      version: Optional[int] = None,
+  ) -> Optional[_StoredVersion]:
+    scope_dir = self._get_scope_dir(app_name, user_id, filename, session_id)
+    with self._lock:
+      stored_versions = self._read_index(scope_dir).artifacts.get(filename)
+    if not stored_versions:
+      return None
+    if version is None:
+      return stored_versions[-1]
+    return next(
+        (
+            stored_version
+            for stored_version in stored_versions
+            if stored_version.artifact_version.version == version
+        ),
+        None,
+    )
+
+  def _load_artifact(
+      self,
+      app_name: str,
+      user_id: str,
+      session_id: Optional[str],
+      filename: str,
+      version: Optional[int] = None,
+  ) -> Optional[types.Part]:
+    stored_version = self._get_stored_version(
+        app_name, user_id, session_id, filename, version
+    )
+    if not stored_version:
+      return None
+
+    scope_dir = self._get_scope_dir(app_name, user_id, filename, session_id)
+    version_path = self._get_version_path(
+        scope_dir, filename, stored_version.artifact_version.version
+    )
+    try:
+      data = version_path.read_bytes()
+    except FileNotFoundError:
+      logger.warning("Artifact version file %s is missing.", version_path)
+      return None
+    if not data:
+      return None
+
+    if stored_version.payload == "text":
+      return types.Part(text=data.decode("utf-8"))
+    if stored_version.payload == "file_data":
+      return types.Part(file_data=types.FileData.model_validate_json(data))
+    return types.Part.from_bytes(
+        data=data, mime_type=stored_version.artifact_version.mime_type
+    )
+
+  def _list_artifact_keys(
+      self, app_name: str, user_id: str, session_id: Optional[str]
+  ) -> list[str]:
+    scope_dirs = [self._get_user_scope_dir(app_name, user_id)]
+    if session_id:
+      scope_dirs.append(
+          self._get_session_scope_dir(app_name, user_id, session_id)
+      )
+    filenames = set()
+    with self._lock:
+      for scope_dir in scope_dirs:
+        filenames.update(self._read_index(scope_dir).artifacts)
+    return sorted(filenames)
+
+  def _delete_artifact(
+      self,
+      app_name: str,
+      user_id: str,
+      session_id: Optional[str],
+      filename: str,
+  ) -> None:
+    scope_dir = self._get_scope_dir(app_name, user_id, filename, session_id)
+    with self._lock:
+      index = self._read_index(scope_dir)
+      if filename not in index.artifacts:
+        return
+      index = index.model_copy(deep=True)
+      del index.artifacts[filename]
+      # Update the index first so the artifact is never listed without files.
+      self._write_index(scope_dir, index)
+      shutil.rmtree(
+          scope_dir / "artifacts" / _encode_path_segment(filename),
+          ignore_errors=True,
+      )
+
+  def _list_artifact_versions(
+      self,
+      app_name: str,
+      user_id: str,
+      session_id: Optional[str],
+      filename: str,
+  ) -> list[ArtifactVersion]:
+    scope_dir = self._get_scope_dir(app_name, user_id, filename, session_id)
+    with self._lock:
+      stored_versions = self._read_index(scope_dir).artifacts.get(filename, [])
+    return [
+        stored_version.artifact_version for stored_version in stored_versions
+    ]
@@ -16,6 +16,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Optional
 
@@ -26,6 +27,9 @@ from google.adk.auth.auth_schemes import OAuthGrantType
 from google.adk.auth.auth_schemes import OpenIdConnectWithConfig
 from google.adk.auth.oauth2_credential_util import create_oauth2_session
 from google.adk.auth.oauth2_credential_util import update_credential_with_tokens
+from google.adk.auth.oauth2_token_cache import create_token_cache_key
+from google.adk.auth.oauth2_token_cache import get_default_oauth2_token_cache
+from google.adk.auth.oauth2_token_cache import OAuth2TokenCache
 from google.adk.utils.feature_decorator import experimental
 from typing_extensions import override
 
@@ -44,7 +48,21 @@ logger = logging.getLogger("google_adk." + __name__)
 
 @experimental
 class OAuth2CredentialExchanger(BaseCredentialExchanger):
-  """Exchanges OAuth2 credentials from authorization responses."""
+  """Exchanges OAuth2 credentials from authorization responses.
+
+  Client credentials tokens are shared through a token cache, so that
+  concurrent exchanges for the same client, scope and token endpoint send a
+  single token request.
+  """
+
+  def __init__(self, token_cache: Optional[OAuth2TokenCache] = None):
+    """Initializes the exchanger.
+
+    Args:
+        token_cache: The cache of the client credentials tokens. If None, uses
+          the process-wide cache.
+    """
+    self._token_cache = token_cache or get_default_oauth2_token_cache()
 
   @override
   async def exchange(
@@ -145,10 +163,23 @@ class OAuth2CredentialExchanger(BaseCredentialExchanger):
       )
       return auth_credential
 
+    cache_key = create_token_cache_key(
+        OAuthGrantType.CLIENT_CREDENTIALS,
+        token_endpoint,
+        client.client_id,
+        client.client_secret,
+        client.scope,
+    )
     try:
-      tokens = client.fetch_token(
-          token_endpoint,
-          grant_type=OAuthGrantType.CLIENT_CREDENTIALS,
+      # authlib's session is synchronous, so it is run in a thread to not
+      # block the event loop.
+      tokens = await self._token_cache.get_token(
+          cache_key,
+          lambda: asyncio.to_thread(
+              client.fetch_token,
+              token_endpoint,
+              grant_type=OAuthGrantType.CLIENT_CREDENTIALS,
+          ),
       )
       update_credential_with_tokens(auth_credential, tokens)
       logger.debug("Successfully exchanged client credentials for access token")
@@ -180,7 +211,8 @@ class OAuth2CredentialExchanger(BaseCredentialExchanger):
       return auth_credential
 
     try:
-      tokens = client.fetch_token(
+      tokens = await asyncio.to_thread(
+          client.fetch_token,
           token_endpoint,
           authorization_response=auth_credential.oauth2.auth_response_uri,
           code=auth_credential.oauth2.auth_code,
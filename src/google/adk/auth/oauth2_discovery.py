@@ -14,10 +14,15 @@
 
 from __future__ import annotations
 
+import collections
 import json
 import logging
+import re
+import threading
+import time
 from typing import List
 from typing import Optional
+from typing import TypeVar
 from urllib.parse import urlparse
 
 import httpx
@@ -25,9 +30,24 @@ from pydantic import BaseModel
 from pydantic import ValidationError
 
 from ..utils.feature_decorator import experimental
+from ..utils.http_transport import get_default_http_transport
+from ..utils.http_transport import HttpTransport
 
 logger = logging.getLogger("google_adk." + __name__)
 
+_DEFAULT_METADATA_TTL_SECONDS = 3600.0
+_MAX_METADATA_CACHE_ENTRIES = 256
+_MAX_AGE_PATTERN = re.compile(r"(?:^|,)\s*max-age\s*=\s*\"?(\d+)\"?", re.I)
+
+# Discovery tries several well-known endpoints in turn, so a failing one isn't
+# retried, and redirects aren't followed, as the metadata must come from the
+# issuer itself.
+_DISCOVERY_REQUEST_OPTIONS = dict(
+    timeout=5, follow_redirects=False, max_retries=0
+)
+
+_MetadataT = TypeVar("_MetadataT", bound=BaseModel)
+
 
 @experimental
 class AuthorizationServerMetadata(BaseModel):
@@ -48,14 +68,99 @@ class ProtectedResourceMetadata(BaseModel):
   authorization_servers: List[str] = []
 
 
+def _get_metadata_ttl(response: httpx.Response) -> float:
+  """Returns how long the metadata in the response may be cached."""
+  cache_control = response.headers.get("Cache-Control")
+  if not cache_control:
+    return _DEFAULT_METADATA_TTL_SECONDS
+  directives = cache_control.lower()
+  if "no-store" in directives or "no-cache" in directives:
+    return 0.0
+  match = _MAX_AGE_PATTERN.search(directives)
+  if match:
+    return float(match.group(1))
+  return _DEFAULT_METADATA_TTL_SECONDS
+
+
+class _MetadataCache:
+  """A thread-safe cache of discovered metadata, expiring the entries.
+
+  Beyond `max_entries`, the expired entries are dropped first, then the least
+  recently used ones.
+  """
+
+  def __init__(self, max_entries: int = _MAX_METADATA_CACHE_ENTRIES):
+    self._max_entries = max_entries
+    self._entries: collections.OrderedDict[
+        tuple[str, str], tuple[float, BaseModel]
+    ] = collections.OrderedDict()
+    self._lock = threading.Lock()
+
+  def get(self, kind: type[_MetadataT], url: str) -> Optional[_MetadataT]:
+    key = (kind.__name__, url)
+    with self._lock:
+      entry = self._entries.get(key)
+      if entry is None:
+        return None
+      expires_at, metadata = entry
+      if expires_at <= time.monotonic():
+        del self._entries[key]
+        return None
+      self._entries.move_to_end(key)
+    # Copies, so that callers can't modify the cached metadata.
+    return metadata.model_copy(deep=True)
+
+  def put(self, url: str, metadata: BaseModel, ttl_seconds: float):
+    if ttl_seconds <= 0:
+      return
+    key = (type(metadata).__name__, url)
+    now = time.monotonic()
+    with self._lock:
+      self._entries[key] = (now + ttl_seconds, metadata.model_copy(deep=True))
+      self._entries.move_to_end(key)
+      if len(self._entries) <= self._max_entries:
+        return
+      for expired_key in [
+          k for k, (expires_at, _) in self._entries.items() if expires_at <= now
+      ]:
+        del self._entries[expired_key]
+      while len(self._entries) > self._max_entries:
+        self._entries.popitem(last=False)
+
+  def clear(self):
+    with self._lock:
+      self._entries.clear()
+
+
+# Shared by all the managers, as the metadata doesn't depend on the caller.
+_metadata_cache = _MetadataCache()
+
+
 @experimental
 class OAuth2DiscoveryManager:
-  """Implements Metadata discovery for OAuth2 following RFC8414 and RFC9728."""
+  """Implements Metadata discovery for OAuth2 following RFC8414 and RFC9728.
+
+  The discovered metadata is cached for the duration allowed by the
+  `Cache-Control` header of its response, or an hour by default.
+  """
+
+  def __init__(self, http_transport: Optional[HttpTransport] = None):
+    """Initializes the manager.
+
+    Args:
+      http_transport: The transport fetching the metadata. If None, uses the
+        process-wide transport.
+    """
+    self._http_transport = http_transport or get_default_http_transport()
 
   async def discover_auth_server_metadata(
       self, issuer_url: str
   ) -> Optional[AuthorizationServerMetadata]:
     """Discovers the OAuth2 authorization server metadata."""
+    cached = _metadata_cache.get(AuthorizationServerMetadata, issuer_url)
+    if cached is not None:
+      return cached
+
     try:
       parsed_url = urlparse(issuer_url)
       base_url = f"{parsed_url.scheme}://{parsed_url.netloc}"
@@ -82,31 +187,37 @@ class OAuth2DiscoveryManager:
           f"{base_url}/.well-known/openid-configuration",
       ]
 
-    async with httpx.AsyncClient() as client:
-      for endpoint in endpoints_to_try:
-        try:
-          response = await client.get(endpoint, timeout=5)
-          response.raise_for_status()
-          metadata = AuthorizationServerMetadata.model_validate(response.json())
-          # Validate issuer to defend against MIX-UP attacks
-          if metadata.issuer == issuer_url.rstrip("/"):
-            return metadata
-          else:
-            logger.warning(
-                "Issuer in metadata %s does not match issuer_url %s",
-                metadata.issuer,
-                issuer_url,
-            )
-        except httpx.HTTPError as e:
-          logger.debug("Failed to fetch metadata from %s: %s", endpoint, e)
-        except (json.decoder.JSONDecodeError, ValidationError) as e:
-          logger.debug("Failed to parse metadata from %s: %s", endpoint, e)
+    for endpoint in endpoints_to_try:
+      try:
+        response = await self._http_transport.request(
+            "GET", endpoint, **_DISCOVERY_REQUEST_OPTIONS
+        )
+        response.raise_for_status()
+        metadata = AuthorizationServerMetadata.model_validate(response.json())
+        # Validate issuer to defend against MIX-UP attacks
+        if metadata.issuer == issuer_url.rstrip("/"):
+          _metadata_cache.put(issuer_url, metadata, _get_metadata_ttl(response))
+          return metadata
+        else:
+          logger.warning(
+              "Issuer in metadata %s does not match issuer_url %s",
+              metadata.issuer,
+              issuer_url,
+          )
+      except httpx.HTTPError as e:
+        logger.debug("Failed to fetch metadata from %s: %s", endpoint, e)
+      except (json.decoder.JSONDecodeError, ValidationError) as e:
+        logger.debug("Failed to parse metadata from %s: %s", endpoint, e)
     return None
 
   async def discover_resource_metadata(
       self, resource_url: str
   ) -> Optional[ProtectedResourceMetadata]:
     """Discovers the OAuth2 protected resource metadata."""
+    cached = _metadata_cache.get(ProtectedResourceMetadata, resource_url)
+    if cached is not None:
+      return cached
+
     try:
       parsed_url = urlparse(resource_url)
       base_url = f"{parsed_url.scheme}://{parsed_url.netloc}"
@@ -122,27 +233,29 @@ class OAuth2DiscoveryManager:
     else:
       well_known_endpoint = f"{base_url}/.well-known/oauth-protected-resource"
 
-    async with httpx.AsyncClient() as client:
-      try:
-        response = await client.get(well_known_endpoint, timeout=5)
-        response.raise_for_status()
-        metadata = ProtectedResourceMetadata.model_validate(response.json())
-        # Validate resource to defend against MIX-UP attacks
-        if metadata.resource == resource_url.rstrip("/"):
-          return metadata
-        else:
-          logger.warning(
-              "Resource in metadata %s does not match resource_url %s",
-              metadata.resource,
-              resource_url,
-          )
-      except httpx.HTTPError as e:
-        logger.debug(
-            "Failed to fetch metadata from %s: %s", well_known_endpoint, e
-        )
-      except (json.decoder.JSONDecodeError, ValidationError) as e:
-        logger.debug(
-            "Failed to parse metadata from %s: %s", well_known_endpoint, e
+    try:
+      response = await self._http_transport.request(
+          "GET", well_known_endpoint, **_DISCOVERY_REQUEST_OPTIONS
+      )
+      response.raise_for_status()
+      metadata = ProtectedResourceMetadata.model_validate(response.json())
+      # Validate resource to defend against MIX-UP attacks
+      if metadata.resource == resource_url.rstrip("/"):
+        _metadata_cache.put(resource_url, metadata, _get_metadata_ttl(response))
+        return metadata
+      else:
+        logger.warning(
+            "Resource in metadata %s does not match resource_url %s",
+            metadata.resource,
+            resource_url,
         )
+    except httpx.HTTPError as e:
+      logger.debug(
+          "Failed to fetch metadata from %s: %s", well_known_endpoint, e
+      )
+    except (json.decoder.JSONDecodeError, ValidationError) as e:
+      logger.debug(
+          "Failed to parse metadata from %s: %s", well_known_endpoint, e
+      )
 
     return None
@@ -0,0 +1,149 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""A process-wide cache of OAuth2 tokens."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import threading
+import time
+from typing import Any
+from typing import Awaitable
+from typing import Callable
+from typing import Mapping
+from typing import Optional
+
+from ..utils.feature_decorator import experimental
+
+logger = logging.getLogger("google_adk." + __name__)
+
+_Token = Mapping[str, Any]
+
+
+def create_token_cache_key(*parts: Any) -> str:
+  """Returns a cache key identifying a token by the given parts.
+
+  The parts are hashed, so that the secrets among them, e.g. a client secret
+  or a refresh token, don't end up in the keys of the cache or in logs.
+  """
+  digest = hashlib.sha256()
+  for part in parts:
+    digest.update(str(part).encode())
+    digest.update(b"\0")
+  return digest.hexdigest()
+
+
+@experimental
+class OAuth2TokenCache:
+  """Caches OAuth2 tokens until shortly before they expire.
+
+  Concurrent requests of the same missing token on an event loop share a
+  single fetch. Tokens without an expiry are not cached, but their concurrent
+  fetches are still shared. Expired tokens are evicted whenever a token is
+  cached.
+
+  This class is thread-safe.
+  """
+
+  def __init__(self, refresh_margin_seconds: float = 60.0):
+    """Initializes the cache.
+
+    Args:
+      refresh_margin_seconds: How long before its expiry a cached token is
+        fetched again, so that callers don't get a token expiring in flight.
+    """
+    self._refresh_margin_seconds = refresh_margin_seconds
+    self._tokens: dict[str, _Token] = {}
+    self._fetches: dict[
+        tuple[asyncio.AbstractEventLoop, str], asyncio.Task[_Token]
+    ] = {}
+    self._lock = threading.Lock()
+
+  async def get_token(
+      self, key: str, fetch_token: Callable[[], Awaitable[_Token]]
+  ) -> _Token:
+    """Returns the cached token, fetching it if missing or expiring.
+
+    Args:
+      key: Identifies the token, e.g. by its client, scope and token endpoint.
+        Created with `create_token_cache_key`.
+      fetch_token: Fetches the token. Its errors are raised to all the callers
+        waiting for the fetch, and nothing is cached.
+
+    Returns:
+      The token.
+    """
+    loop = asyncio.get_running_loop()
+    with self._lock:
+      token = self._tokens.get(key)
+      if token is not None and self._is_fresh(token):
+        return token
+      fetch = self._fetches.get((loop, key))
+      if fetch is None:
+        fetch = loop.create_task(self._fetch(loop, key, fetch_token))
+        self._fetches[(loop, key)] = fetch
+      else:
+        logger.debug("Waiting for the pending fetch of a token.")
+    # Cancelling a caller must not cancel the fetch shared with the others.
+    return await asyncio.shield(fetch)
+
+  def clear(self):
+    """Removes all the cached tokens."""
+    with self._lock:
+      self._tokens.clear()
+
+  async def _fetch(
+      self,
+      loop: asyncio.AbstractEventLoop,
+      key: str,
+      fetch_token: Callable[[], Awaitable[_Token]],
+  ) -> _Token:
+    try:
+      token = await fetch_token()
+      with self._lock:
+        self._tokens.pop(key, None)
+        # Tokens are keyed by their refresh token when refreshed, so the keys
+        # change with each rotation and the stale ones have to be evicted.
+        for stale_key in [
+            k for k, t in self._tokens.items() if not self._is_fresh(t)
+        ]:
+          del self._tokens[stale_key]
+        if self._is_fresh(token):
+          self._tokens[key] = token
+      return token
+    finally:
+      with self._lock:
+        self._fetches.pop((loop, key), None)
+
+  def _is_fresh(self, token: _Token) -> bool:
+    expires_at = token.get("expires_at")
+    if not isinstance(expires_at, (int, float)):
+      return False
+    return expires_at - self._refresh_margin_seconds > time.time()
+
+
+_default_token_cache: Optional[OAuth2TokenCache] = None
+_default_token_cache_lock = threading.Lock()
+
+
+def get_default_oauth2_token_cache() -> OAuth2TokenCache:
+  """Returns the token cache shared by the clients without their own."""
+  global _default_token_cache
+  with _default_token_cache_lock:
+    if _default_token_cache is None:
+      _default_token_cache = OAuth2TokenCache()
+    return _default_token_cache
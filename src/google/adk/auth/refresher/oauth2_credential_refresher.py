@@ -16,6 +16,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 from typing import Optional
@@ -24,6 +25,9 @@ from google.adk.auth.auth_credential import AuthCredential
 from google.adk.auth.auth_schemes import AuthScheme
 from google.adk.auth.oauth2_credential_util import create_oauth2_session
 from google.adk.auth.oauth2_credential_util import update_credential_with_tokens
+from google.adk.auth.oauth2_token_cache import create_token_cache_key
+from google.adk.auth.oauth2_token_cache import get_default_oauth2_token_cache
+from google.adk.auth.oauth2_token_cache import OAuth2TokenCache
 from google.adk.utils.feature_decorator import experimental
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
@@ -43,7 +47,20 @@ logger = logging.getLogger("google_adk." + __name__)
 
 @experimental
 class OAuth2CredentialRefresher(BaseCredentialRefresher):
-  """Refreshes OAuth2 credentials including Google OAuth2 JSON credentials."""
+  """Refreshes OAuth2 credentials including Google OAuth2 JSON credentials.
+
+  Refreshed tokens are shared through a token cache, so that concurrent
+  refreshes of the same refresh token send a single token request.
+  """
+
+  def __init__(self, token_cache: Optional[OAuth2TokenCache] = None):
+    """Initializes the refresher.
+
+    Args:
+        token_cache: The cache of the refreshed tokens. If None, uses the
+          process-wide cache.
+    """
+    self._token_cache = token_cache or get_default_oauth2_token_cache()
 
   @override
   async def is_refresh_needed(
@@ -110,10 +127,24 @@ class OAuth2CredentialRefresher(BaseCredentialRefresher):
           logger.warning("Could not create OAuth2 session for token refresh")
           return auth_credential
 
+        refresh_token = auth_credential.oauth2.refresh_token
+        cache_key = create_token_cache_key(
+            "refresh_token",
+            token_endpoint,
+            client.client_id,
+            client.client_secret,
+            refresh_token,
+        )
         try:
-          tokens = client.refresh_token(
-              url=token_endpoint,
-              refresh_token=auth_credential.oauth2.refresh_token,
+          # authlib's session is synchronous, so it is run in a thread to not
+          # block the event loop.
+          tokens = await self._token_cache.get_token(
+              cache_key,
+              lambda: asyncio.to_thread(
+                  client.refresh_token,
+                  url=token_endpoint,
+                  refresh_token=refresh_token,
+              ),
           )
           update_credential_with_tokens(auth_credential, tokens)
           logger.debug("Successfully refreshed OAuth2 tokens")
@@ -17,6 +17,7 @@ from __future__ import annotations
 import asyncio
 from contextlib import asynccontextmanager
 import importlib
+import inspect
 import json
 import logging
 import os
@@ -84,6 +85,7 @@ from ..memory.base_memory_service import BaseMemoryService
 from ..plugins.base_plugin import BasePlugin
 from ..runners import Runner
 from ..sessions.base_session_service import BaseSessionService
+from ..sessions.base_session_service import ListSessionsConfig
 from ..sessions.session import Session
 from ..utils.context_utils import Aclosing
 from .cli_eval import EVAL_SESSION_ID_PREFIX
@@ -94,6 +96,7 @@ from .utils import evals
 from .utils.base_agent_loader import BaseAgentLoader
 from .utils.shared_value import SharedValue
 from .utils.state import create_empty_state
+from .utils.trace_store import TraceStore
 
 logger = logging.getLogger("google_adk." + __name__)
 
@@ -104,9 +107,10 @@ TAG_EVALUATION = "Evaluation"
 
 
 class ApiServerSpanExporter(export_lib.SpanExporter):
+  """Records the attributes of the spans producing events, by event ID."""
 
-  def __init__(self, trace_dict):
-    self.trace_dict = trace_dict
+  def __init__(self, trace_store: TraceStore):
+    self.trace_store = trace_store
 
   def export(
       self, spans: typing.Sequence[ReadableSpan]
@@ -121,7 +125,11 @@ class ApiServerSpanExporter(export_lib.SpanExporter):
         attributes["trace_id"] = span.get_span_context().trace_id
         attributes["span_id"] = span.get_span_context().span_id
         if attributes.get("gcp.vertex.agent.event_id", None):
-          self.trace_dict[attributes["gcp.vertex.agent.event_id"]] = attributes
+          self.trace_store.add_event_attributes(
+              attributes["trace_id"],
+              attributes["gcp.vertex.agent.event_id"],
+              attributes,
+          )
     return export_lib.SpanExportResult.SUCCESS
 
   def force_flush(self, timeout_millis: int = 30000) -> bool:
@@ -129,41 +137,44 @@ class ApiServerSpanExporter(export_lib.SpanExporter):
 
 
 class InMemoryExporter(export_lib.SpanExporter):
+  """Records all the spans, grouped by the session of their trace."""
 
-  def __init__(self, trace_dict):
+  def __init__(self, trace_store: TraceStore):
     super().__init__()
-    self._spans = []
-    self.trace_dict = trace_dict
+    self.trace_store = trace_store
 
   @override
   def export(
       self, spans: typing.Sequence[ReadableSpan]
   ) -> export_lib.SpanExportResult:
     for span in spans:
-      trace_id = span.context.trace_id
+      session_id = None
       if span.name == "call_llm":
-        attributes = dict(span.attributes)
-        session_id = attributes.get("gcp.vertex.agent.session_id", None)
-        if session_id:
-          if session_id not in self.trace_dict:
-            self.trace_dict[session_id] = [trace_id]
-          else:
-            self.trace_dict[session_id] += [trace_id]
-    self._spans.extend(spans)
+        session_id = span.attributes.get("gcp.vertex.agent.session_id", None)
+      self.trace_store.add_span(
+          span.context.trace_id,
+          {
+              "name": span.name,
+              "span_id": span.context.span_id,
+              "trace_id": span.context.trace_id,
+              "start_time": span.start_time,
+              "end_time": span.end_time,
+              "attributes": dict(span.attributes),
+              "parent_span_id": span.parent.span_id if span.parent else None,
+          },
+          session_id,
+      )
     return export_lib.SpanExportResult.SUCCESS
 
   @override
   def force_flush(self, timeout_millis: int = 30000) -> bool:
     return True
 
-  def get_finished_spans(self, session_id: str):
-    trace_ids = self.trace_dict.get(session_id, None)
-    if trace_ids is None or not trace_ids:
-      return []
-    return [x for x in self._spans if x.context.trace_id in trace_ids]
+  def get_finished_spans(self, session_id: str) -> list[dict[str, Any]]:
+    return self.trace_store.get_session_spans(session_id)
 
   def clear(self):
-    self._spans.clear()
+    self.trace_store.clear()
 
 
 class RunAgentRequest(common.BaseModel):
@@ -313,6 +324,21 @@ def _otel_env_vars_enabled() -> bool:
   ])
 
 
+def _accepts_list_sessions_config(session_service: BaseSessionService) -> bool:
+  """Whether the service's `list_sessions` takes a `config` argument.
+
+  Services implemented before the argument was added don't take it.
+  """
+  try:
+    parameters = inspect.signature(session_service.list_sessions).parameters
+  except (TypeError, ValueError):
+    return False
+  return "config" in parameters or any(
+      parameter.kind == inspect.Parameter.VAR_KEYWORD
+      for parameter in parameters.values()
+  )
+
+
 def _setup_gcp_telemetry_experimental(
     internal_exporters: list[SpanProcessor] = None,
 ):
@@ -417,6 +443,7 @@ class AdkWebServer:
       extra_plugins: A list of fully qualified names of extra plugins to load.
       logo_text: Text to display in the logo of the UI.
       logo_image_url: URL of an image to display as logo of the UI.
+      trace_store: The store of the spans served by the debug trace endpoints.
       runners_to_clean: Set of runner names marked for cleanup.
       current_app_name_ref: A shared reference to the latest ran app name.
       runner_dict: A dict of instantiated runners for each app.
@@ -437,6 +464,7 @@ class AdkWebServer:
       logo_text: Optional[str] = None,
       logo_image_url: Optional[str] = None,
       url_prefix: Optional[str] = None,
+      trace_store: Optional[TraceStore] = None,
   ):
     self.agent_loader = agent_loader
     self.session_service = session_service
@@ -449,6 +477,7 @@ class AdkWebServer:
     self.extra_plugins = extra_plugins or []
     self.logo_text = logo_text
     self.logo_image_url = logo_image_url
+    self.trace_store = trace_store or TraceStore()
     # Internal properties we want to allow being modified from callbacks.
     self.runners_to_clean: set[str] = set()
     self.current_app_name_ref: SharedValue[str] = SharedValue(value="")
@@ -649,9 +678,6 @@ class AdkWebServer:
     Returns:
       A FastAPI app instance.
     """
-    # Properties we don't need to modify from callbacks
-    trace_dict = {}
-    session_trace_dict = {}
     # Set up a file system watcher to detect changes in the agents directory.
     observer = Observer()
     setup_observer(observer, self)
@@ -668,13 +694,16 @@ class AdkWebServer:
         tear_down_observer(observer, self)
         # Create tasks for all runner closures to run concurrently
         await cleanup.close_runners(list(self.runner_dict.values()))
+        self.trace_store.close()
 
-    memory_exporter = InMemoryExporter(session_trace_dict)
+    memory_exporter = InMemoryExporter(self.trace_store)
 
     _setup_telemetry(
         otel_to_cloud=otel_to_cloud,
         internal_exporters=[
-            export_lib.SimpleSpanProcessor(ApiServerSpanExporter(trace_dict)),
+            export_lib.SimpleSpanProcessor(
+                ApiServerSpanExporter(self.trace_store)
+            ),
             export_lib.SimpleSpanProcessor(memory_exporter),
         ],
     )
@@ -704,28 +733,14 @@ class AdkWebServer:
 
     @app.get("/debug/trace/{event_id}", tags=[TAG_DEBUG])
     async def get_trace_dict(event_id: str) -> Any:
-      event_dict = trace_dict.get(event_id, None)
+      event_dict = self.trace_store.get_event_attributes(event_id)
       if event_dict is None:
         raise HTTPException(status_code=404, detail="Trace not found")
       return event_dict
 
     @app.get("/debug/trace/session/{session_id}", tags=[TAG_DEBUG])
     async def get_session_trace(session_id: str) -> Any:
-      spans = memory_exporter.get_finished_spans(session_id)
-      if not spans:
-        return []
-      return [
-          {
-              "name": s.name,
-              "span_id": s.context.span_id,
-              "trace_id": s.context.trace_id,
-              "start_time": s.start_time,
-              "end_time": s.end_time,
-              "attributes": dict(s.attributes),
-              "parent_span_id": s.parent.span_id if s.parent else None,
-          }
-          for s in spans
-      ]
+      return memory_exporter.get_finished_spans(session_id)
 
     @app.get(
         "/apps/{app_name}/users/{user_id}/sessions/{session_id}",
@@ -742,13 +757,24 @@ class AdkWebServer:
       self.current_app_name_ref.value = app_name
       return session
 
+    # Inspected once rather than on every listing.
+    accepts_list_sessions_config = _accepts_list_sessions_config(
+        self.session_service
+    )
+
     @app.get(
         "/apps/{app_name}/users/{user_id}/sessions",
         response_model_exclude_none=True,
     )
     async def list_sessions(app_name: str, user_id: str) -> list[Session]:
+      kwargs = {}
+      if accepts_list_sessions_config:
+        # Let the service skip the eval sessions while listing.
+        kwargs["config"] = ListSessionsConfig(
+            exclude_id_prefixes=[EVAL_SESSION_ID_PREFIX]
+        )
       list_sessions_response = await self.session_service.list_sessions(
-          app_name=app_name, user_id=user_id
+          app_name=app_name, user_id=user_id, **kwargs
       )
       return [
           session
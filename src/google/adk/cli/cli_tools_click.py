@@ -1043,6 +1043,34 @@ def fast_api_common_options():
         ),
         multiple=True,
     )
+    @click.option(
+        "--trace_max_traces",
+        type=click.IntRange(min=1),
+        default=1000,
+        show_default=True,
+        help=(
+            "Optional. The maximum number of traces kept in memory for the"
+            " debug trace endpoints."
+        ),
+    )
+    @click.option(
+        "--trace_ttl_seconds",
+        type=click.FloatRange(min=0, min_open=True),
+        default=None,
+        help=(
+            "Optional. If set, the traces of the debug trace endpoints unused"
+            " for longer are dropped."
+        ),
+    )
+    @click.option(
+        "--trace_spill_path",
+        type=click.Path(dir_okay=False, resolve_path=True),
+        default=None,
+        help=(
+            "Optional. The path of a SQLite database receiving the traces"
+            " evicted from memory, instead of dropping them."
+        ),
+    )
     @click.option(
         "--url_prefix",
         type=str,
@@ -1105,6 +1133,9 @@ def cli_web(
     extra_plugins: Optional[list[str]] = None,
     logo_text: Optional[str] = None,
     logo_image_url: Optional[str] = None,
+    trace_max_traces: int = 1000,
+    trace_ttl_seconds: Optional[float] = None,
+    trace_spill_path: Optional[str] = None,
 ):
   """Starts a FastAPI server with Web UI for agents.
 
@@ -1160,6 +1191,9 @@ def cli_web(
       extra_plugins=extra_plugins,
       logo_text=logo_text,
       logo_image_url=logo_image_url,
+      trace_max_traces=trace_max_traces,
+      trace_ttl_seconds=trace_ttl_seconds,
+      trace_spill_path=trace_spill_path,
   )
   config = uvicorn.Config(
       app,
@@ -1204,6 +1238,9 @@ def cli_api_server(
     a2a: bool = False,
     reload_agents: bool = False,
     extra_plugins: Optional[list[str]] = None,
+    trace_max_traces: int = 1000,
+    trace_ttl_seconds: Optional[float] = None,
+    trace_spill_path: Optional[str] = None,
 ):
   """Starts a FastAPI server for agents.
 
@@ -1235,6 +1272,9 @@ def cli_api_server(
           url_prefix=url_prefix,
           reload_agents=reload_agents,
           extra_plugins=extra_plugins,
+          trace_max_traces=trace_max_traces,
+          trace_ttl_seconds=trace_ttl_seconds,
+          trace_spill_path=trace_spill_path,
       ),
       host=host,
       port=port,
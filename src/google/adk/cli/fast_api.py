@@ -46,6 +46,7 @@ from .utils import envs
 from .utils import evals
 from .utils.agent_change_handler import AgentChangeEventHandler
 from .utils.agent_loader import AgentLoader
+from .utils.trace_store import TraceStore
 
 logger = logging.getLogger("google_adk." + __name__)
 
@@ -71,6 +72,9 @@ def get_fast_api_app(
     extra_plugins: Optional[list[str]] = None,
     logo_text: Optional[str] = None,
     logo_image_url: Optional[str] = None,
+    trace_max_traces: int = 1000,
+    trace_ttl_seconds: Optional[float] = None,
+    trace_spill_path: Optional[str] = None,
 ) -> FastAPI:
   # Set up eval managers.
   if eval_storage_uri:
@@ -145,6 +149,11 @@ def get_fast_api_app(
       logo_text=logo_text,
       logo_image_url=logo_image_url,
       url_prefix=url_prefix,
+      trace_store=TraceStore(
+          max_traces=trace_max_traces,
+          ttl_seconds=trace_ttl_seconds,
+          spill_path=trace_spill_path,
+      ),
   )
 
   # Callbacks & other optional args for when constructing the FastAPI instance
@@ -172,7 +172,14 @@ def _register_builtin_services(registry: ServiceRegistry) -> None:
     return DatabaseSessionService(db_url=uri, **kwargs_copy)
 
   registry.register_session_service("agentengine", agentengine_session_factory)
-  for scheme in ["sqlite", "postgresql", "mysql"]:
+  for scheme in [
+      "sqlite",
+      "postgresql",
+      "mysql",
+      "sqlite+aiosqlite",
+      "postgresql+asyncpg",
+      "mysql+aiomysql",
+  ]:
     registry.register_session_service(scheme, database_session_factory)
 
   # -- Artifact Services --
@@ -185,7 +192,17 @@ def _register_builtin_services(registry: ServiceRegistry) -> None:
     bucket_name = parsed_uri.netloc
     return GcsArtifactService(bucket_name=bucket_name, **kwargs_copy)
 
+  def file_artifact_factory(uri: str, **kwargs):
+    from ..artifacts.file_artifact_service import FileArtifactService
+
+    parsed_uri = urlparse(uri)
+    root_dir = parsed_uri.netloc + parsed_uri.path
+    if not root_dir:
+      raise ValueError("Artifact root directory can not be empty.")
+    return FileArtifactService(root_dir=root_dir)
+
   registry.register_artifact_service("gs", gcs_artifact_factory)
+  registry.register_artifact_service("file", file_artifact_factory)
 
   # -- Memory Services --
   def rag_memory_factory(uri: str, **kwargs):
@@ -0,0 +1,269 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import collections
+import dataclasses
+import json
+import sqlite3
+import threading
+import time
+from typing import Any
+from typing import Optional
+
+_SPILL_PURGE_INTERVAL_SECONDS = 60
+
+_SPILL_SCHEMA = """
+CREATE TABLE IF NOT EXISTS spans (
+  trace_id TEXT NOT NULL,
+  span TEXT NOT NULL,
+  updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS spans_trace_id ON spans (trace_id);
+CREATE TABLE IF NOT EXISTS events (
+  event_id TEXT PRIMARY KEY,
+  attributes TEXT NOT NULL,
+  updated_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS session_traces (
+  session_id TEXT NOT NULL,
+  trace_id TEXT NOT NULL,
+  updated_at REAL NOT NULL,
+  PRIMARY KEY (session_id, trace_id)
+);
+CREATE INDEX IF NOT EXISTS session_traces_trace_id
+  ON session_traces (trace_id);
+"""
+
+
+@dataclasses.dataclass
+class _TraceRecord:
+  """The spans and debug attributes of a trace kept in memory."""
+
+  spans: list[dict[str, Any]] = dataclasses.field(default_factory=list)
+  event_attributes: dict[str, dict[str, Any]] = dataclasses.field(
+      default_factory=dict
+  )
+  session_ids: set[str] = dataclasses.field(default_factory=set)
+  last_used: float = dataclasses.field(default_factory=time.time)
+
+
+class TraceStore:
+  """A bounded store of the spans served by the web server debug endpoints.
+
+  Spans are grouped by trace, and indexed by session ID and by event ID, so
+  that lookups only touch the traces of the requested session or event. The
+  least recently used traces are evicted once there are more than
+  `max_traces`, and traces unused for `ttl_seconds` are dropped.
+
+  If `spill_path` is set, the traces evicted for capacity are written to a
+  SQLite database at that path instead of being dropped, and lookups fall back
+  to it.
+
+  This class is thread-safe, as spans are exported from the threads that end
+  them.
+  """
+
+  def __init__(
+      self,
+      *,
+      max_traces: int = 1000,
+      ttl_seconds: Optional[float] = None,
+      spill_path: Optional[str] = None,
+  ):
+    """Initializes the store.
+
+    Args:
+      max_traces: The maximum number of traces kept in memory.
+      ttl_seconds: If set, traces unused for longer are dropped, including
+        from the spill database.
+      spill_path: If set, the path of the SQLite database receiving the traces
+        evicted from memory.
+    """
+    if max_traces < 1:
+      raise ValueError("max_traces must be at least 1.")
+    self._max_traces = max_traces
+    self._ttl_seconds = ttl_seconds
+    self._lock = threading.Lock()
+    # Ordered from the least to the most recently used trace.
+    self._traces: collections.OrderedDict[int, _TraceRecord] = (
+        collections.OrderedDict()
+    )
+    self._event_trace_ids: dict[str, int] = {}
+    # Trace IDs are kept in insertion order as values of a dict.
+    self._session_trace_ids: dict[str, dict[int, None]] = {}
+    self._spill_db: Optional[sqlite3.Connection] = None
+    self._spill_purged_at = 0.0
+    if spill_path:
+      self._spill_db = sqlite3.connect(spill_path, check_same_thread=False)
+      self._spill_db.executescript(_SPILL_SCHEMA)
+
+  def add_span(
+      self, trace_id: int, span: dict[str, Any], session_id: Optional[str]
+  ) -> None:
+    """Adds a span, associating its trace with the session if given."""
+    with self._lock:
+      record = self._use_trace(trace_id)
+      record.spans.append(span)
+      if session_id and session_id not in record.session_ids:
+        record.session_ids.add(session_id)
+        self._session_trace_ids.setdefault(session_id, {})[trace_id] = None
+      self._evict_traces()
+
+  def add_event_attributes(
+      self, trace_id: int, event_id: str, attributes: dict[str, Any]
+  ) -> None:
+    """Records the attributes of the span that produced the event."""
+    with self._lock:
+      record = self._use_trace(trace_id)
+      record.event_attributes[event_id] = attributes
+      self._event_trace_ids[event_id] = trace_id
+      self._evict_traces()
+
+  def get_event_attributes(self, event_id: str) -> Optional[dict[str, Any]]:
+    """Returns the span attributes recorded for the event, if any."""
+    with self._lock:
+      self._evict_traces()
+      trace_id = self._event_trace_ids.get(event_id)
+      if trace_id is not None:
+        return self._use_trace(trace_id).event_attributes[event_id]
+      if self._spill_db is None:
+        return None
+      row = self._spill_db.execute(
+          "SELECT attributes FROM events WHERE event_id = ?", (event_id,)
+      ).fetchone()
+      return json.loads(row[0]) if row else None
+
+  def get_session_spans(self, session_id: str) -> list[dict[str, Any]]:
+    """Returns the spans of the traces of the session, oldest first."""
+    with self._lock:
+      self._evict_traces()
+      spans = []
+      if self._spill_db is not None:
+        rows = self._spill_db.execute(
+            "SELECT spans.span FROM session_traces JOIN spans"
+            " ON spans.trace_id = session_traces.trace_id"
+            " WHERE session_traces.session_id = ? ORDER BY spans.rowid",
+            (session_id,),
+        )
+        spans.extend(json.loads(row[0]) for row in rows)
+      for trace_id in self._session_trace_ids.get(session_id, {}):
+        spans.extend(self._use_trace(trace_id).spans)
+      return spans
+
+  def clear(self) -> None:
+    """Removes all the traces, including the spilled ones."""
+    with self._lock:
+      self._traces.clear()
+      self._event_trace_ids.clear()
+      self._session_trace_ids.clear()
+      if self._spill_db is not None:
+        with self._spill_db:
+          for table in ("spans", "events", "session_traces"):
+            self._spill_db.execute(f"DELETE FROM {table}")
+
+  def close(self) -> None:
+    """Closes the spill database, if any."""
+    with self._lock:
+      if self._spill_db is not None:
+        self._spill_db.close()
+        self._spill_db = None
+
+  def _use_trace(self, trace_id: int) -> _TraceRecord:
+    """Returns the record of the trace, marking it as the most recently used.
+
+    Requires the lock.
+    """
+    record = self._traces.get(trace_id)
+    if record is None:
+      record = self._traces[trace_id] = _TraceRecord()
+      if self._spill_db is not None:
+        # The trace may have been spilled before this span arrived, and the
+        # span may not carry the session ID, so the trace's sessions are
+        # restored from the spill database.
+        for (session_id,) in self._spill_db.execute(
+            "SELECT session_id FROM session_traces WHERE trace_id = ?",
+            (str(trace_id),),
+        ):
+          record.session_ids.add(session_id)
+          self._session_trace_ids.setdefault(session_id, {})[trace_id] = None
+    else:
+      self._traces.move_to_end(trace_id)
+      record.last_used = time.time()
+    return record
+
+  def _evict_traces(self) -> None:
+    """Evicts the expired and the excess traces. Requires the lock."""
+    if self._ttl_seconds is not None:
+      expiry = time.time() - self._ttl_seconds
+      while self._traces:
+        trace_id, record = next(iter(self._traces.items()))
+        if record.last_used >= expiry:
+          break
+        self._remove_trace(trace_id)
+      # Purging the spill database is rate limited, as it is a write.
+      if (
+          self._spill_db is not None
+          and expiry - self._spill_purged_at > _SPILL_PURGE_INTERVAL_SECONDS
+      ):
+        self._spill_purged_at = expiry
+        with self._spill_db:
+          for table in ("spans", "events", "session_traces"):
+            self._spill_db.execute(
+                f"DELETE FROM {table} WHERE updated_at < ?", (expiry,)
+            )
+    while len(self._traces) > self._max_traces:
+      trace_id = next(iter(self._traces))
+      record = self._remove_trace(trace_id)
+      if self._spill_db is not None:
+        self._spill_trace(trace_id, record)
+
+  def _remove_trace(self, trace_id: int) -> _TraceRecord:
+    """Removes the trace from memory and from the indexes. Requires the lock."""
+    record = self._traces.pop(trace_id)
+    for event_id in record.event_attributes:
+      if self._event_trace_ids.get(event_id) == trace_id:
+        del self._event_trace_ids[event_id]
+    for session_id in record.session_ids:
+      session_trace_ids = self._session_trace_ids[session_id]
+      del session_trace_ids[trace_id]
+      if not session_trace_ids:
+        del self._session_trace_ids[session_id]
+    return record
+
+  def _spill_trace(self, trace_id: int, record: _TraceRecord) -> None:
+    """Writes an evicted trace to the spill database. Requires the lock."""
+    key = str(trace_id)
+    with self._spill_db:
+      self._spill_db.executemany(
+          "INSERT INTO spans (trace_id, span, updated_at) VALUES (?, ?, ?)",
+          [(key, json.dumps(span), record.last_used) for span in record.spans],
+      )
+      self._spill_db.executemany(
+          "INSERT OR REPLACE INTO events (event_id, attributes, updated_at)"
+          " VALUES (?, ?, ?)",
+          [
+              (event_id, json.dumps(attributes), record.last_used)
+              for event_id, attributes in record.event_attributes.items()
+          ],
+      )
+      self._spill_db.executemany(
+          "INSERT OR REPLACE INTO session_traces"
+          " (session_id, trace_id, updated_at) VALUES (?, ?, ?)",
+          [
+              (session_id, key, record.last_used)
+              for session_id in record.session_ids
+          ],
+      )
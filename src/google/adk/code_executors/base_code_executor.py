@@ -15,7 +15,10 @@
 from __future__ import annotations
 
 import abc
+import asyncio
+import logging
 from typing import List
+from typing import Optional
 
 from pydantic import BaseModel
 
@@ -23,6 +26,8 @@ from ..agents.invocation_context import InvocationContext
 from .code_execution_utils import CodeExecutionInput
 from .code_execution_utils import CodeExecutionResult
 
+logger = logging.getLogger('google_adk.' + __name__)
+
 
 class BaseCodeExecutor(BaseModel):
   """Abstract base class for all code executors.
@@ -41,6 +46,8 @@ class BaseCodeExecutor(BaseModel):
       code blocks.
     execution_result_delimiters: The delimiters to format the code execution
       result.
+    timeout_seconds: The maximum time to wait for a single code execution in
+      `execute_code_async`. Default to None, i.e. no timeout.
   """
 
   optimize_data_file: bool = False
@@ -74,6 +81,11 @@ class BaseCodeExecutor(BaseModel):
   execution_result_delimiters: tuple[str, str] = ('```tool_output\n', '\n```')
   """The delimiters to format the code execution result."""
 
+  timeout_seconds: Optional[float] = None
+  """The maximum time to wait for a single code execution in
+  `execute_code_async`. Default to None, i.e. no timeout.
+  """
+
   @abc.abstractmethod
   def execute_code(
       self,
@@ -90,3 +102,41 @@ class BaseCodeExecutor(BaseModel):
       The code execution result.
     """
     pass
+
+  async def execute_code_async(
+      self,
+      invocation_context: InvocationContext,
+      code_execution_input: CodeExecutionInput,
+  ) -> CodeExecutionResult:
+    """Executes code without blocking the event loop.
+
+    The default implementation runs `execute_code` in a worker thread.
+    Executors with a native async client should override this method.
+
+    If the execution takes longer than `timeout_seconds`, a result with a
+    timeout error is returned. The worker thread cannot be interrupted, so the
+    code keeps running in the background until it completes.
+
+    Args:
+      invocation_context: The invocation context of the code execution.
+      code_execution_input: The code execution input.
+
+    Returns:
+      The code execution result.
+    """
+    try:
+      return await asyncio.wait_for(
+          asyncio.to_thread(
+              self.execute_code, invocation_context, code_execution_input
+          ),
+          timeout=self.timeout_seconds,
+      )
+    except asyncio.TimeoutError:
+      logger.warning(
+          'Code execution timed out after %s seconds.', self.timeout_seconds
+      )
+      return CodeExecutionResult(
+          stderr=(
+              f'Code execution timed out after {self.timeout_seconds} seconds.'
+          )
+      )
@@ -0,0 +1,442 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import subprocess
+import sys
+import threading
+import time
+from typing import Any
+from typing import Optional
+import weakref
+
+from pydantic import Field
+from pydantic import model_validator
+from pydantic import PrivateAttr
+from typing_extensions import override
+
+from ..agents.invocation_context import InvocationContext
+from .base_code_executor import BaseCodeExecutor
+from .code_execution_utils import CodeExecutionInput
+from .code_execution_utils import CodeExecutionResult
+
+logger = logging.getLogger('google_adk.' + __name__)
+
+# The worker writes a ready line once it has preloaded the modules. Then it
+# reads one JSON request per line from a private copy of its stdin and writes
+# one JSON result per line to a private copy of its stdout. The code's own
+# output is captured, anything written to file descriptor 1 goes to stderr and
+# the code's stdin is empty, so that the code cannot corrupt the protocol.
+_WORKER_SCRIPT = r"""
+import contextlib
+import io
+import json
+import os
+import sys
+
+protocol_in = os.fdopen(os.dup(0), 'r', encoding='utf-8')
+protocol_out = os.fdopen(os.dup(1), 'w', encoding='utf-8')
+devnull = os.open(os.devnull, os.O_RDONLY)
+os.dup2(devnull, 0)
+os.close(devnull)
+os.dup2(2, 1)
+for module_name in json.loads(sys.argv[1]):
+  try:
+    __import__(module_name)
+  except ImportError:
+    pass
+protocol_out.write('{"ready": true}\n')
+protocol_out.flush()
+
+session_globals = {'__name__': '__main__'}
+for line in protocol_in:
+  request = json.loads(line)
+  if request['stateful']:
+    globals_ = session_globals
+  else:
+    globals_ = {'__name__': '__main__'}
+  stdout = io.StringIO()
+  error = ''
+  try:
+    with contextlib.redirect_stdout(stdout):
+      exec(request['code'], globals_)
+  except BaseException as e:
+    error = str(e) or type(e).__name__
+  protocol_out.write(
+      json.dumps({'stdout': stdout.getvalue(), 'stderr': error}) + '\n'
+  )
+  protocol_out.flush()
+"""
+
+
+class _InterpreterWorker:
+  """A warm Python interpreter process executing code on request."""
+
+  def __init__(self, preload_modules: list[str]):
+    self.process = subprocess.Popen(
+        [sys.executable, '-c', _WORKER_SCRIPT, json.dumps(preload_modules)],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        text=True,
+        encoding='utf-8',
+    )
+    self.execution_id: Optional[str] = None
+    """The ID of the stateful execution pinned to this worker, if any."""
+    self.busy = False
+    self.last_used = time.monotonic()
+    self.ready = False
+
+  def is_alive(self) -> bool:
+    return self.process.poll() is None
+
+  def run(
+      self,
+      code: str,
+      stateful: bool,
+      timeout: Optional[float],
+      startup_timeout: Optional[float],
+  ) -> CodeExecutionResult:
+    """Runs the code, killing the worker if it exceeds the timeout.
+
+    The timeout doesn't include the startup of a new worker, so that slow
+    preloads don't time out the first execution. The startup has its own
+    timeout, so that a hanging preload doesn't block forever.
+    """
+    if not self.ready:
+      line, timed_out = self._communicate(None, startup_timeout)
+      self.ready = bool(line)
+      if timed_out:
+        return CodeExecutionResult(
+            stderr=(
+                'The interpreter process did not start within'
+                f' {startup_timeout} seconds.'
+            )
+        )
+      if not self.ready:
+        return CodeExecutionResult(
+            stderr='The interpreter process exited unexpectedly.'
+        )
+
+    line, timed_out = self._communicate(
+        json.dumps({'code': code, 'stateful': stateful}) + '\n', timeout
+    )
+    if timed_out:
+      return CodeExecutionResult(
+          stderr=f'Code execution timed out after {timeout} seconds.'
+      )
+    if not line:
+      return CodeExecutionResult(
+          stderr='The interpreter process exited unexpectedly.'
+      )
+    result = json.loads(line)
+    return CodeExecutionResult(stdout=result['stdout'], stderr=result['stderr'])
+
+  def _communicate(
+      self, request: Optional[str], timeout: Optional[float]
+  ) -> tuple[str, bool]:
+    """Sends the request if any and reads a line, killing the worker on timeout.
+
+    Returns:
+      The line read, empty if the worker died, and whether it timed out.
+    """
+    timed_out = threading.Event()
+
+    def _kill():
+      timed_out.set()
+      self.process.kill()
+
+    timer = threading.Timer(timeout, _kill) if timeout else None
+    if timer:
+      timer.start()
+    try:
+      if request is not None:
+        self.process.stdin.write(request)
+        self.process.stdin.flush()
+      line = self.process.stdout.readline()
+    except OSError:
+      line = ''
+    finally:
+      if timer:
+        timer.cancel()
+
+    if timed_out.is_set() or not line:
+      # Reap the process so that the pool sees it as dead on release.
+      self.process.kill()
+      self.process.wait()
+    return ('' if timed_out.is_set() else line), timed_out.is_set()
+
+  def close(self):
+    if self.is_alive():
+      self.process.kill()
+    self.process.wait()
+    for stream in (self.process.stdin, self.process.stdout):
+      try:
+        stream.close()
+      except OSError:
+        pass
+
+
+class LocalInterpreterPoolCodeExecutor(BaseCodeExecutor):
+  """A code executor that runs code in a pool of warm local interpreters.
+
+  Each execution runs in a long-lived Python subprocess that has already
+  imported `preload_modules`, so it doesn't pay the interpreter and import
+  startup time. Workers are started on demand, and `min_workers` of them are
+  started with the executor and kept warm. If `stateful` is set, each session
+  is pinned to a worker that keeps the globals between executions. Workers
+  idle for longer than `idle_timeout_seconds` are stopped, and their state is
+  lost.
+
+  `timeout_seconds` only bounds the execution of the code, on both the sync
+  and the async paths: neither the wait for a free worker nor the startup of a
+  new worker count towards it. The startup is bounded by
+  `startup_timeout_seconds` instead.
+
+  Like `UnsafeLocalCodeExecutor`, the code is not sandboxed: it runs on the
+  host with the permissions of the current user.
+  """
+
+  max_workers: int = Field(default=4, ge=1)
+  """The maximum number of interpreter processes."""
+
+  min_workers: int = Field(default=0, ge=0)
+  """The number of interpreter processes started with the executor and kept
+  alive even when idle, so that executions don't wait for a startup."""
+
+  startup_timeout_seconds: Optional[float] = Field(default=60.0, gt=0)
+  """How long to wait for a new interpreter process to preload the modules."""
+
+  idle_timeout_seconds: float = Field(default=300.0, gt=0)
+  """How long an unused interpreter process is kept alive."""
+
+  preload_modules: list[str] = Field(
+      default_factory=lambda: ['numpy', 'pandas']
+  )
+  """The modules imported by each interpreter on startup. Modules that are
+  not installed are skipped."""
+
+  _workers: list[_InterpreterWorker] = PrivateAttr(default_factory=list)
+  _condition: threading.Condition = PrivateAttr(
+      default_factory=threading.Condition
+  )
+  _reaper: Optional[threading.Thread] = PrivateAttr(default=None)
+  _closed: threading.Event = PrivateAttr(default_factory=threading.Event)
+
+  _finalizer: Optional[weakref.finalize] = PrivateAttr(default=None)
+
+  @model_validator(mode='after')
+  def _validate_min_workers(self) -> LocalInterpreterPoolCodeExecutor:
+    if self.min_workers > self.max_workers:
+      raise ValueError('min_workers must not be greater than max_workers.')
+    return self
+
+  def model_post_init(self, context: Any) -> None:
+    # Stop the interpreter processes when the executor is garbage collected or
+    # on exit, without keeping the executor alive.
+    self._finalizer = weakref.finalize(
+        self, _close_workers, self._workers, self._condition, self._closed
+    )
+    if self.min_workers:
+      with self._condition:
+        self._start_min_workers()
+
+  @override
+  def execute_code(
+      self,
+      invocation_context: InvocationContext,
+      code_execution_input: CodeExecutionInput,
+  ) -> CodeExecutionResult:
+    execution_id = code_execution_input.execution_id if self.stateful else None
+    worker = self._acquire_worker(execution_id)
+    try:
+      return worker.run(
+          code_execution_input.code,
+          stateful=execution_id is not None,
+          timeout=self.timeout_seconds,
+          startup_timeout=self.startup_timeout_seconds,
+      )
+    finally:
+      self._release_worker(worker)
+
+  @override
+  async def execute_code_async(
+      self,
+      invocation_context: InvocationContext,
+      code_execution_input: CodeExecutionInput,
+  ) -> CodeExecutionResult:
+    """Executes the code in a worker thread.
+
+    Unlike the default implementation, the whole call isn't bounded by
+    `timeout_seconds`: `execute_code` already times the execution alone, and
+    kills the interpreter when it times out.
+    """
+    return await asyncio.to_thread(
+        self.execute_code, invocation_context, code_execution_input
+    )
+
+  def close(self):
+    """Stops all the interpreter processes."""
+    self._finalizer()
+
+  def _acquire_worker(self, execution_id: Optional[str]) -> _InterpreterWorker:
+    """Returns a worker reserved for the execution, waiting if needed."""
+    with self._condition:
+      while True:
+        if self._closed.is_set():
+          raise RuntimeError('The code executor is closed.')
+        self._evict_workers(lambda w: not w.is_alive())
+        self._evict_idle_workers()
+        worker = self._find_worker(execution_id)
+        if worker is not None:
+          worker.busy = True
+          return worker
+        self._condition.wait()
+
+  def _find_worker(
+      self, execution_id: Optional[str]
+  ) -> Optional[_InterpreterWorker]:
+    """Finds or starts an idle worker for the execution. Requires the lock.
+
+    Returns None if the caller has to wait for a worker to be released.
+    """
+    if execution_id is not None:
+      pinned = next(
+          (w for w in self._workers if w.execution_id == execution_id), None
+      )
+      if pinned is not None:
+        # Wait for the pinned worker rather than losing the session state.
+        return None if pinned.busy else pinned
+
+    worker = next(
+        (w for w in self._workers if w.execution_id is None and not w.busy),
+        None,
+    )
+    if worker is None and len(self._workers) >= self.max_workers:
+      # Make room by dropping the state of the least recently used session.
+      lru_worker = self._least_recently_used_pinned_worker()
+      self._evict_workers(lambda w: w is lru_worker)
+    if worker is None and len(self._workers) < self.max_workers:
+      worker = self._start_worker()
+    if worker is not None:
+      worker.execution_id = execution_id
+    return worker
+
+  def _least_recently_used_pinned_worker(
+      self,
+  ) -> Optional[_InterpreterWorker]:
+    pinned_workers = [
+        w for w in self._workers if w.execution_id is not None and not w.busy
+    ]
+    return min(pinned_workers, key=lambda w: w.last_used, default=None)
+
+  def _release_worker(self, worker: _InterpreterWorker):
+    with self._condition:
+      worker.busy = False
+      worker.last_used = time.monotonic()
+      if not worker.is_alive():
+        self._evict_workers(lambda w: w is worker)
+      self._condition.notify_all()
+
+  def _start_worker(self) -> _InterpreterWorker:
+    """Starts a new unpinned worker. Requires the lock."""
+    worker = _InterpreterWorker(self.preload_modules)
+    self._workers.append(worker)
+    self._ensure_reaper_started()
+    return worker
+
+  def _start_min_workers(self):
+    """Starts workers until there are `min_workers`. Requires the lock."""
+    while len(self._workers) < self.min_workers:
+      self._start_worker()
+
+  def _evict_idle_workers(self):
+    """Stops the idle workers, keeping `min_workers` warm. Requires the lock.
+
+    Idle stateless workers are kept rather than restarted when needed to keep
+    `min_workers`, while idle pinned workers always lose their state.
+    """
+    now = time.monotonic()
+    idle_workers = [
+        w
+        for w in self._workers
+        if not w.busy and now - w.last_used > self.idle_timeout_seconds
+    ]
+    keep = max(0, self.min_workers - (len(self._workers) - len(idle_workers)))
+    kept_workers = sorted(
+        (w for w in idle_workers if w.execution_id is None),
+        key=lambda w: w.last_used,
+        reverse=True,
+    )[:keep]
+    self._evict_workers(lambda w: w in idle_workers and w not in kept_workers)
+    self._start_min_workers()
+
+  def _evict_workers(self, predicate):
+    """Stops the idle workers matching the predicate. Requires the lock."""
+    for worker in [w for w in self._workers if not w.busy and predicate(w)]:
+      if worker.execution_id is not None:
+        logger.info(
+            'Stopping the interpreter of execution %s.', worker.execution_id
+        )
+      worker.close()
+      self._workers.remove(worker)
+
+  def _ensure_reaper_started(self):
+    """Starts the thread evicting idle workers. Requires the lock."""
+    if self._reaper is not None:
+      return
+    self._reaper = threading.Thread(
+        target=_reap_idle_workers,
+        args=(weakref.ref(self), self._closed, self.idle_timeout_seconds / 2),
+        name='adk_interpreter_pool_reaper',
+        daemon=True,
+    )
+    self._reaper.start()
+
+
+def _close_workers(
+    workers: list[_InterpreterWorker],
+    condition: threading.Condition,
+    closed: threading.Event,
+):
+  """Stops the interpreter processes of an executor."""
+  closed.set()
+  with condition:
+    for worker in workers:
+      worker.close()
+    workers.clear()
+    condition.notify_all()
+
+
+def _reap_idle_workers(
+    executor_ref: weakref.ref[LocalInterpreterPoolCodeExecutor],
+    closed: threading.Event,
+    interval: float,
+):
+  """Evicts the idle workers of an executor until it is closed or collected.
+
+  Only holds a weak reference, so that the thread doesn't keep the executor
+  alive.
+  """
+  while not closed.wait(interval):
+    executor = executor_ref()
+    if executor is None:
+      return
+    with executor._condition:
+      executor._evict_workers(lambda w: not w.is_alive())
+      executor._evict_idle_workers()
+    del executor
@@ -14,10 +14,13 @@
 
 from __future__ import annotations
 
+import asyncio
 from contextlib import redirect_stdout
 import io
+import json
 import logging
 import re
+import sys
 from typing import Any
 
 from pydantic import Field
@@ -30,6 +33,36 @@ from .code_execution_utils import CodeExecutionResult
 
 logger = logging.getLogger('google_adk.' + __name__)
 
+# Runs the code read from stdin like `execute_code`, in a child interpreter.
+# The captured output and the exception, if any, are written as JSON to a
+# private copy of stdout. Anything else written to stdout or stderr, e.g.
+# warnings or logs, goes to the inherited stderr, so that it is not mistaken
+# for an execution error.
+_SUBPROCESS_SCRIPT = """
+import contextlib
+import io
+import json
+import os
+import re
+import sys
+
+result_out = os.fdopen(os.dup(1), 'w', encoding='utf-8')
+os.dup2(2, 1)
+code = sys.stdin.read()
+globals_ = {}
+if re.search(r"if\\s+__name__\\s*==\\s*['\\"]__main__['\\"]", code):
+  globals_['__name__'] = '__main__'
+stdout = io.StringIO()
+error = ''
+try:
+  with contextlib.redirect_stdout(stdout):
+    exec(code, globals_)
+except BaseException as e:
+  error = str(e)
+result_out.write(json.dumps({'stdout': stdout.getvalue(), 'stderr': error}))
+result_out.flush()
+"""
+
 
 def _prepare_globals(code: str, globals_: dict[str, Any]) -> None:
   """Prepare globals for code execution, injecting __name__ if needed."""
@@ -83,3 +116,62 @@ class UnsafeLocalCodeExecutor(BaseCodeExecutor):
         stderr=error,
         output_files=[],
     )
+
+  @override
+  async def execute_code_async(
+      self,
+      invocation_context: InvocationContext,
+      code_execution_input: CodeExecutionInput,
+  ) -> CodeExecutionResult:
+    """Executes the code in a child interpreter.
+
+    Unlike `execute_code`, the code doesn't share the process-wide stdout with
+    the other coroutines of the event loop, and is killed on timeout. In
+    exchange, each call pays the startup of a new interpreter and the imports
+    of the code, and the code doesn't share the modules nor any other state of
+    the current process, including the ones used by `execute_code`.
+
+    Like `execute_code`, only the exception raised by the code, if any, is
+    returned as `stderr`. Warnings and other output of the child interpreter
+    to its stderr go to the stderr of the current process.
+    """
+    logger.debug('Executing code:\n```\n%s\n```', code_execution_input.code)
+    process = await asyncio.create_subprocess_exec(
+        sys.executable,
+        '-c',
+        _SUBPROCESS_SCRIPT,
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+    )
+    try:
+      output, _ = await asyncio.wait_for(
+          process.communicate(code_execution_input.code.encode()),
+          timeout=self.timeout_seconds,
+      )
+    except asyncio.TimeoutError:
+      logger.warning(
+          'Code execution timed out after %s seconds.', self.timeout_seconds
+      )
+      return CodeExecutionResult(
+          stderr=(
+              f'Code execution timed out after {self.timeout_seconds} seconds.'
+          )
+      )
+    finally:
+      if process.returncode is None:
+        process.kill()
+        await process.wait()
+    try:
+      result = json.loads(output)
+    except ValueError:
+      return CodeExecutionResult(
+          stderr=(
+              'The code execution process exited unexpectedly with code'
+              f' {process.returncode}.'
+          )
+      )
+    return CodeExecutionResult(
+        stdout=result['stdout'],
+        stderr=result['stderr'],
+        output_files=[],
+    )
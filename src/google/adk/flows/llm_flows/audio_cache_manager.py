@@ -14,6 +14,8 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import logging
 import time
 from typing import TYPE_CHECKING
@@ -39,6 +41,9 @@ class AudioCacheManager:
       config: Configuration for audio caching behavior.
     """
     self.config = config or AudioCacheConfig()
+    # The flush running in the background for each cache type, if any. Also
+    # keeps the tasks alive until they complete.
+    self._flush_tasks: dict[str, asyncio.Task[None]] = {}
 
   def cache_audio(
       self,
@@ -56,14 +61,17 @@ class AudioCacheManager:
     Raises:
       ValueError: If cache_type is not 'input' or 'output'.
     """
+    cache_bytes = invocation_context._realtime_cache_bytes
     if cache_type == 'input':
       if not invocation_context.input_realtime_cache:
         invocation_context.input_realtime_cache = []
+        cache_bytes[cache_type] = 0
       cache = invocation_context.input_realtime_cache
       role = 'user'
     elif cache_type == 'output':
       if not invocation_context.output_realtime_cache:
         invocation_context.output_realtime_cache = []
+        cache_bytes[cache_type] = 0
       cache = invocation_context.output_realtime_cache
       role = 'model'
     else:
@@ -73,6 +81,9 @@ class AudioCacheManager:
         role=role, data=audio_blob, timestamp=time.time()
     )
     cache.append(audio_entry)
+    cache_bytes[cache_type] = cache_bytes.get(cache_type, 0) + len(
+        audio_blob.data
+    )
 
     logger.debug(
         'Cached %s audio chunk: %d bytes, cache size: %d',
@@ -81,6 +92,121 @@ class AudioCacheManager:
         len(cache),
     )
 
+  async def flush_caches_over_limits(
+      self, invocation_context: InvocationContext
+  ) -> None:
+    """Flush the audio caches that exceed the configured size or duration.
+
+    Turn boundaries are not the only flush points, so that long live sessions
+    don't keep all their audio in memory. The caches are emptied before they
+    are saved, and the audio of a failed save is dropped, so that the memory
+    stays bounded when the artifact service fails.
+
+    Args:
+      invocation_context: The invocation context containing audio caches.
+    """
+    await self._flush_detached_caches(
+        invocation_context, self._detach_caches_over_limits(invocation_context)
+    )
+
+  def start_flush_caches_over_limits(
+      self, invocation_context: InvocationContext
+  ) -> None:
+    """Like `flush_caches_over_limits`, but saves in the background.
+
+    The caches are emptied right away, so that callers sending realtime audio
+    aren't held up by the artifact service. At most one flush per cache type
+    runs at a time: while one is running, that cache keeps growing and is
+    flushed by the first call after the running flush completes.
+
+    Args:
+      invocation_context: The invocation context containing audio caches.
+    """
+    for cache_type in ('input', 'output'):
+      running_task = self._flush_tasks.get(cache_type)
+      if running_task and not running_task.done():
+        continue
+      caches = self._detach_caches_over_limits(
+          invocation_context, cache_types=(cache_type,)
+      )
+      if not caches:
+        continue
+      task = asyncio.create_task(
+          self._flush_detached_caches(invocation_context, caches)
+      )
+      self._flush_tasks[cache_type] = task
+      task.add_done_callback(
+          functools.partial(self._forget_flush_task, cache_type)
+      )
+
+  async def wait_for_flushes(self) -> None:
+    """Waits for the flushes started in the background to complete.
+
+    Cancelling the wait cancels the flushes, so that none outlives its caller.
+    """
+    if self._flush_tasks:
+      await asyncio.gather(*self._flush_tasks.values(), return_exceptions=True)
+
+  def cancel_flushes(self) -> None:
+    """Cancels the flushes started in the background, dropping their audio."""
+    for task in self._flush_tasks.values():
+      task.cancel()
+
+  def _forget_flush_task(self, cache_type: str, task: asyncio.Task[None]):
+    if self._flush_tasks.get(cache_type) is task:
+      del self._flush_tasks[cache_type]
+
+  def _detach_caches_over_limits(
+      self,
+      invocation_context: InvocationContext,
+      cache_types: tuple[str, ...] = ('input', 'output'),
+  ) -> list[tuple[list[RealtimeCacheEntry], str]]:
+    """Empties the caches over the limits and returns their entries."""
+    caches = []
+    if 'input' in cache_types and self._exceeds_limits(
+        invocation_context, invocation_context.input_realtime_cache, 'input'
+    ):
+      caches.append((invocation_context.input_realtime_cache, 'input_audio'))
+      invocation_context.input_realtime_cache = []
+      invocation_context._realtime_cache_bytes['input'] = 0
+    if 'output' in cache_types and self._exceeds_limits(
+        invocation_context, invocation_context.output_realtime_cache, 'output'
+    ):
+      caches.append((invocation_context.output_realtime_cache, 'output_audio'))
+      invocation_context.output_realtime_cache = []
+      invocation_context._realtime_cache_bytes['output'] = 0
+    return caches
+
+  async def _flush_detached_caches(
+      self,
+      invocation_context: InvocationContext,
+      caches: list[tuple[list[RealtimeCacheEntry], str]],
+  ) -> None:
+    for audio_cache, cache_type in caches:
+      if not await self._flush_cache_to_services(
+          invocation_context, audio_cache, cache_type
+      ):
+        logger.warning(
+            'Dropped %d bytes of %s that could not be saved.',
+            sum(len(entry.data.data or b'') for entry in audio_cache),
+            cache_type,
+        )
+
+  def _exceeds_limits(
+      self,
+      invocation_context: InvocationContext,
+      audio_cache: list[RealtimeCacheEntry] | None,
+      cache_type: str,
+  ) -> bool:
+    """Whether an audio cache exceeds the configured size or duration."""
+    if not audio_cache:
+      return False
+    cache_bytes = invocation_context._realtime_cache_bytes.get(cache_type, 0)
+    if cache_bytes >= self.config.max_cache_size_bytes:
+      return True
+    cache_duration = audio_cache[-1].timestamp - audio_cache[0].timestamp
+    return cache_duration >= self.config.max_cache_duration_seconds
+
   async def flush_caches(
       self,
       invocation_context: InvocationContext,
@@ -110,6 +236,7 @@ class AudioCacheManager:
       )
       if flush_success:
         invocation_context.input_realtime_cache = []
+        invocation_context._realtime_cache_bytes['input'] = 0
 
     if flush_model_audio and invocation_context.output_realtime_cache:
       logger.debug('Flushed output audio cache')
@@ -120,6 +247,7 @@ class AudioCacheManager:
       )
       if flush_success:
         invocation_context.output_realtime_cache = []
+        invocation_context._realtime_cache_bytes['output'] = 0
 
   async def _flush_cache_to_services(
       self,
@@ -145,13 +273,10 @@ class AudioCacheManager:
       return False
 
     try:
-      # Combine audio chunks into a single file
-      combined_audio_data = b''
+      # Combine audio chunks into a single file, copying each chunk once.
+      combined_audio_data = b''.join(entry.data.data for entry in audio_cache)
       mime_type = audio_cache[0].data.mime_type if audio_cache else 'audio/pcm'
 
-      for entry in audio_cache:
-        combined_audio_data += entry.data.data
-
       # Generate filename with timestamp from first audio chunk (when recording started)
       timestamp = int(audio_cache[0].timestamp * 1000)  # milliseconds
       filename = f"adk_live_audio_storage_{cache_type}_{timestamp}.{mime_type.split('/')[-1]}"
@@ -219,11 +344,11 @@ class AudioCacheManager:
 
     input_bytes = sum(
         len(entry.data.data)
-        for entry in (invocation_context.input_realtime_cache or [])
+        for entry in invocation_context.input_realtime_cache or []
     )
     output_bytes = sum(
         len(entry.data.data)
-        for entry in (invocation_context.output_realtime_cache or [])
+        for entry in invocation_context.output_realtime_cache or []
     )
 
     return {
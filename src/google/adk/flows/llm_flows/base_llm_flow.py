@@ -187,6 +187,9 @@ class BaseLlmFlow(ABC):
                   # cancel the tasks that belongs to the closed connection.
                   send_task.cancel()
                   return
+          except asyncio.CancelledError:
+            self.audio_cache_manager.cancel_flushes()
+            raise
           finally:
             # Clean up
             if not send_task.done():
@@ -195,6 +198,8 @@ class BaseLlmFlow(ABC):
               await send_task
             except asyncio.CancelledError:
               pass
+            # Saves the audio still being flushed, unless cancelled.
+            await self.audio_cache_manager.wait_for_flushes()
       except (ConnectionClosed, ConnectionClosedOK) as e:
         # when the session timeout, it will just close and not throw exception.
         # so this is for bad cases
@@ -260,6 +265,10 @@ class BaseLlmFlow(ABC):
         self.audio_cache_manager.cache_audio(
             invocation_context, live_request.blob, cache_type='input'
         )
+        # Saving the audio must not hold up sending it.
+        self.audio_cache_manager.start_flush_caches_over_limits(
+            invocation_context
+        )
 
         await llm_connection.send_realtime(live_request.blob)
 
@@ -339,6 +348,9 @@ class BaseLlmFlow(ABC):
                   self.audio_cache_manager.cache_audio(
                       invocation_context, audio_blob, cache_type='output'
                   )
+                  self.audio_cache_manager.start_flush_caches_over_limits(
+                      invocation_context
+                  )
 
                 yield event
         # Give opportunity for other tasks to run.
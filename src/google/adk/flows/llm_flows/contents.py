@@ -51,6 +51,7 @@ class _ContentLlmRequestProcessor(BaseLlmRequestProcessor):
           invocation_context.branch,
           invocation_context.session.events,
           agent.name,
+          _get_filtered_events_cache(invocation_context),
       )
     else:
       # Include current turn context only (no conversation history)
@@ -73,6 +74,17 @@ class _ContentLlmRequestProcessor(BaseLlmRequestProcessor):
 request_processor = _ContentLlmRequestProcessor()
 
 
+def _get_filtered_events_cache(
+    invocation_context: InvocationContext,
+) -> _FilteredEventsCache:
+  """Returns the filtered events cache of the invocation's current branch."""
+  caches = invocation_context._contents_caches
+  branch = invocation_context.branch
+  if branch not in caches:
+    caches[branch] = _FilteredEventsCache()
+  return caches[branch]
+
+
 def _rearrange_events_for_async_function_responses_in_history(
     events: list[Event],
 ) -> list[Event]:
@@ -274,8 +286,7 @@ def _process_compaction_events(events: list[Event]) -> list[Event]:
             invocation_id=event.invocation_id,
             actions=event.actions,
         )
-        # Prepend to maintain chronological order in the final list.
-        events_to_process.insert(0, new_event)
+        events_to_process.append(new_event)
         # Update the boundary for filtering. Events with timestamps greater than
         # or equal to this start time have been compacted.
         last_compaction_start_time = min(
@@ -283,33 +294,33 @@ def _process_compaction_events(events: list[Event]) -> list[Event]:
         )
     elif event.timestamp < last_compaction_start_time:
       # This event is not a compaction and is before the current compaction
-      # range. Prepend to maintain chronological order.
-      events_to_process.insert(0, event)
+      # range.
+      events_to_process.append(event)
     else:
       # skip the event
       pass
 
+  # Restore chronological order.
+  events_to_process.reverse()
   return events_to_process
 
 
-def _get_contents(
-    current_branch: Optional[str], events: list[Event], agent_name: str = ''
-) -> list[types.Content]:
-  """Get the contents for the LLM request.
+def _filter_events(
+    current_branch: Optional[str], events: list[Event]
+) -> list[Event]:
+  """Filters the events to be included in the LLM request.
 
-  Applies filtering, rearrangement, and content processing to events.
+  Drops the events annulled by a rewind, the events without content, the events
+  of other branches and the auth and request confirmation events, then applies
+  compaction.
 
   Args:
     current_branch: The current branch of the agent.
-    events: Events to process.
-    agent_name: The name of the agent.
+    events: Events to filter.
 
   Returns:
-    A list of processed contents.
+    The filtered events, in chronological order.
   """
-  accumulated_input_transcription = ''
-  accumulated_output_transcription = ''
-
   # Filter out events that are annulled by a rewind.
   # By iterating backward, when a rewind event is found, we skip all events
   # from that point back to the `rewind_before_invocation_id`, thus removing
@@ -331,29 +342,117 @@ def _get_contents(
 
   # Parse the events, leaving the contents and the function calls and
   # responses from the current agent.
-  raw_filtered_events = []
-  has_compaction_events = False
-  for event in rewind_filtered_events:
-    if _contains_empty_content(event):
-      continue
-    if not _is_event_belongs_to_branch(current_branch, event):
-      # Skip events not belong to current branch.
-      continue
-    if _is_auth_event(event):
-      # Skip auth events.
-      continue
-    if _is_request_confirmation_event(event):
-      # Skip request confirmation events.
-      continue
+  raw_filtered_events = [
+      event
+      for event in rewind_filtered_events
+      if _should_include_event(current_branch, event)
+  ]
+  if any(_is_compaction_event(event) for event in raw_filtered_events):
+    return _process_compaction_events(raw_filtered_events)
+  return raw_filtered_events
+
+
+def _should_include_event(current_branch: Optional[str], event: Event) -> bool:
+  """Whether a single event passes the per-event filters."""
+  if _contains_empty_content(event):
+    return False
+  if not _is_event_belongs_to_branch(current_branch, event):
+    # Skip events not belong to current branch.
+    return False
+  if _is_auth_event(event):
+    # Skip auth events.
+    return False
+  if _is_request_confirmation_event(event):
+    # Skip request confirmation events.
+    return False
+  return True
 
-    if event.actions and event.actions.compaction:
-      has_compaction_events = True
-    raw_filtered_events.append(event)
 
-  if has_compaction_events:
-    events_to_process = _process_compaction_events(raw_filtered_events)
+def _is_compaction_event(event: Event) -> bool:
+  return bool(event.actions and event.actions.compaction)
+
+
+class _FilteredEventsCache:
+  """Incrementally maintained result of `_filter_events` for one branch.
+
+  Session events are append-only while an invocation runs, so between two LLM
+  calls only the newly appended events need to be filtered. Rewind and
+  compaction events change which of the earlier events are kept, so appending
+  one of them, or replacing or truncating the events list, triggers a full
+  recomputation.
+
+  Only the filtering is incremental. The later stages of `_get_contents`, i.e.
+  transcription merging, function call and response rearrangement and the deep
+  copy of each content, still run over the whole filtered history on every
+  call, since the request processors that follow mutate the contents. The cache
+  is kept on the invocation context, so each invocation starts with a full
+  filtering.
+  """
+
+  def __init__(self):
+    self._events: Optional[list[Event]] = None
+    self._num_events = 0
+    self._last_event: Optional[Event] = None
+    self._filtered_events: list[Event] = []
+
+  def get(
+      self, current_branch: Optional[str], events: list[Event]
+  ) -> list[Event]:
+    """Returns the filtered events, reusing the previous result if possible."""
+    new_events = events[self._num_events :]
+    if not self._can_extend(events) or any(
+        _is_compaction_event(event)
+        or (event.actions and event.actions.rewind_before_invocation_id)
+        for event in new_events
+    ):
+      self._filtered_events = _filter_events(current_branch, events)
+    else:
+      self._filtered_events.extend(
+          event
+          for event in new_events
+          if _should_include_event(current_branch, event)
+      )
+    self._events = events
+    self._num_events = len(events)
+    self._last_event = events[-1] if events else None
+    return list(self._filtered_events)
+
+  def _can_extend(self, events: list[Event]) -> bool:
+    if events is not self._events or len(events) < self._num_events:
+      return False
+    if self._num_events == 0:
+      return True
+    return events[self._num_events - 1] is self._last_event
+
+
+def _get_contents(
+    current_branch: Optional[str],
+    events: list[Event],
+    agent_name: str = '',
+    filtered_events_cache: Optional[_FilteredEventsCache] = None,
+) -> list[types.Content]:
+  """Get the contents for the LLM request.
+
+  Applies filtering, rearrangement, and content processing to events.
+
+  Args:
+    current_branch: The current branch of the agent.
+    events: Events to process.
+    agent_name: The name of the agent.
+    filtered_events_cache: Optional cache of the filtered events, reused across
+      the LLM calls of an invocation. Only spares filtering the events that
+      were already filtered by a previous call.
+
+  Returns:
+    A list of processed contents.
+  """
+  accumulated_input_transcription = ''
+  accumulated_output_transcription = ''
+
+  if filtered_events_cache is not None:
+    events_to_process = filtered_events_cache.get(current_branch, events)
   else:
-    events_to_process = raw_filtered_events
+    events_to_process = _filter_events(current_branch, events)
 
   filtered_events = []
   # aggregate transcription events
@@ -36,6 +36,18 @@ except ImportError:
       ' warning.'
   )
 
+try:
+  from .local_vector_memory_service import LocalVectorMemoryService
+
+  __all__.append('LocalVectorMemoryService')
+except ImportError:
+  logger.debug(
+      'numpy is not installed. If you want to use the'
+      ' LocalVectorMemoryService please install it via'
+      ' "pip install google-adk[extensions]". If not, you can ignore this'
+      ' warning.'
+  )
+
 try:
   from .open_memory_service import (
       OpenMemoryService,
@@ -13,8 +13,13 @@
 # limitations under the License.
 from __future__ import annotations
 
+import collections
+import dataclasses
+import heapq
+import math
 import re
 import threading
+from typing import Optional
 from typing import TYPE_CHECKING
 
 from typing_extensions import override
@@ -28,6 +33,15 @@ if TYPE_CHECKING:
   from ..events.event import Event
   from ..sessions.session import Session
 
+_WORD_PATTERN = re.compile(r'[A-Za-z]+')
+
+# The BM25 term frequency saturation and document length normalization.
+_BM25_K1 = 1.2
+_BM25_B = 0.75
+
+# The session ID and the index of an event in the session event list.
+_EventKey = tuple[str, int]
+
 
 def _user_key(app_name: str, user_id: str):
   return f'{app_name}/{user_id}'
@@ -35,67 +49,164 @@ def _user_key(app_name: str, user_id: str):
 
 def _extract_words_lower(text: str) -> set[str]:
   """Extracts words from a string and converts them to lowercase."""
-  return set([word.lower() for word in re.findall(r'[A-Za-z]+', text)])
+  return set(_tokenize(text))
+
+
+def _tokenize(text: str) -> list[str]:
+  """Splits a string into lowercase words, keeping repetitions."""
+  return [word.lower() for word in _WORD_PATTERN.findall(text)]
+
+
+@dataclasses.dataclass
+class _InvertedIndex:
+  """The keyword index of the events of a user."""
+
+  postings: dict[str, dict[_EventKey, int]] = dataclasses.field(
+      default_factory=dict
+  )
+  """Maps each word to the events containing it and its number of
+  occurrences in each."""
+
+  event_words: dict[_EventKey, set[str]] = dataclasses.field(
+      default_factory=dict
+  )
+
+  event_lengths: dict[_EventKey, int] = dataclasses.field(default_factory=dict)
+
+  session_event_keys: dict[str, list[_EventKey]] = dataclasses.field(
+      default_factory=dict
+  )
+
+  total_length: int = 0
+  """The total number of words of the indexed events."""
+
+  def add_event(self, event_key: _EventKey, words: list[str]):
+    word_counts = collections.Counter(words)
+    self.event_words[event_key] = set(word_counts)
+    self.event_lengths[event_key] = len(words)
+    self.session_event_keys.setdefault(event_key[0], []).append(event_key)
+    self.total_length += len(words)
+    for word, count in word_counts.items():
+      self.postings.setdefault(word, {})[event_key] = count
+
+  def remove_session(self, session_id: str):
+    for event_key in self.session_event_keys.pop(session_id, []):
+      self.total_length -= self.event_lengths.pop(event_key)
+      for word in self.event_words.pop(event_key):
+        word_postings = self.postings[word]
+        del word_postings[event_key]
+        if not word_postings:
+          del self.postings[word]
+
+  def search(self, words: set[str], limit: Optional[int]) -> list[_EventKey]:
+    """Returns the events matching any of the words, best BM25 score first."""
+    event_count = len(self.event_lengths)
+    if not event_count:
+      return []
+    average_length = self.total_length / event_count
+    scores: dict[_EventKey, float] = collections.defaultdict(float)
+    for word in words:
+      word_postings = self.postings.get(word)
+      if not word_postings:
+        continue
+      idf = math.log(
+          1
+          + (event_count - len(word_postings) + 0.5)
+          / (len(word_postings) + 0.5)
+      )
+      for event_key, count in word_postings.items():
+        length = self.event_lengths[event_key]
+        scores[event_key] += (
+            idf
+            * count
+            * (_BM25_K1 + 1)
+            / (
+                count
+                + _BM25_K1 * (1 - _BM25_B + _BM25_B * length / average_length)
+            )
+        )
+    if limit is None:
+      return sorted(scores, key=scores.__getitem__, reverse=True)
+    return heapq.nlargest(limit, scores, key=scores.__getitem__)
 
 
 class InMemoryMemoryService(BaseMemoryService):
   """An in-memory memory service for prototyping purpose only.
 
-  Uses keyword matching instead of semantic search.
+  Uses keyword matching instead of semantic search. The events are indexed by
+  word when a session is added, and the events matching any word of a query are
+  ranked with BM25.
 
   This class is thread-safe, however, it should be used for testing and
   development only.
   """
 
-  def __init__(self):
+  def __init__(self, max_results: Optional[int] = None):
+    """Initializes the memory service.
+
+    Args:
+      max_results: The maximum number of memories returned by a search. All
+        the matching memories are returned if not set.
+    """
     self._lock = threading.Lock()
+    self._max_results = max_results
 
     self._session_events: dict[str, dict[str, list[Event]]] = {}
     """Keys are "{app_name}/{user_id}". Values are dicts of session_id to
     session event lists.
     """
 
+    self._indexes: dict[str, _InvertedIndex] = {}
+    """Keys are "{app_name}/{user_id}"."""
+
   @override
   async def add_session_to_memory(self, session: Session):
     user_key = _user_key(session.app_name, session.user_id)
+    events = [
+        event
+        for event in session.events
+        if event.content and event.content.parts
+    ]
+    # Tokenize outside of the lock.
+    event_words = [
+        _tokenize(
+            ' '.join(part.text for part in event.content.parts if part.text)
+        )
+        for event in events
+    ]
 
     with self._lock:
       self._session_events[user_key] = self._session_events.get(user_key, {})
-      self._session_events[user_key][session.id] = [
-          event
-          for event in session.events
-          if event.content and event.content.parts
-      ]
+      self._session_events[user_key][session.id] = events
+      index = self._indexes.setdefault(user_key, _InvertedIndex())
+      # Re-adding a session replaces its previously indexed events.
+      index.remove_session(session.id)
+      for i, words in enumerate(event_words):
+        if words:
+          index.add_event((session.id, i), words)
 
   @override
   async def search_memory(
       self, *, app_name: str, user_id: str, query: str
   ) -> SearchMemoryResponse:
     user_key = _user_key(app_name, user_id)
+    words_in_query = _extract_words_lower(query)
 
     with self._lock:
-      session_event_lists = self._session_events.get(user_key, {})
-
-    words_in_query = _extract_words_lower(query)
-    response = SearchMemoryResponse()
-
-    for session_events in session_event_lists.values():
-      for event in session_events:
-        if not event.content or not event.content.parts:
-          continue
-        words_in_event = _extract_words_lower(
-            ' '.join([part.text for part in event.content.parts if part.text])
-        )
-        if not words_in_event:
-          continue
-
-        if any(query_word in words_in_event for query_word in words_in_query):
-          response.memories.append(
-              MemoryEntry(
-                  content=event.content,
-                  author=event.author,
-                  timestamp=_utils.format_timestamp(event.timestamp),
-              )
-          )
-
-    return response
+      index = self._indexes.get(user_key)
+      if index is None:
+        return SearchMemoryResponse()
+      event_keys = index.search(words_in_query, self._max_results)
+      session_events = self._session_events[user_key]
+      events = [session_events[session_id][i] for session_id, i in event_keys]
+
+    return SearchMemoryResponse(
+        memories=[
+            MemoryEntry(
+                content=event.content,
+                author=event.author,
+                timestamp=_utils.format_timestamp(event.timestamp),
+            )
+            for event in events
+        ]
+    )
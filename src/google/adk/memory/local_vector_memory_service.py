@@ -0,0 +1,405 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import json
+import logging
+import os
+import threading
+from typing import Any
+from typing import Awaitable
+from typing import Callable
+from typing import Optional
+from typing import Sequence
+from typing import TYPE_CHECKING
+
+from typing_extensions import override
+
+from . import _utils
+from .base_memory_service import BaseMemoryService
+from .base_memory_service import SearchMemoryResponse
+from .memory_entry import MemoryEntry
+
+try:
+  import numpy as np
+except ImportError as e:
+  raise ImportError(
+      'LocalVectorMemoryService requires numpy. '
+      'Please install with: pip install "google-adk[extensions]"'
+  ) from e
+
+if TYPE_CHECKING:
+  from ..sessions.session import Session
+
+logger = logging.getLogger('google_adk.' + __name__)
+
+EmbeddingFunction = Callable[[list[str]], Awaitable[Sequence[Sequence[float]]]]
+"""An async function returning the embedding of each of the given texts."""
+
+_VECTORS_FILE_NAME = 'vectors.npy'
+_ENTRIES_FILE_NAME = 'entries.jsonl'
+_INITIAL_CAPACITY = 64
+
+
+def _user_key(app_name: str, user_id: str):
+  return f'{app_name}/{user_id}'
+
+
+@dataclasses.dataclass
+class _Row:
+  """The memory stored in a row of the vector matrix."""
+
+  user_key: str
+  session_id: str
+  event_id: str
+  memory: MemoryEntry
+
+
+class LocalVectorMemoryService(BaseMemoryService):
+  """A memory service doing semantic search over locally stored embeddings.
+
+  The text of each event of the added sessions is embedded with
+  `embedding_function`, and a search returns the memories of the user whose
+  embeddings are the closest to the query embedding by cosine similarity. The
+  embeddings are rows of a single NumPy matrix and are searched exhaustively,
+  which only takes a few milliseconds for up to hundreds of thousands of
+  memories, without any network round trip besides embedding the query.
+
+  When a session is added again, only its new events are embedded, and the
+  memories of the events no longer in the session are removed.
+
+  If `persist_directory` is set, the matrix is a memory-mapped file in that
+  directory, next to a log of the memory entries, and the memories are
+  reloaded from there on startup.
+
+  This class is thread-safe.
+
+  Example:
+      ```python
+      from google import genai
+      from google.adk.memory import LocalVectorMemoryService
+
+      client = genai.Client()
+
+      async def embed(texts: list[str]) -> list[list[float]]:
+        response = await client.aio.models.embed_content(
+            model='text-embedding-004', contents=texts
+        )
+        return [embedding.values for embedding in response.embeddings]
+
+      memory_service = LocalVectorMemoryService(
+          embed, persist_directory='/tmp/adk_memory'
+      )
+      ```
+  """
+
+  def __init__(
+      self,
+      embedding_function: EmbeddingFunction,
+      *,
+      persist_directory: Optional[str] = None,
+      top_k: int = 10,
+      embedding_batch_size: int = 100,
+  ):
+    """Initializes the memory service.
+
+    Args:
+      embedding_function: The async function embedding a batch of texts.
+      persist_directory: If set, the directory where the memories are stored.
+      top_k: The maximum number of memories returned by a search.
+      embedding_batch_size: The maximum number of texts passed to each call of
+        `embedding_function`.
+    """
+    if top_k < 1:
+      raise ValueError('top_k must be at least 1.')
+    if embedding_batch_size < 1:
+      raise ValueError('embedding_batch_size must be at least 1.')
+    self._embedding_function = embedding_function
+    self._persist_directory = persist_directory
+    self._top_k = top_k
+    self._embedding_batch_size = embedding_batch_size
+    self._lock = threading.Lock()
+
+    self._vectors: Optional[np.ndarray] = None
+    """The normalized embeddings, one row per memory. The matrix has spare
+    rows, so its length is its capacity rather than the number of memories."""
+
+    self._rows: list[Optional[_Row]] = []
+    """The memory of each used row of the matrix, or None if the row is free."""
+
+    self._free_rows: list[int] = []
+
+    self._session_rows: dict[tuple[str, str], dict[str, int]] = {}
+    """Maps the user key and the session ID to the row of each event."""
+
+    self._user_rows: dict[str, set[int]] = {}
+    """Maps each user key to the rows of the user memories."""
+
+    self._user_row_arrays: dict[str, np.ndarray] = {}
+    """The rows of each user as a sorted array, computed on search."""
+
+    if persist_directory:
+      os.makedirs(persist_directory, exist_ok=True)
+      self._load()
+
+  @override
+  async def add_session_to_memory(self, session: Session):
+    user_key = _user_key(session.app_name, session.user_id)
+    session_key = (user_key, session.id)
+    event_texts = {}
+    events = {}
+    for event in session.events:
+      if not event.content or not event.content.parts:
+        continue
+      text = ' '.join(part.text for part in event.content.parts if part.text)
+      if text.strip():
+        event_texts[event.id] = text
+        events[event.id] = event
+
+    with self._lock:
+      indexed_rows = self._session_rows.get(session_key, {})
+      new_event_ids = [
+          event_id for event_id in event_texts if event_id not in indexed_rows
+      ]
+      removed_event_ids = [
+          event_id for event_id in indexed_rows if event_id not in event_texts
+      ]
+
+    # Embed the new events outside of the lock.
+    vectors = await self._embed(
+        [event_texts[event_id] for event_id in new_event_ids]
+    )
+
+    with self._lock:
+      records = []
+      session_rows = self._session_rows.setdefault(session_key, {})
+      for event_id in removed_event_ids:
+        row = session_rows.get(event_id)
+        if row is not None:
+          self._free_row(row)
+          records.append({'row': row})
+      for event_id, vector in zip(new_event_ids, vectors):
+        if event_id in session_rows:
+          # The event was indexed by a concurrent call.
+          continue
+        event = events[event_id]
+        memory = MemoryEntry(
+            content=event.content,
+            author=event.author,
+            timestamp=_utils.format_timestamp(event.timestamp),
+        )
+        row = self._set_row(
+            _Row(user_key, session.id, event_id, memory), vector
+        )
+        records.append(self._row_record(row))
+      if not session_rows:
+        del self._session_rows[session_key]
+      self._persist(records)
+
+  @override
+  async def search_memory(
+      self, *, app_name: str, user_id: str, query: str
+  ) -> SearchMemoryResponse:
+    user_key = _user_key(app_name, user_id)
+    with self._lock:
+      if not self._user_rows.get(user_key):
+        return SearchMemoryResponse()
+
+    query_vector = (await self._embed([query]))[0]
+
+    with self._lock:
+      rows = self._user_row_arrays.get(user_key)
+      if rows is None:
+        rows = np.fromiter(
+            sorted(self._user_rows.get(user_key, ())), dtype=np.intp
+        )
+        self._user_row_arrays[user_key] = rows
+      if not rows.size:
+        return SearchMemoryResponse()
+      self._check_dimension(query_vector)
+      scores = self._vectors[rows] @ query_vector
+      count = min(self._top_k, rows.size)
+      best = np.argpartition(-scores, count - 1)[:count]
+      best = best[np.argsort(-scores[best])]
+      memories = [self._rows[rows[i]].memory.model_copy() for i in best]
+
+    return SearchMemoryResponse(memories=memories)
+
+  async def _embed(self, texts: list[str]) -> np.ndarray:
+    """Returns the normalized embeddings of the texts, one per row."""
+    if not texts:
+      return np.zeros((0, 0), dtype=np.float32)
+    batches = [
+        texts[i : i + self._embedding_batch_size]
+        for i in range(0, len(texts), self._embedding_batch_size)
+    ]
+    results = await asyncio.gather(
+        *(self._embedding_function(batch) for batch in batches)
+    )
+    embeddings = [embedding for result in results for embedding in result]
+    if len(embeddings) != len(texts):
+      raise ValueError(
+          f'The embedding function returned {len(embeddings)} embeddings for'
+          f' {len(texts)} texts.'
+      )
+    vectors = np.asarray(embeddings, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1
+    return vectors / norms
+
+  def _check_dimension(self, vector: np.ndarray):
+    if self._vectors is not None and vector.shape[0] != self._vectors.shape[1]:
+      raise ValueError(
+          f'Expected embeddings of dimension {self._vectors.shape[1]}, got'
+          f' {vector.shape[0]}.'
+      )
+
+  def _set_row(self, row_data: _Row, vector: np.ndarray) -> int:
+    """Stores the memory in a free row of the matrix. Requires the lock."""
+    if self._vectors is None:
+      self._resize(_INITIAL_CAPACITY, vector.shape[0])
+    self._check_dimension(vector)
+    if self._free_rows:
+      row = self._free_rows.pop()
+    else:
+      row = len(self._rows)
+      self._rows.append(None)
+      if row >= len(self._vectors):
+        self._resize(2 * len(self._vectors), self._vectors.shape[1])
+    self._vectors[row] = vector
+    self._index_row(row, row_data)
+    return row
+
+  def _index_row(self, row: int, row_data: _Row):
+    """Adds the memory of the row to the indexes. Requires the lock."""
+    self._rows[row] = row_data
+    self._session_rows.setdefault((row_data.user_key, row_data.session_id), {})[
+        row_data.event_id
+    ] = row
+    self._user_rows.setdefault(row_data.user_key, set()).add(row)
+    self._user_row_arrays.pop(row_data.user_key, None)
+
+  def _free_row(self, row: int):
+    """Removes the memory of the row from the indexes. Requires the lock."""
+    row_data = self._rows[row]
+    self._rows[row] = None
+    self._free_rows.append(row)
+    session_key = (row_data.user_key, row_data.session_id)
+    del self._session_rows[session_key][row_data.event_id]
+    user_rows = self._user_rows[row_data.user_key]
+    user_rows.discard(row)
+    if not user_rows:
+      del self._user_rows[row_data.user_key]
+    self._user_row_arrays.pop(row_data.user_key, None)
+
+  def _resize(self, capacity: int, dimension: int):
+    """Moves the embeddings to a matrix of the capacity. Requires the lock."""
+    old_vectors = self._vectors
+    if self._persist_directory is None:
+      vectors = np.zeros((capacity, dimension), dtype=np.float32)
+    else:
+      temp_path = self._vectors_path + '.tmp'
+      vectors = np.lib.format.open_memmap(
+          temp_path, mode='w+', dtype=np.float32, shape=(capacity, dimension)
+      )
+    if old_vectors is not None:
+      vectors[: len(old_vectors)] = old_vectors
+    self._vectors = vectors
+    if self._persist_directory is not None:
+      # Release the old mapping before replacing its file.
+      del old_vectors
+      vectors.flush()
+      os.replace(temp_path, self._vectors_path)
+
+  @property
+  def _vectors_path(self) -> str:
+    return os.path.join(self._persist_directory, _VECTORS_FILE_NAME)
+
+  @property
+  def _entries_path(self) -> str:
+    return os.path.join(self._persist_directory, _ENTRIES_FILE_NAME)
+
+  def _row_record(self, row: int) -> dict[str, Any]:
+    row_data = self._rows[row]
+    return {
+        'row': row,
+        'user_key': row_data.user_key,
+        'session_id': row_data.session_id,
+        'event_id': row_data.event_id,
+        'memory': row_data.memory.model_dump(mode='json', exclude_none=True),
+    }
+
+  def _persist(self, records: list[dict[str, Any]]):
+    """Appends the row changes to the entries log. Requires the lock.
+
+    A record without a memory frees its row. The embeddings are flushed first,
+    so that the log never refers to embeddings that are not on disk.
+    """
+    if self._persist_directory is None or not records:
+      return
+    if isinstance(self._vectors, np.memmap):
+      self._vectors.flush()
+    with open(self._entries_path, 'a', encoding='utf-8') as f:
+      for record in records:
+        f.write(json.dumps(record) + '\n')
+
+  def _load(self):
+    """Loads the persisted memories and compacts the entries log."""
+    if os.path.exists(self._vectors_path):
+      self._vectors = np.load(self._vectors_path, mmap_mode='r+')
+    rows: dict[int, _Row] = {}
+    if os.path.exists(self._entries_path):
+      with open(self._entries_path, encoding='utf-8') as f:
+        for line in f:
+          try:
+            record = json.loads(line)
+          except json.JSONDecodeError:
+            logger.warning(
+                'Ignoring the truncated end of %s.', self._entries_path
+            )
+            break
+          if 'memory' not in record:
+            rows.pop(record['row'], None)
+            continue
+          rows[record['row']] = _Row(
+              user_key=record['user_key'],
+              session_id=record['session_id'],
+              event_id=record['event_id'],
+              memory=MemoryEntry.model_validate(record['memory']),
+          )
+
+    size = max(rows, default=-1) + 1
+    capacity = 0 if self._vectors is None else len(self._vectors)
+    if size > capacity:
+      logger.warning(
+          'Ignoring the memories without embeddings in %s.',
+          self._persist_directory,
+      )
+      size = capacity
+    self._rows = [rows.get(row) for row in range(size)]
+    for row, row_data in enumerate(self._rows):
+      if row_data is None:
+        self._free_rows.append(row)
+      else:
+        self._index_row(row, row_data)
+    # Only the latest version of each row is kept.
+    temp_path = self._entries_path + '.tmp'
+    with open(temp_path, 'w', encoding='utf-8') as f:
+      for row, row_data in enumerate(self._rows):
+        if row_data is not None:
+          f.write(json.dumps(self._row_record(row)) + '\n')
+    os.replace(temp_path, self._entries_path)
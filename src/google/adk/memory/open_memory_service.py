@@ -25,6 +25,8 @@ from pydantic import BaseModel
 from pydantic import Field
 from typing_extensions import override
 
+from ..utils.http_transport import get_default_http_transport
+from ..utils.http_transport import HttpTransport
 from . import _utils
 from .base_memory_service import BaseMemoryService
 from .base_memory_service import SearchMemoryResponse
@@ -76,6 +78,7 @@ class OpenMemoryService(BaseMemoryService):
       base_url: str = "http://localhost:3000",
       api_key: Optional[str] = None,
       config: Optional[OpenMemoryServiceConfig] = None,
+      http_transport: Optional[HttpTransport] = None,
   ):
     """Initializes the OpenMemory service.
 
@@ -84,10 +87,14 @@ class OpenMemoryService(BaseMemoryService):
         api_key: API key for authentication (optional, only if server requires).
         config: OpenMemoryServiceConfig instance for customizing behavior. If
             None, uses default configuration.
+        http_transport: The transport sending the requests. If None, uses the
+            process-wide transport, so that connections are pooled across
+            services.
     """
     self._base_url = base_url.rstrip('/')
     self._api_key = api_key
     self._config = config or OpenMemoryServiceConfig()
+    self._http_transport = http_transport or get_default_http_transport()
 
   def _determine_salience(self, author: Optional[str]) -> float:
     """Determine salience value based on content author.
@@ -185,54 +192,54 @@ class OpenMemoryService(BaseMemoryService):
     """
     memories_added = 0
 
-    # Create HTTP client once for all events to improve performance
-    async with httpx.AsyncClient(timeout=self._config.timeout) as http_client:
-      headers = {"Content-Type": "application/json"}
-      if self._api_key:
-        headers["Authorization"] = f"Bearer {self._api_key}"
+    headers = {"Content-Type": "application/json"}
+    if self._api_key:
+      headers["Authorization"] = f"Bearer {self._api_key}"
+
+    for event in session.events:
+      content_text = _extract_text_from_event(event)
+      if not content_text:
+        continue
 
-      for event in session.events:
-        content_text = _extract_text_from_event(event)
-        if not content_text:
-          continue
-
-        memory_data = self._prepare_memory_data(event, content_text, session)
-
-        try:
-          # Use direct HTTP to pass user_id as top-level field 
-          # This ensures server-side filtering works correctly
-          
-          # Include user_id as separate field for database storage and filtering
-          payload = {
-              "content": memory_data["content"],
-              "tags": memory_data.get("tags", []),
-              "metadata": memory_data.get("metadata", {}),
-              "salience": memory_data.get("salience", 0.5),
-              "user_id": session.user_id  # Separate field for DB column
-          }
-          
-          response = await http_client.post(
-              f"{self._base_url}/memory/add",
-              json=payload,
-              headers=headers
-          )
-          response.raise_for_status()
-          
-          memories_added += 1
-          logger.debug("Added memory for event %s", event.id)
-        except httpx.HTTPStatusError as e:
-          logger.error(
-              "Failed to add memory for event %s due to HTTP error: %s - %s",
-              event.id,
-              e.response.status_code,
-              e.response.text,
-          )
-        except httpx.RequestError as e:
-          logger.error(
-              "Failed to add memory for event %s due to request error: %s", event.id, e
-          )
-        except Exception as e:
-          logger.error("Failed to add memory for event %s due to unexpected error: %s", event.id, e)
+      memory_data = self._prepare_memory_data(event, content_text, session)
+
+      try:
+        # Use direct HTTP to pass user_id as top-level field 
+        # This ensures server-side filtering works correctly
+        
+        # Include user_id as separate field for database storage and filtering
+        payload = {
+            "content": memory_data["content"],
+            "tags": memory_data.get("tags", []),
+            "metadata": memory_data.get("metadata", {}),
+            "salience": memory_data.get("salience", 0.5),
+            "user_id": session.user_id  # Separate field for DB column
+        }
+        
+        response = await self._http_transport.request(
+            "POST",
+            f"{self._base_url}/memory/add",
+            json=payload,
+            headers=headers,
+            timeout=self._config.timeout,
+        )
+        response.raise_for_status()
+        
+        memories_added += 1
+        logger.debug("Added memory for event %s", event.id)
+      except httpx.HTTPStatusError as e:
+        logger.error(
+            "Failed to add memory for event %s due to HTTP error: %s - %s",
+            event.id,
+            e.response.status_code,
+            e.response.text,
+        )
+      except httpx.RequestError as e:
+        logger.error(
+            "Failed to add memory for event %s due to request error: %s", event.id, e
+        )
+      except Exception as e:
+        logger.error("Failed to add memory for event %s due to unexpected error: %s", event.id, e)
 
     logger.info(
         "Added %d memories from session %s", memories_added, session.id
@@ -335,33 +342,34 @@ class OpenMemoryService(BaseMemoryService):
       # Use direct HTTP call for query since SDK v0.2.0 filters don't work properly
       # The SDK doesn't correctly pass filter parameters to the backend
       memories = []
+
+      # Query for matching memories
+      headers = {"Content-Type": "application/json"}
+      if self._api_key:
+        headers["Authorization"] = f"Bearer {self._api_key}"
       
-      async with httpx.AsyncClient(timeout=self._config.timeout) as http_client:
-        # Query for matching memories
-        headers = {"Content-Type": "application/json"}
-        if self._api_key:
-          headers["Authorization"] = f"Bearer {self._api_key}"
-        
-        # Debug: Log the exact payload being sent
-        logger.debug("Query payload: %s", search_payload)
-        
-        response = await http_client.post(
-            f"{self._base_url}/memory/query",
-            json=search_payload,
-            headers=headers
-        )
-        response.raise_for_status()
-        result = response.json()
-        
-        # Debug: Log response summary
-        logger.debug("Query returned %d matches", len(result.get("matches", [])))
-        
-        # Backend returns 'matches' with content already including author/timestamp
-        # No need for additional API calls - parse from enriched content format
-        for match in result.get("matches", []):
-          memory_entry = self._convert_to_memory_entry(match)
-          if memory_entry:
-            memories.append(memory_entry)
+      # Debug: Log the exact payload being sent
+      logger.debug("Query payload: %s", search_payload)
+      
+      response = await self._http_transport.request(
+          "POST",
+          f"{self._base_url}/memory/query",
+          json=search_payload,
+          headers=headers,
+          timeout=self._config.timeout,
+      )
+      response.raise_for_status()
+      result = response.json()
+      
+      # Debug: Log response summary
+      logger.debug("Query returned %d matches", len(result.get("matches", [])))
+      
+      # Backend returns 'matches' with content already including author/timestamp
+      # No need for additional API calls - parse from enriched content format
+      for match in result.get("matches", []):
+        memory_entry = self._convert_to_memory_entry(match)
+        if memory_entry:
+          memories.append(memory_entry)
 
       logger.info("Found %d memories for query: '%s'", len(memories), query)
       return SearchMemoryResponse(memories=memories)
@@ -383,9 +391,9 @@ class OpenMemoryService(BaseMemoryService):
   async def close(self):
     """Close the memory service and cleanup resources.
     
-    This method is provided for API consistency. Since httpx.AsyncClient
-    is used as a context manager in all operations, cleanup is handled
-    automatically. This method is a no-op and can be safely called or omitted.
+    This method is provided for API consistency. The HTTP transport may be
+    shared with other services, so its connections are not closed here. This
+    method is a no-op and can be safely called or omitted.
     """
     pass
 
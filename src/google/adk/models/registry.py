@@ -19,6 +19,7 @@ from __future__ import annotations
 from functools import lru_cache
 import logging
 import re
+import threading
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -34,6 +35,19 @@ Key is the regex that matches the model name.
 Value is the class that implements the model.
 """
 
+_compiled_regex_dict: dict[str, re.Pattern[str]] = {}
+"""The compiled regexes of `_llm_registry_dict`, keyed by the regex."""
+
+_shared_llm_instances: dict[str, BaseLlm] = {}
+"""Shared LLM instances, keyed by the model name.
+
+Only used when instance sharing is enabled, see
+`LLMRegistry.set_instance_sharing`.
+"""
+
+_share_instances = False
+_shared_llm_instances_lock = threading.Lock()
+
 
 class LLMRegistry:
   """Registry for LLMs."""
@@ -49,7 +63,33 @@ class LLMRegistry:
         The LLM instance.
     """
 
-    return LLMRegistry.resolve(model)(model=model)
+    if not _share_instances:
+      return LLMRegistry.resolve(model)(model=model)
+
+    with _shared_llm_instances_lock:
+      llm = _shared_llm_instances.get(model)
+      if llm is None:
+        llm = LLMRegistry.resolve(model)(model=model)
+        _shared_llm_instances[model] = llm
+      return llm
+
+  @staticmethod
+  def set_instance_sharing(enabled: bool) -> None:
+    """Enables or disables sharing of LLM instances across agents.
+
+    When enabled, `new_llm` returns one shared instance per model name, so
+    agents that use the same model string share one model client and its
+    HTTP connection pool. The shared instances must only be used from one
+    event loop, as some model clients are bound to the loop they were first
+    used on.
+
+    Args:
+        enabled: Whether to share LLM instances.
+    """
+    global _share_instances
+    with _shared_llm_instances_lock:
+      _share_instances = enabled
+      _shared_llm_instances.clear()
 
   @staticmethod
   def _register(model_name_regex: str, llm_cls: type[BaseLlm]):
@@ -69,6 +109,11 @@ class LLMRegistry:
       )
 
     _llm_registry_dict[model_name_regex] = llm_cls
+    _compiled_regex_dict[model_name_regex] = re.compile(model_name_regex)
+    # Previously resolved model names may now resolve to the new class.
+    LLMRegistry.resolve.cache_clear()
+    with _shared_llm_instances_lock:
+      _shared_llm_instances.clear()
 
   @staticmethod
   def register(llm_cls: type[BaseLlm]):
@@ -82,7 +127,7 @@ class LLMRegistry:
       LLMRegistry._register(regex, llm_cls)
 
   @staticmethod
-  @lru_cache(maxsize=32)
+  @lru_cache(maxsize=256)
   def resolve(model: str) -> type[BaseLlm]:
     """Resolves the model to a BaseLlm subclass.
 
@@ -96,7 +141,7 @@ class LLMRegistry:
     """
 
     for regex, llm_class in _llm_registry_dict.items():
-      if re.compile(regex).fullmatch(model):
+      if _compiled_regex_dict[regex].fullmatch(model):
         return llm_class
 
     raise ValueError(f'Model {model} not found.')
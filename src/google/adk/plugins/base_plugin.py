@@ -16,6 +16,7 @@ from __future__ import annotations
 
 from abc import ABC
 from typing import Any
+from typing import ClassVar
 from typing import Optional
 from typing import TYPE_CHECKING
 from typing import TypeVar
@@ -100,8 +101,36 @@ class BasePlugin(ABC):
       >>> #     ...
       >>> #     plugins=[ToolLoggerPlugin(), AgentPolicyPlugin()],
       >>> # )
+
+  **Observe-only Callbacks**
+  Callbacks listed in `observe_only_callbacks` declare that they never return a
+  value nor modify their inputs, e.g. for logging or analytics. They are not
+  part of the ordered chain above: they run concurrently with each other after
+  the intercepting callbacks of all plugins have run, and they run even when an
+  intercepting callback short circuits the chain. Observers therefore see the
+  inputs as modified by the intercepting callbacks, e.g. a request rewritten by
+  a `before_model_callback`, whatever the order the plugins were registered in.
   """
 
+  ALL_CALLBACKS: ClassVar[frozenset[str]] = frozenset({
+      "on_user_message_callback",
+      "before_run_callback",
+      "after_run_callback",
+      "on_event_callback",
+      "before_agent_callback",
+      "after_agent_callback",
+      "before_tool_callback",
+      "after_tool_callback",
+      "before_model_callback",
+      "after_model_callback",
+      "on_tool_error_callback",
+      "on_model_error_callback",
+  })
+  """Names of all the callbacks a plugin can implement."""
+
+  observe_only_callbacks: ClassVar[frozenset[str]] = frozenset()
+  """Names of the callbacks of this plugin that only observe their inputs."""
+
   def __init__(self, name: str):
     """Initializes the plugin.
 
@@ -362,3 +391,11 @@ class BasePlugin(ABC):
       allows the original error to be raised.
     """
     pass
+
+  async def close(self) -> None:
+    """Releases the resources held by the plugin.
+
+    Called when the runner is closed. Plugins that buffer data, e.g. remote
+    loggers, should flush it here.
+    """
+    pass
@@ -14,6 +14,7 @@
 from __future__ import annotations
 
 import asyncio
+import collections
 from datetime import datetime
 from datetime import timezone
 import json
@@ -109,19 +110,58 @@ class BigQueryAgentAnalyticsPlugin(BasePlugin):
 
   Each log entry includes a timestamp, event type, agent name, session ID,
   invocation ID, user ID, content payload, and any error messages.
+
+  Rows are buffered in memory and written in batches by a background task, once
+  `batch_size` rows are buffered or every `flush_interval_seconds`, so logging
+  doesn't add a BigQuery request to each callback. Call `flush()` to write the
+  buffered rows immediately; closing the runner flushes them too.
   """
 
+  # Rows are written off the critical path of the other plugins. As observers
+  # run after the intercepting callbacks of all plugins, the rows record the
+  # inputs as modified by the other plugins.
+  observe_only_callbacks = BasePlugin.ALL_CALLBACKS
+
   def __init__(
       self,
       project_id: str,
       dataset_id: str,
       table_id: str = "agent_events",
+      batch_size: int = 500,
+      flush_interval_seconds: float = 1.0,
+      max_buffered_rows: int = 10000,
       **kwargs,
   ):
+    """Initializes the plugin.
+
+    Args:
+      project_id: The Google Cloud project of the BigQuery dataset.
+      dataset_id: The BigQuery dataset, created if it doesn't exist.
+      table_id: The BigQuery table, created if it doesn't exist.
+      batch_size: The maximum number of rows per insert request. A flush is
+        triggered as soon as this many rows are buffered.
+      flush_interval_seconds: How often the buffered rows are written.
+      max_buffered_rows: The maximum number of buffered rows. When the buffer
+        is full, the oldest rows are dropped.
+      **kwargs: Additional arguments, e.g. `name`.
+    """
     super().__init__(name=kwargs.get("name", "BigQueryAgentAnalyticsPlugin"))
+    if batch_size < 1:
+      raise ValueError("batch_size must be at least 1.")
+    if max_buffered_rows < batch_size:
+      raise ValueError("max_buffered_rows must be at least batch_size.")
     self._project_id = project_id
     self._dataset_id = dataset_id
     self._table_id = table_id
+    self._batch_size = batch_size
+    self._flush_interval_seconds = flush_interval_seconds
+    self._rows: collections.deque[dict[str, Any]] = collections.deque(
+        maxlen=max_buffered_rows
+    )
+    self._rows_lock = threading.Lock()
+    self._dropped_row_count = 0
+    self._flush_task: Optional[asyncio.Task[None]] = None
+    self._batch_ready: Optional[asyncio.Event] = None
     self._bq_client: bigquery.Client | None = None
     self._client_init_lock = threading.Lock()
     self._init_done = False
@@ -180,41 +220,111 @@ class BigQueryAgentAnalyticsPlugin(BasePlugin):
         self._init_succeeded = False
 
   async def _log_to_bigquery_async(self, event_dict: dict[str, Any]):
-    def _sync_log():
-      self._ensure_initialized_sync()
-      if not self._init_succeeded or not self._bq_client:
+    """Buffers a row, which the background flush task writes to BigQuery."""
+    default_row = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "event_type": None,
+        "agent": None,
+        "session_id": None,
+        "invocation_id": None,
+        "user_id": None,
+        "content": None,
+        "error_message": None,
+    }
+    with self._rows_lock:
+      if len(self._rows) == self._rows.maxlen:
+        # The deque drops the oldest row to make room.
+        self._dropped_row_count += 1
+      self._rows.append({**default_row, **event_dict})
+      batch_ready = len(self._rows) >= self._batch_size
+    self._ensure_flush_task_started()
+    if batch_ready:
+      self._batch_ready.set()
+
+  def _ensure_flush_task_started(self):
+    """Starts the flush task on the running event loop if needed."""
+    loop = asyncio.get_running_loop()
+    if (
+        self._flush_task is not None
+        and not self._flush_task.done()
+        and self._flush_task.get_loop() is loop
+    ):
+      return
+    # The event is bound to the loop of the task waiting on it.
+    self._batch_ready = asyncio.Event()
+    self._flush_task = loop.create_task(
+        self._flush_periodically(self._batch_ready)
+    )
+
+  async def _flush_periodically(self, batch_ready: asyncio.Event):
+    while True:
+      try:
+        await asyncio.wait_for(
+            batch_ready.wait(), timeout=self._flush_interval_seconds
+        )
+      except asyncio.TimeoutError:
+        pass
+      batch_ready.clear()
+      try:
+        await self.flush()
+      except Exception:  # pylint: disable=broad-exception-caught
+        # Keep flushing the rows buffered later.
+        logging.exception("Failed to flush the rows buffered for BigQuery.")
+
+  async def flush(self):
+    """Writes all the buffered rows to BigQuery.
+
+    The rows of a batch that fails to be written are dropped, so that a
+    persistent failure doesn't grow the buffer.
+    """
+    while True:
+      with self._rows_lock:
+        batch_size = min(self._batch_size, len(self._rows))
+        rows = [self._rows.popleft() for _ in range(batch_size)]
+        dropped_row_count = self._dropped_row_count
+        self._dropped_row_count = 0
+      if dropped_row_count:
+        logging.warning(
+            "Dropped %d rows because the BigQuery write buffer was full.",
+            dropped_row_count,
+        )
+      if not rows:
         return
-      table_ref = self._bq_client.dataset(self._dataset_id).table(
-          self._table_id
-      )
-      default_row = {
-          "timestamp": datetime.now(timezone.utc).isoformat(),
-          "event_type": None,
-          "agent": None,
-          "session_id": None,
-          "invocation_id": None,
-          "user_id": None,
-          "content": None,
-          "error_message": None,
-      }
-      insert_row = {**default_row, **event_dict}
-
-      errors = self._bq_client.insert_rows_json(table_ref, [insert_row])
-      if errors:
-        logging.error(
-            "Errors occurred while inserting to BigQuery table %s.%s: %s",
-            self._dataset_id,
-            self._table_id,
-            errors,
+      try:
+        await asyncio.to_thread(self._insert_rows_sync, rows)
+      except Exception as e:  # pylint: disable=broad-exception-caught
+        logging.exception(
+            "Failed to log to BigQuery, dropped %d rows: %s", len(rows), e
         )
 
-    try:
-      await asyncio.to_thread(_sync_log)
-    except (
-        cloud_exceptions.GoogleCloudError,
-        auth_exceptions.GoogleAuthError,
-    ) as e:
-      logging.exception("Failed to log to BigQuery: %s", e)
+  def _insert_rows_sync(self, rows: list[dict[str, Any]]):
+    self._ensure_initialized_sync()
+    if not self._init_succeeded or not self._bq_client:
+      return
+    table_ref = self._bq_client.dataset(self._dataset_id).table(self._table_id)
+    errors = self._bq_client.insert_rows_json(table_ref, rows)
+    if errors:
+      logging.error(
+          "Errors occurred while inserting to BigQuery table %s.%s: %s",
+          self._dataset_id,
+          self._table_id,
+          errors,
+      )
+
+  async def close(self) -> None:
+    """Stops the flush task and writes the remaining rows."""
+    flush_task = self._flush_task
+    self._flush_task = None
+    if flush_task is not None and not flush_task.done():
+      if flush_task.get_loop() is asyncio.get_running_loop():
+        flush_task.cancel()
+        try:
+          await flush_task
+        except asyncio.CancelledError:
+          pass
+      else:
+        flush_task.get_loop().call_soon_threadsafe(flush_task.cancel)
+    await self.flush()
 
   async def on_user_message_callback(
       self,
@@ -255,9 +365,9 @@ class BigQueryAgentAnalyticsPlugin(BasePlugin):
   ) -> Optional[Event]:
     """Logs event data to BigQuery."""
     event_dict = {
-        "timestamp": datetime.fromtimestamp(
-            event.timestamp, timezone.utc
-        ).isoformat(),
+        "timestamp": (
+            datetime.fromtimestamp(event.timestamp, timezone.utc).isoformat()
+        ),
         "event_type": _get_event_type(event),
         "agent": event.author,
         "session_id": invocation_context.session.id,
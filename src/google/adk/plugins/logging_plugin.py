@@ -58,6 +58,11 @@ class LoggingPlugin(BasePlugin):
       ... )
   """
 
+  # Logging never changes the inputs nor short circuits the callbacks. As
+  # observers run after the intercepting callbacks of all plugins, the logs show
+  # the inputs as modified by the other plugins.
+  observe_only_callbacks = BasePlugin.ALL_CALLBACKS
+
   def __init__(self, name: str = "logging_plugin"):
     """Initialize the logging plugin.
 
@@ -14,6 +14,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any
 from typing import List
@@ -68,6 +69,12 @@ class PluginManager:
   that specific event is halted, and the returned value is propagated up the
   call stack. This allows plugins to short-circuit operations like agent runs,
   tool calls, or model requests.
+
+  Callbacks that a plugin declares in `observe_only_callbacks` are not part of
+  this chain. They are run concurrently once the intercepting callbacks are
+  done, so slow observers, e.g. remote loggers, don't add up their latencies.
+  They see the inputs as modified by the intercepting callbacks, even those of
+  plugins registered after them.
   """
 
   def __init__(self, plugins: Optional[List[BasePlugin]] = None):
@@ -106,6 +113,17 @@ class PluginManager:
     """
     return next((p for p in self.plugins if p.name == plugin_name), None)
 
+  async def close(self) -> None:
+    """Closes all the registered plugins.
+
+    Errors are logged rather than raised so that every plugin gets closed.
+    """
+    for plugin in self.plugins:
+      try:
+        await plugin.close()
+      except Exception:
+        logger.error("Error closing plugin '%s'.", plugin.name, exc_info=True)
+
   async def run_on_user_message_callback(
       self,
       *,
@@ -261,6 +279,9 @@ class PluginManager:
     value. This "early exit" value is then returned by this method. If all
     plugins are executed and all return `None`, this method also returns `None`.
 
+    Observe-only callbacks are skipped by this chain and run concurrently after
+    it, regardless of an early exit.
+
     Args:
       callback_name: The name of the callback method to execute.
       **kwargs: Keyword arguments to be passed to the callback method.
@@ -273,27 +294,75 @@ class PluginManager:
       RuntimeError: If a plugin encounters an unhandled exception during
         execution. The original exception is chained.
     """
+    result = None
     for plugin in self.plugins:
-      # Each plugin might not implement all callbacks. The base class provides
-      # default `pass` implementations, so `getattr` will always succeed.
-      callback_method = getattr(plugin, callback_name)
-      try:
-        result = await callback_method(**kwargs)
-        if result is not None:
-          # Early exit: A plugin has returned a value. We stop
-          # processing further plugins and return this value immediately.
-          logger.debug(
-              "Plugin '%s' returned a value for callback '%s', exiting early.",
-              plugin.name,
-              callback_name,
-          )
-          return result
-      except Exception as e:
-        error_message = (
-            f"Error in plugin '{plugin.name}' during '{callback_name}'"
-            f" callback: {e}"
+      if callback_name in plugin.observe_only_callbacks:
+        continue
+      result = await self._run_callback(plugin, callback_name, kwargs)
+      if result is not None:
+        # Early exit: A plugin has returned a value. We stop processing
+        # further intercepting plugins and return this value.
+        logger.debug(
+            "Plugin '%s' returned a value for callback '%s', exiting early.",
+            plugin.name,
+            callback_name,
+        )
+        break
+
+    observers = [
+        plugin
+        for plugin in self.plugins
+        if callback_name in plugin.observe_only_callbacks
+    ]
+    if observers:
+      await self._run_observe_only_callbacks(observers, callback_name, kwargs)
+    return result
+
+  async def _run_observe_only_callbacks(
+      self,
+      plugins: List[BasePlugin],
+      callback_name: PluginCallbackName,
+      kwargs: dict[str, Any],
+  ) -> None:
+    """Runs the observe-only callbacks of the plugins concurrently."""
+    if len(plugins) == 1:
+      outcomes = [await self._run_callback(plugins[0], callback_name, kwargs)]
+    else:
+      # Let every observer finish before surfacing the first error.
+      outcomes = await asyncio.gather(
+          *(
+              self._run_callback(plugin, callback_name, kwargs)
+              for plugin in plugins
+          ),
+          return_exceptions=True,
+      )
+    for plugin, outcome in zip(plugins, outcomes):
+      if isinstance(outcome, BaseException):
+        raise outcome
+      if outcome is not None:
+        logger.warning(
+            "Plugin '%s' returned a value from observe-only callback '%s',"
+            " ignoring it.",
+            plugin.name,
+            callback_name,
         )
-        logger.error(error_message, exc_info=True)
-        raise RuntimeError(error_message) from e
 
-    return None
+  async def _run_callback(
+      self,
+      plugin: BasePlugin,
+      callback_name: PluginCallbackName,
+      kwargs: dict[str, Any],
+  ) -> Optional[Any]:
+    """Runs a single plugin callback, wrapping its errors."""
+    # Each plugin might not implement all callbacks. The base class provides
+    # default `pass` implementations, so `getattr` will always succeed.
+    callback_method = getattr(plugin, callback_name)
+    try:
+      return await callback_method(**kwargs)
+    except Exception as e:
+      error_message = (
+          f"Error in plugin '{plugin.name}' during '{callback_name}'"
+          f" callback: {e}"
+      )
+      logger.error(error_message, exc_info=True)
+      raise RuntimeError(error_message) from e
@@ -19,6 +19,7 @@ import inspect
 import logging
 from pathlib import Path
 import queue
+import threading
 from typing import Any
 from typing import AsyncGenerator
 from typing import Callable
@@ -60,6 +61,7 @@ from .sessions.in_memory_session_service import InMemorySessionService
 from .sessions.session import Session
 from .telemetry.tracing import tracer
 from .tools.base_toolset import BaseToolset
+from .tools.function_tool import _shutdown_executors
 from .utils._debug_output import print_event
 from .utils.context_utils import Aclosing
 
@@ -115,6 +117,7 @@ class Runner:
       session_service: BaseSessionService,
       memory_service: Optional[BaseMemoryService] = None,
       credential_service: Optional[BaseCredentialService] = None,
+      reuse_event_loop: bool = False,
   ):
     """Initializes the Runner.
 
@@ -134,6 +137,11 @@ class Runner:
         session_service: The session service for the runner.
         memory_service: The memory service for the runner.
         credential_service: The credential service for the runner.
+        reuse_event_loop: Whether `run` executes the agent on a long-lived
+          event loop owned by the runner, instead of a new event loop for each
+          call. This keeps the clients bound to the event loop, such as HTTP
+          connection pools and MCP sessions, alive across calls. The event loop
+          is stopped by `close`.
 
     Raises:
         ValueError: If `app` is provided along with `app_name` or `plugins`, or
@@ -158,6 +166,10 @@ class Runner:
     ) = self._infer_agent_origin(self.agent)
     self._app_name_alignment_hint: Optional[str] = None
     self._enforce_app_name_alignment()
+    self._reuse_event_loop = reuse_event_loop
+    self._event_loop: Optional[asyncio.AbstractEventLoop] = None
+    self._event_loop_thread: Optional[threading.Thread] = None
+    self._event_loop_lock = threading.Lock()
 
   def _validate_runner_params(
       self,
@@ -315,6 +327,26 @@ class Runner:
       finally:
         event_queue.put(None)
 
+    if self._reuse_event_loop:
+      future = asyncio.run_coroutine_threadsafe(
+          _invoke_run_async(), self._get_event_loop()
+      )
+      finished = False
+      try:
+        while True:
+          event = event_queue.get()
+          if event is None:
+            finished = True
+            break
+          yield event
+      finally:
+        if not finished:
+          # Stop the agent if the caller stops consuming the events.
+          future.cancel()
+      # Raise the error of the agent, if any.
+      future.result()
+      return
+
     def _asyncio_thread_main():
       try:
         asyncio.run(_invoke_run_async())
@@ -334,6 +366,32 @@ class Runner:
 
     thread.join()
 
+  def _get_event_loop(self) -> asyncio.AbstractEventLoop:
+    """Returns the event loop used by `run`, starting it if needed."""
+    with self._event_loop_lock:
+      if self._event_loop is None:
+        loop = asyncio.new_event_loop()
+        thread = create_thread(target=self._run_event_loop, loop=loop)
+        # Don't prevent the interpreter from exiting if the runner isn't closed.
+        thread.daemon = True
+        thread.start()
+        self._event_loop = loop
+        self._event_loop_thread = thread
+      return self._event_loop
+
+  @staticmethod
+  def _run_event_loop(loop: asyncio.AbstractEventLoop):
+    asyncio.set_event_loop(loop)
+    try:
+      loop.run_forever()
+    finally:
+      tasks = asyncio.all_tasks(loop)
+      for task in tasks:
+        task.cancel()
+      loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+      loop.run_until_complete(loop.shutdown_asyncgens())
+      loop.close()
+
   async def run_async(
       self,
       *,
@@ -631,36 +689,41 @@ class Runner:
 
     plugin_manager = invocation_context.plugin_manager
 
-    # Step 1: Run the before_run callbacks to see if we should early exit.
-    early_exit_result = await plugin_manager.run_before_run_callback(
-        invocation_context=invocation_context
-    )
-    if isinstance(early_exit_result, types.Content):
-      early_exit_event = Event(
-          invocation_id=invocation_context.invocation_id,
-          author='model',
-          content=early_exit_result,
+    try:
+      # Step 1: Run the before_run callbacks to see if we should early exit.
+      early_exit_result = await plugin_manager.run_before_run_callback(
+          invocation_context=invocation_context
       )
-      if self._should_append_event(early_exit_event, is_live_call):
-        await self.session_service.append_event(
-            session=session,
-            event=early_exit_event,
+      if isinstance(early_exit_result, types.Content):
+        early_exit_event = Event(
+            invocation_id=invocation_context.invocation_id,
+            author='model',
+            content=early_exit_result,
         )
-      yield early_exit_event
-    else:
-      # Step 2: Otherwise continue with normal execution
-      async with Aclosing(execute_fn(invocation_context)) as agen:
-        async for event in agen:
-          if not event.partial:
-            if self._should_append_event(event, is_live_call):
-              await self.session_service.append_event(
-                  session=session, event=event
-              )
-          # Step 3: Run the on_event callbacks to optionally modify the event.
-          modified_event = await plugin_manager.run_on_event_callback(
-              invocation_context=invocation_context, event=event
+        if self._should_append_event(early_exit_event, is_live_call):
+          await self.session_service.append_event(
+              session=session,
+              event=early_exit_event,
           )
-          yield (modified_event if modified_event else event)
+        yield early_exit_event
+      else:
+        # Step 2: Otherwise continue with normal execution
+        async with Aclosing(execute_fn(invocation_context)) as agen:
+          async for event in agen:
+            if not event.partial:
+              if self._should_append_event(event, is_live_call):
+                await self.session_service.append_event(
+                    session=session, event=event
+                )
+            # Step 3: Run the on_event callbacks to optionally modify the event.
+            modified_event = await plugin_manager.run_on_event_callback(
+                invocation_context=invocation_context, event=event
+            )
+            yield (modified_event if modified_event else event)
+    finally:
+      # Persist any events the session service buffered during the
+      # invocation, even if it failed or the caller stopped early.
+      await self.session_service.flush_events(session)
 
     # Step 4: Run the after_run callbacks to perform global cleanup tasks or
     # finalizing logs and metrics data.
@@ -1311,7 +1374,28 @@ class Runner:
 
   async def close(self):
     """Closes the runner."""
+    with self._event_loop_lock:
+      loop, self._event_loop = self._event_loop, None
+      thread, self._event_loop_thread = self._event_loop_thread, None
+    if loop is None:
+      await self._close_resources()
+      return
+    # The toolsets and plugins used by `run` are bound to its event loop.
+    try:
+      await asyncio.wrap_future(
+          asyncio.run_coroutine_threadsafe(self._close_resources(), loop)
+      )
+    finally:
+      loop.call_soon_threadsafe(loop.stop)
+      thread.join()
+
+  async def _close_resources(self):
     await self._cleanup_toolsets(self._collect_toolset(self.agent))
+    await self.plugin_manager.close()
+    # Stops the worker threads and processes of the function tools. The pools
+    # are shared with other runners, whose running calls still complete, and
+    # are recreated by the next calls.
+    _shutdown_executors()
 
   async def __aenter__(self):
     """Async context manager entry."""
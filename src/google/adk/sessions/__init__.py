@@ -14,6 +14,7 @@
 import logging
 
 from .base_session_service import BaseSessionService
+from .base_session_service import ListSessionsConfig
 from .in_memory_session_service import InMemorySessionService
 from .session import Session
 from .state import State
@@ -25,6 +26,7 @@ logger = logging.getLogger('google_adk.' + __name__)
 __all__ = [
     'BaseSessionService',
     'InMemorySessionService',
+    'ListSessionsConfig',
     'Session',
     'State',
     'VertexAiSessionService',
@@ -12,15 +12,24 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Utility functions for session service."""
+
 from __future__ import annotations
 
+import base64
+import json
 from typing import Any
+from typing import Iterable
 from typing import Optional
 from typing import Type
+from typing import TYPE_CHECKING
 from typing import TypeVar
 
 from .state import State
 
+if TYPE_CHECKING:
+  from .base_session_service import ListSessionsConfig
+  from .session import Session
+
 M = TypeVar("M")
 
 
@@ -47,3 +56,55 @@ def extract_state_delta(
       elif not key.startswith(State.TEMP_PREFIX):
         deltas["session"][key] = state[key]
   return deltas
+
+
+def encode_page_token(key: list[Any]) -> str:
+  """Encodes the sort key of the last listed item into a page token."""
+  return base64.urlsafe_b64encode(json.dumps(key).encode()).decode()
+
+
+def decode_page_token(page_token: str) -> list[Any]:
+  """Decodes a page token created by `encode_page_token`."""
+  try:
+    return json.loads(base64.urlsafe_b64decode(page_token.encode()))
+  except ValueError as e:
+    raise ValueError(f"Invalid page token: {page_token}") from e
+
+
+def paginate_sessions(
+    sessions: Iterable[Session], config: ListSessionsConfig
+) -> tuple[list[Session], Optional[str]]:
+  """Filters, sorts and paginates sessions held in memory.
+
+  Returns:
+    The sessions of the page, and the token of the next page if any.
+  """
+
+  def _sort_key(session: Session) -> list[Any]:
+    return [session.last_update_time, session.user_id, session.id]
+
+  matching_sessions = [
+      session
+      for session in sessions
+      if (
+          config.updated_after is None
+          or session.last_update_time > config.updated_after
+      )
+      and not session.id.startswith(tuple(config.exclude_id_prefixes))
+  ]
+  if config.page_token:
+    last_key = decode_page_token(config.page_token)
+    # Resume right after the last session of the previous page.
+    if config.descending:
+      matching_sessions = [
+          s for s in matching_sessions if _sort_key(s) < last_key
+      ]
+    else:
+      matching_sessions = [
+          s for s in matching_sessions if _sort_key(s) > last_key
+      ]
+  matching_sessions.sort(key=_sort_key, reverse=config.descending)
+  if config.page_size is None or len(matching_sessions) <= config.page_size:
+    return matching_sessions, None
+  page = matching_sessions[: config.page_size]
+  return page, encode_page_token(_sort_key(page[-1]))
@@ -33,6 +33,30 @@ class GetSessionConfig(BaseModel):
   after_timestamp: Optional[float] = None
 
 
+class ListSessionsConfig(BaseModel):
+  """The configuration of listing sessions.
+
+  When a config is given, the sessions are ordered by last update time, so
+  that pages are stable while sessions are being created.
+  """
+
+  page_size: Optional[int] = Field(default=None, gt=0)
+  """The maximum number of sessions to return. All the matching sessions are
+  returned if not set."""
+
+  page_token: Optional[str] = None
+  """The `next_page_token` of the previous page, to get the next one."""
+
+  updated_after: Optional[float] = None
+  """If set, only the sessions last updated after this timestamp are listed."""
+
+  exclude_id_prefixes: list[str] = Field(default_factory=list)
+  """The sessions whose ID starts with one of these prefixes are not listed."""
+
+  descending: bool = False
+  """Whether the most recently updated sessions are listed first."""
+
+
 class ListSessionsResponse(BaseModel):
   """The response of listing sessions.
 
@@ -41,6 +65,9 @@ class ListSessionsResponse(BaseModel):
 
   sessions: list[Session] = Field(default_factory=list)
 
+  next_page_token: Optional[str] = None
+  """The token of the next page, if there are more sessions to list."""
+
 
 class BaseSessionService(abc.ABC):
   """Base class for session services.
@@ -83,7 +110,11 @@ class BaseSessionService(abc.ABC):
 
   @abc.abstractmethod
   async def list_sessions(
-      self, *, app_name: str, user_id: Optional[str] = None
+      self,
+      *,
+      app_name: str,
+      user_id: Optional[str] = None,
+      config: Optional[ListSessionsConfig] = None,
   ) -> ListSessionsResponse:
     """Lists all the sessions for a user.
 
@@ -91,6 +122,8 @@ class BaseSessionService(abc.ABC):
       app_name: The name of the app.
       user_id: The ID of the user. If not provided, lists all sessions for all
         users.
+      config: The filters, order and pagination of the listing. If not
+        provided, all the sessions are listed in no particular order.
 
     Returns:
       A ListSessionsResponse containing the sessions.
@@ -111,6 +144,14 @@ class BaseSessionService(abc.ABC):
     session.events.append(event)
     return event
 
+  async def flush_events(self, session: Session) -> None:
+    """Persists the events buffered for a session, if any.
+
+    The runner calls this at the end of each invocation. Services that persist
+    events in `append_event` don't buffer anything, so this is a no-op by
+    default.
+    """
+
   def _trim_temp_delta_state(self, event: Event) -> Event:
     """Removes temporary state delta keys from the event."""
     if not event.actions or not event.actions.state_delta:
@@ -13,29 +13,41 @@
 # limitations under the License.
 from __future__ import annotations
 
+import asyncio
 import copy
 from datetime import datetime
 from datetime import timezone
 import json
 import logging
 import pickle
+import time
 from typing import Any
+from typing import Callable
 from typing import Optional
+from typing import TypeVar
 import uuid
 
 from google.genai import types
+from pydantic import BaseModel
+from sqlalchemy import and_
 from sqlalchemy import Boolean
 from sqlalchemy import delete
 from sqlalchemy import Dialect
 from sqlalchemy import event
 from sqlalchemy import ForeignKeyConstraint
 from sqlalchemy import func
+from sqlalchemy import or_
 from sqlalchemy import Text
 from sqlalchemy.dialects import mysql
 from sqlalchemy.dialects import postgresql
 from sqlalchemy.engine import create_engine
 from sqlalchemy.engine import Engine
+from sqlalchemy.engine import make_url
 from sqlalchemy.exc import ArgumentError
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import create_async_engine
 from sqlalchemy.ext.mutable import MutableDict
 from sqlalchemy.inspection import inspect
 from sqlalchemy.orm import DeclarativeBase
@@ -58,6 +70,7 @@ from ..events.event import Event
 from ..events.event_actions import EventActions
 from .base_session_service import BaseSessionService
 from .base_session_service import GetSessionConfig
+from .base_session_service import ListSessionsConfig
 from .base_session_service import ListSessionsResponse
 from .session import Session
 from .state import State
@@ -67,6 +80,8 @@ logger = logging.getLogger("google_adk." + __name__)
 DEFAULT_MAX_KEY_LENGTH = 128
 DEFAULT_MAX_VARCHAR_LENGTH = 256
 
+_T = TypeVar("_T")
+
 
 class DynamicJSON(TypeDecorator):
   """A JSON-like type that uses JSONB on PostgreSQL and TEXT with JSON serialization for other databases."""
@@ -408,20 +423,80 @@ def set_sqlite_pragma(dbapi_connection, connection_record):
   cursor.close()
 
 
+class WriteBehindConfig(BaseModel):
+  """The configuration of write-behind event persistence.
+
+  In write-behind mode, `append_event` updates the in-memory session right
+  away but buffers the event, and the buffered events and state deltas of a
+  session are persisted together in a single transaction. Buffered events are
+  flushed at the end of each invocation, before any read of the session, or
+  once one of the thresholds below is reached. If a flush fails, the events
+  stay buffered and the next flush retries them, unless the session is stale,
+  i.e. it was updated by another writer. The events of a stale session are
+  dropped, and the error is raised by the `append_event` or `flush_events`
+  call of the session's writer rather than by reads of the session.
+  """
+
+  max_batch_size: int = 50
+  """The max number of buffered events of a session before it is flushed."""
+
+  max_delay_seconds: float = 1.0
+  """The max age, in seconds, of the oldest buffered event of a session before
+  it is flushed, by a timer or by the next `append_event`."""
+
+
+class _StaleSessionError(ValueError):
+  """Raised when persisting events of a session updated by another writer."""
+
+
+class _PendingEvents:
+  """The events of a session buffered in write-behind mode."""
+
+  def __init__(self, session: Session):
+    self.session = session
+    self.events: list[Event] = []
+    self.first_buffered_at = time.monotonic()
+    # Serializes the flushes, so that an event isn't persisted twice.
+    self.flush_lock = asyncio.Lock()
+    self.flush_timer: Optional[asyncio.TimerHandle] = None
+
+
 class DatabaseSessionService(BaseSessionService):
-  """A session service that uses a database for storage."""
+  """A session service that uses a database for storage.
+
+  Both synchronous and asynchronous SQLAlchemy drivers are supported. When the
+  database URL names an async driver (e.g. `sqlite+aiosqlite`,
+  `postgresql+asyncpg` or `mysql+aiomysql`), the service is backed by an
+  `AsyncEngine` and database I/O no longer blocks the event loop. Additional
+  keyword arguments, such as pool settings, are passed to the engine.
+
+  Setting `write_behind_config` enables write-behind mode, which coalesces the
+  events of an invocation into a single transaction. See `WriteBehindConfig`.
+  """
 
-  def __init__(self, db_url: str, **kwargs: Any):
+  def __init__(
+      self,
+      db_url: str,
+      *,
+      write_behind_config: Optional[WriteBehindConfig] = None,
+      **kwargs: Any,
+  ):
     """Initializes the database session service with a database URL."""
     # 1. Create DB engine for db connection
     # 2. Create all tables based on schema
     # 3. Initialize all properties
     try:
-      db_engine = create_engine(db_url, **kwargs)
+      url = make_url(db_url)
+      if url.get_dialect().is_async:
+        db_engine = create_async_engine(url, **kwargs)
+        sync_engine = db_engine.sync_engine
+      else:
+        db_engine = create_engine(url, **kwargs)
+        sync_engine = db_engine
 
-      if db_engine.dialect.name == "sqlite":
+      if sync_engine.dialect.name == "sqlite":
         # Set sqlite pragma to enable foreign keys constraints
-        event.listen(db_engine, "connect", set_sqlite_pragma)
+        event.listen(sync_engine, "connect", set_sqlite_pragma)
 
     except Exception as e:
       if isinstance(e, ArgumentError):
@@ -440,18 +515,69 @@ class DatabaseSessionService(BaseSessionService):
     local_timezone = get_localzone()
     logger.info("Local timezone: %s", local_timezone)
 
-    self.db_engine: Engine = db_engine
+    self.db_engine: Engine | AsyncEngine = db_engine
     self.metadata: MetaData = MetaData()
-    self.inspector = inspect(self.db_engine)
-
-    # DB session factory method
-    self.database_session_factory: sessionmaker[DatabaseSessionFactory] = (
-        sessionmaker(bind=self.db_engine)
+    self.write_behind_config = write_behind_config
+    # A map from (app name, user ID, session ID) to the events buffered for
+    # the session in write-behind mode.
+    self._pending_events: dict[tuple[str, str, str], _PendingEvents] = {}
+    # Keeps the flushes started by timers alive until they complete.
+    self._timer_flushes: set[asyncio.Task[None]] = set()
+    # Errors of the stale batches dropped by flushes of other callers, e.g. a
+    # read, raised by the next flush of the session's own writer.
+    self._stale_flush_errors: dict[tuple[str, str, str], _StaleSessionError] = (
+        {}
     )
-
-    # Uncomment to recreate DB every time
-    # Base.metadata.drop_all(self.db_engine)
-    Base.metadata.create_all(self.db_engine)
+    self._is_async = isinstance(db_engine, AsyncEngine)
+
+    if self._is_async:
+      # Tables of an async engine can only be created from a running event
+      # loop, so it is deferred to the first database operation.
+      self.inspector = None
+      self.database_session_factory: (
+          async_sessionmaker[AsyncSession]
+          | sessionmaker[DatabaseSessionFactory]
+      ) = async_sessionmaker(bind=self.db_engine)
+      self._tables_created = False
+      self._tables_lock: Optional[asyncio.Lock] = None
+    else:
+      self.inspector = inspect(self.db_engine)
+      # DB session factory method
+      self.database_session_factory = sessionmaker(bind=self.db_engine)
+      # Uncomment to recreate DB every time
+      # Base.metadata.drop_all(self.db_engine)
+      Base.metadata.create_all(self.db_engine)
+      self._tables_created = True
+
+  async def _ensure_tables_created(self) -> None:
+    """Creates all tables on an async engine, once."""
+    if self._tables_created:
+      return
+    if self._tables_lock is None:
+      self._tables_lock = asyncio.Lock()
+    async with self._tables_lock:
+      if self._tables_created:
+        return
+      async with self.db_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+      self._tables_created = True
+
+  async def _run_in_session(
+      self, fn: Callable[[DatabaseSessionFactory], _T]
+  ) -> _T:
+    """Runs `fn` with a new database session and returns its result.
+
+    With an async engine, `fn` runs through `AsyncSession.run_sync`, so the
+    ORM code is shared between both engine kinds while the underlying I/O is
+    awaited on the event loop.
+    """
+    if not self._is_async:
+      with self.database_session_factory() as sql_session:
+        return fn(sql_session)
+
+    await self._ensure_tables_created()
+    async with self.database_session_factory() as sql_session:
+      return await sql_session.run_sync(fn)
 
   @override
   async def create_session(
@@ -468,7 +594,7 @@ class DatabaseSessionService(BaseSessionService):
     # 4. Build the session object with generated id
     # 5. Return the session
 
-    with self.database_session_factory() as sql_session:
+    def _create(sql_session: DatabaseSessionFactory) -> Session:
       if session_id and sql_session.get(
           StorageSession, (app_name, user_id, session_id)
       ):
@@ -517,8 +643,9 @@ class DatabaseSessionService(BaseSessionService):
       merged_state = _merge_state(
           storage_app_state.state, storage_user_state.state, session_state
       )
-      session = storage_session.to_session(state=merged_state)
-    return session
+      return storage_session.to_session(state=merged_state)
+
+    return await self._run_in_session(_create)
 
   @override
   async def get_session(
@@ -532,7 +659,11 @@ class DatabaseSessionService(BaseSessionService):
     # 1. Get the storage session entry from session table
     # 2. Get all the events based on session id and filtering config
     # 3. Convert and return the session
-    with self.database_session_factory() as sql_session:
+    await self._flush_pending_events(
+        lambda key: key == (app_name, user_id, session_id)
+    )
+
+    def _get(sql_session: DatabaseSessionFactory) -> Optional[Session]:
       storage_session = sql_session.get(
           StorageSession, (app_name, user_id, session_id)
       )
@@ -574,40 +705,59 @@ class DatabaseSessionService(BaseSessionService):
 
       # Convert storage session to session
       events = [e.to_event() for e in reversed(storage_events)]
-      session = storage_session.to_session(state=merged_state, events=events)
-    return session
+      return storage_session.to_session(state=merged_state, events=events)
+
+    return await self._run_in_session(_get)
 
   @override
   async def list_sessions(
-      self, *, app_name: str, user_id: Optional[str] = None
+      self,
+      *,
+      app_name: str,
+      user_id: Optional[str] = None,
+      config: Optional[ListSessionsConfig] = None,
   ) -> ListSessionsResponse:
-    with self.database_session_factory() as sql_session:
+    await self._flush_pending_events(
+        lambda key: key[0] == app_name and user_id in (None, key[1])
+    )
+
+    def _list(sql_session: DatabaseSessionFactory) -> ListSessionsResponse:
       query = sql_session.query(StorageSession).filter(
           StorageSession.app_name == app_name
       )
       if user_id is not None:
         query = query.filter(StorageSession.user_id == user_id)
+      if config is not None:
+        query = _apply_list_sessions_config(
+            query, config, sql_session.bind.dialect.name
+        )
       results = query.all()
+      next_page_token = None
+      if config is not None and config.page_size is not None:
+        if len(results) > config.page_size:
+          results = results[: config.page_size]
+          last = results[-1]
+          next_page_token = _session_util.encode_page_token(
+              [last.update_time.isoformat(), last.user_id, last.id]
+          )
 
       # Fetch app state from storage
       storage_app_state = sql_session.get(StorageAppState, (app_name))
       app_state = storage_app_state.state if storage_app_state else {}
 
-      # Fetch user state(s) from storage
+      # Fetch the states of the users of the listed sessions only.
       user_states_map = {}
-      if user_id is not None:
-        storage_user_state = sql_session.get(
-            StorageUserState, (app_name, user_id)
-        )
-        if storage_user_state:
-          user_states_map[user_id] = storage_user_state.state
-      else:
-        all_user_states_for_app = (
+      listed_user_ids = {storage_session.user_id for storage_session in results}
+      if listed_user_ids:
+        storage_user_states = (
             sql_session.query(StorageUserState)
-            .filter(StorageUserState.app_name == app_name)
+            .filter(
+                StorageUserState.app_name == app_name,
+                StorageUserState.user_id.in_(listed_user_ids),
+            )
             .all()
         )
-        for storage_user_state in all_user_states_for_app:
+        for storage_user_state in storage_user_states:
           user_states_map[storage_user_state.user_id] = storage_user_state.state
 
       sessions = []
@@ -616,13 +766,23 @@ class DatabaseSessionService(BaseSessionService):
         user_state = user_states_map.get(storage_session.user_id, {})
         merged_state = _merge_state(app_state, user_state, session_state)
         sessions.append(storage_session.to_session(state=merged_state))
-      return ListSessionsResponse(sessions=sessions)
+      return ListSessionsResponse(
+          sessions=sessions, next_page_token=next_page_token
+      )
+
+    return await self._run_in_session(_list)
 
   @override
   async def delete_session(
       self, app_name: str, user_id: str, session_id: str
   ) -> None:
-    with self.database_session_factory() as sql_session:
+    # Events buffered for a deleted session are discarded.
+    pending = self._pending_events.pop((app_name, user_id, session_id), None)
+    if pending is not None and pending.flush_timer is not None:
+      pending.flush_timer.cancel()
+    self._stale_flush_errors.pop((app_name, user_id, session_id), None)
+
+    def _delete(sql_session: DatabaseSessionFactory) -> None:
       stmt = delete(StorageSession).where(
           StorageSession.app_name == app_name,
           StorageSession.user_id == user_id,
@@ -631,6 +791,8 @@ class DatabaseSessionService(BaseSessionService):
       sql_session.execute(stmt)
       sql_session.commit()
 
+    await self._run_in_session(_delete)
+
   @override
   async def append_event(self, session: Session, event: Event) -> Event:
     if event.partial:
@@ -639,56 +801,245 @@ class DatabaseSessionService(BaseSessionService):
     # Trim temp state before persisting
     event = self._trim_temp_delta_state(event)
 
-    # 1. Check if timestamp is stale
-    # 2. Update session attributes based on event config
-    # 3. Store event to table
-    with self.database_session_factory() as sql_session:
-      storage_session = sql_session.get(
-          StorageSession, (session.app_name, session.user_id, session.id)
-      )
+    if self.write_behind_config:
+      # Update the in-memory session right away, and persist later.
+      await super().append_event(session=session, event=event)
+      key = (session.app_name, session.user_id, session.id)
+      pending = self._pending_events.get(key)
+      if pending is None:
+        pending = self._pending_events[key] = _PendingEvents(session)
+        self._start_flush_timer(key, pending)
+      pending.session = session
+      pending.events.append(event)
+      if (
+          len(pending.events) >= self.write_behind_config.max_batch_size
+          or time.monotonic() - pending.first_buffered_at
+          >= self.write_behind_config.max_delay_seconds
+      ):
+        await self.flush_events(session)
+      return event
 
-      if storage_session.update_timestamp_tz > session.last_update_time:
-        raise ValueError(
-            "The last_update_time provided in the session object"
-            f" {datetime.fromtimestamp(session.last_update_time):'%Y-%m-%d %H:%M:%S'} is"
-            " earlier than the update_time in the storage_session"
-            f" {datetime.fromtimestamp(storage_session.update_timestamp_tz):'%Y-%m-%d %H:%M:%S'}."
-            " Please check if it is a stale session."
+    await self._run_in_session(
+        lambda sql_session: _persist_events(sql_session, session, [event])
+    )
+
+    # Also update the in-memory session
+    await super().append_event(session=session, event=event)
+    return event
+
+  @override
+  async def flush_events(self, session: Session) -> None:
+    key = (session.app_name, session.user_id, session.id)
+    stale_flush_error = self._stale_flush_errors.pop(key, None)
+    if stale_flush_error is not None:
+      raise stale_flush_error
+    pending = self._pending_events.get(key)
+    if pending is None:
+      return
+    async with pending.flush_lock:
+      events = list(pending.events)
+      if not events:
+        return
+      # The events are only removed from the buffer once they are committed,
+      # so that a failed flush doesn't lose them. A stale batch can never be
+      # committed though, so it is dropped rather than retried by every flush.
+      try:
+        await self._run_in_session(
+            lambda sql_session: _persist_events(
+                sql_session, pending.session, events
+            )
         )
+      except _StaleSessionError:
+        if pending.flush_timer is not None:
+          pending.flush_timer.cancel()
+          pending.flush_timer = None
+        if self._pending_events.get(key) is pending:
+          del self._pending_events[key]
+        raise
+      # Events may have been buffered while the flush was in progress.
+      del pending.events[: len(events)]
+      if pending.flush_timer is not None:
+        pending.flush_timer.cancel()
+        pending.flush_timer = None
+      if pending.events:
+        pending.first_buffered_at = time.monotonic()
+        self._start_flush_timer(key, pending)
+      elif self._pending_events.get(key) is pending:
+        del self._pending_events[key]
+
+  def _start_flush_timer(
+      self, key: tuple[str, str, str], pending: _PendingEvents
+  ) -> None:
+    """Flushes the buffered events of a session after `max_delay_seconds`.
+
+    Without the timer, the events of an idle session would only be flushed by
+    the end of the invocation or a read of the session.
+    """
+
+    def _flush():
+      pending.flush_timer = None
+      if self._pending_events.get(key) is not pending:
+        return
+      task = asyncio.create_task(self._flush_on_timer(pending))
+      self._timer_flushes.add(task)
+      task.add_done_callback(self._timer_flushes.discard)
+
+    pending.flush_timer = asyncio.get_running_loop().call_later(
+        self.write_behind_config.max_delay_seconds, _flush
+    )
 
-      # Fetch states from storage
-      storage_app_state = sql_session.get(StorageAppState, (session.app_name))
-      storage_user_state = sql_session.get(
-          StorageUserState, (session.app_name, session.user_id)
+  async def _flush_on_timer(self, pending: _PendingEvents) -> None:
+    try:
+      await self._flush_for_writer(pending.session)
+    except Exception:
+      # The events stay buffered, and are retried by the next flush.
+      logger.exception(
+          "Failed to flush the buffered events of session %s.",
+          pending.session.id,
       )
 
-      # Extract state delta
-      if event.actions and event.actions.state_delta:
-        state_deltas = _session_util.extract_state_delta(
-            event.actions.state_delta
-        )
-        app_state_delta = state_deltas["app"]
-        user_state_delta = state_deltas["user"]
-        session_state_delta = state_deltas["session"]
-        # Merge state and update storage
-        if app_state_delta:
-          storage_app_state.state = storage_app_state.state | app_state_delta
-        if user_state_delta:
-          storage_user_state.state = storage_user_state.state | user_state_delta
-        if session_state_delta:
-          storage_session.state = storage_session.state | session_state_delta
-
-      sql_session.add(StorageEvent.from_event(session, event))
+  async def _flush_pending_events(
+      self, predicate: Callable[[tuple[str, str, str]], bool]
+  ) -> None:
+    """Flushes the buffered events of the sessions matching `predicate`."""
+    for key in [key for key in self._pending_events if predicate(key)]:
+      pending = self._pending_events.get(key)
+      if pending is not None:
+        await self._flush_for_writer(pending.session)
+
+  async def _flush_for_writer(self, session: Session) -> None:
+    """Flushes the buffered events of a session on behalf of its writer.
+
+    If the session is stale, the error is not raised to the caller, e.g. a
+    reader of the session, but to the next `flush_events` of the session.
+    """
+    try:
+      await self.flush_events(session)
+    except _StaleSessionError as e:
+      logger.warning(
+          "Dropped the buffered events of stale session %s: %s", session.id, e
+      )
+      self._stale_flush_errors[
+          (session.app_name, session.user_id, session.id)
+      ] = e
+
+
+def _persist_events(
+    sql_session: DatabaseSessionFactory, session: Session, events: list[Event]
+) -> None:
+  """Stores events and their state deltas to the database in one transaction.
+
+  Also updates `session.last_update_time` with the commit time.
+
+  Raises:
+    ValueError: If the session is stale, i.e. the storage session was updated
+      after `session.last_update_time`.
+  """
+  # 1. Check if timestamp is stale
+  # 2. Update session attributes based on event config
+  # 3. Store events to table
+  storage_session = sql_session.get(
+      StorageSession, (session.app_name, session.user_id, session.id)
+  )
 
-      sql_session.commit()
-      sql_session.refresh(storage_session)
+  if storage_session.update_timestamp_tz > session.last_update_time:
+    raise _StaleSessionError(
+        "The last_update_time provided in the session object"
+        f" {datetime.fromtimestamp(session.last_update_time):'%Y-%m-%d %H:%M:%S'}"
+        " is earlier than the update_time in the storage_session"
+        f" {datetime.fromtimestamp(storage_session.update_timestamp_tz):'%Y-%m-%d %H:%M:%S'}."
+        " Please check if it is a stale session."
+    )
 
-      # Update timestamp with commit time
-      session.last_update_time = storage_session.update_timestamp_tz
+  # Fetch states from storage
+  storage_app_state = sql_session.get(StorageAppState, (session.app_name))
+  storage_user_state = sql_session.get(
+      StorageUserState, (session.app_name, session.user_id)
+  )
 
-    # Also update the in-memory session
-    await super().append_event(session=session, event=event)
-    return event
+  for event in events:
+    # Extract state delta
+    if event.actions and event.actions.state_delta:
+      state_deltas = _session_util.extract_state_delta(
+          event.actions.state_delta
+      )
+      app_state_delta = state_deltas["app"]
+      user_state_delta = state_deltas["user"]
+      session_state_delta = state_deltas["session"]
+      # Merge state and update storage
+      if app_state_delta:
+        storage_app_state.state = storage_app_state.state | app_state_delta
+      if user_state_delta:
+        storage_user_state.state = storage_user_state.state | user_state_delta
+      if session_state_delta:
+        storage_session.state = storage_session.state | session_state_delta
+
+    sql_session.add(StorageEvent.from_event(session, event))
+
+  sql_session.commit()
+  sql_session.refresh(storage_session)
+
+  # Update timestamp with commit time
+  session.last_update_time = storage_session.update_timestamp_tz
+
+
+def _apply_list_sessions_config(
+    query, config: ListSessionsConfig, dialect_name: str
+):
+  """Applies the filters, order and page of a session listing to a query.
+
+  The query fetches one more session than the page size, to tell whether there
+  is a next page.
+  """
+
+  update_time = StorageSession.update_time
+  if dialect_name == "sqlite":
+    # SQLite stores timestamps as strings, formatted differently when set by
+    # the database and by SQLAlchemy, so they are compared as Julian days.
+    update_time = func.julianday(update_time)
+  if config.updated_after is not None:
+    if dialect_name == "sqlite":
+      # SQLite stores naive UTC timestamps, see `update_timestamp_tz`.
+      updated_after = datetime.fromtimestamp(
+          config.updated_after, timezone.utc
+      ).replace(tzinfo=None)
+      query = query.filter(
+          update_time > func.julianday(updated_after.isoformat())
+      )
+    else:
+      updated_after = datetime.fromtimestamp(config.updated_after)
+      query = query.filter(update_time > updated_after)
+  for prefix in config.exclude_id_prefixes:
+    query = query.filter(~StorageSession.id.startswith(prefix, autoescape=True))
+
+  sort_columns = (update_time, StorageSession.user_id, StorageSession.id)
+  if config.page_token:
+    last_update_time, last_user_id, last_id = _session_util.decode_page_token(
+        config.page_token
+    )
+    if dialect_name == "sqlite":
+      last_update_time = func.julianday(last_update_time)
+    else:
+      last_update_time = datetime.fromisoformat(last_update_time)
+    last_key = (last_update_time, last_user_id, last_id)
+    # Resume right after the last session of the previous page. The row value
+    # comparison is expanded, as not all dialects support it.
+    condition = None
+    for column, value in reversed(list(zip(sort_columns, last_key))):
+      after = column < value if config.descending else column > value
+      condition = (
+          after
+          if condition is None
+          else or_(after, and_(column == value, condition))
+      )
+    query = query.filter(condition)
+  if config.descending:
+    query = query.order_by(*(column.desc() for column in sort_columns))
+  else:
+    query = query.order_by(*sort_columns)
+  if config.page_size is not None:
+    query = query.limit(config.page_size + 1)
+  return query
 
 
 def _merge_state(app_state, user_state, session_state):
@@ -27,6 +27,7 @@ from ..errors.already_exists_error import AlreadyExistsError
 from ..events.event import Event
 from .base_session_service import BaseSessionService
 from .base_session_service import GetSessionConfig
+from .base_session_service import ListSessionsConfig
 from .base_session_service import ListSessionsResponse
 from .session import Session
 from .state import State
@@ -39,6 +40,12 @@ class InMemorySessionService(BaseSessionService):
 
   It is not suitable for multi-threaded production environments. Use it for
   testing and development only.
+
+  The sessions returned by the service are snapshots: their events list and
+  state can be changed without affecting the stored session. The `Event`
+  objects themselves are shared with the stored session rather than copied,
+  though, so they must be treated as immutable: changing e.g. the `actions` or
+  `content` of a returned event changes the stored event too.
   """
 
   def __init__(self):
@@ -124,8 +131,7 @@ class InMemorySessionService(BaseSessionService):
       self.sessions[app_name][user_id] = {}
     self.sessions[app_name][user_id][session_id] = session
 
-    copied_session = copy.deepcopy(session)
-    return self._merge_state(app_name, user_id, copied_session)
+    return self._snapshot_session(session, events=[])
 
   @override
   async def get_session(
@@ -175,24 +181,36 @@ class InMemorySessionService(BaseSessionService):
       return None
 
     session = self.sessions[app_name][user_id].get(session_id)
-    copied_session = copy.deepcopy(session)
 
+    # Only the retained events are sliced out of the storage session; events
+    # filtered out by the config are never copied.
+    events = session.events
+    start = 0
     if config:
       if config.num_recent_events:
-        copied_session.events = copied_session.events[
-            -config.num_recent_events :
-        ]
+        start = max(len(events) - config.num_recent_events, 0)
       if config.after_timestamp:
-        i = len(copied_session.events) - 1
-        while i >= 0:
-          if copied_session.events[i].timestamp < config.after_timestamp:
-            break
+        i = len(events) - 1
+        while i >= start and events[i].timestamp >= config.after_timestamp:
           i -= 1
-        if i >= 0:
-          copied_session.events = copied_session.events[i + 1 :]
-
-    # Return a copy of the session object with merged state.
-    return self._merge_state(app_name, user_id, copied_session)
+        start = i + 1
+
+    # Return a snapshot of the session object with merged state.
+    return self._snapshot_session(session, events=events[start:])
+
+  def _snapshot_session(self, session: Session, events: list[Event]) -> Session:
+    """Returns a snapshot of a storage session.
+
+    Appended events are never mutated by the service, so the snapshot shares
+    the event objects with the storage session instead of deep-copying the
+    whole history: it only gets its own list of the retained events, which the
+    runner appends to. The session state, which callers may mutate, is copied
+    before app and user state are merged into it.
+    """
+    snapshot = session.model_copy(
+        update={'state': copy.deepcopy(session.state), 'events': events}
+    )
+    return self._merge_state(session.app_name, session.user_id, snapshot)
 
   def _merge_state(
       self, app_name: str, user_id: str, copied_session: Session
@@ -220,18 +238,34 @@ class InMemorySessionService(BaseSessionService):
 
   @override
   async def list_sessions(
-      self, *, app_name: str, user_id: Optional[str] = None
+      self,
+      *,
+      app_name: str,
+      user_id: Optional[str] = None,
+      config: Optional[ListSessionsConfig] = None,
   ) -> ListSessionsResponse:
-    return self._list_sessions_impl(app_name=app_name, user_id=user_id)
+    return self._list_sessions_impl(
+        app_name=app_name, user_id=user_id, config=config
+    )
 
   def list_sessions_sync(
-      self, *, app_name: str, user_id: Optional[str] = None
+      self,
+      *,
+      app_name: str,
+      user_id: Optional[str] = None,
+      config: Optional[ListSessionsConfig] = None,
   ) -> ListSessionsResponse:
     logger.warning('Deprecated. Please migrate to the async method.')
-    return self._list_sessions_impl(app_name=app_name, user_id=user_id)
+    return self._list_sessions_impl(
+        app_name=app_name, user_id=user_id, config=config
+    )
 
   def _list_sessions_impl(
-      self, *, app_name: str, user_id: Optional[str] = None
+      self,
+      *,
+      app_name: str,
+      user_id: Optional[str] = None,
+      config: Optional[ListSessionsConfig] = None,
   ) -> ListSessionsResponse:
     empty_response = ListSessionsResponse()
     if app_name not in self.sessions:
@@ -239,23 +273,27 @@ class InMemorySessionService(BaseSessionService):
     if user_id is not None and user_id not in self.sessions[app_name]:
       return empty_response
 
-    sessions_without_events = []
-
     if user_id is None:
-      for user_id in self.sessions[app_name]:
-        for session_id in self.sessions[app_name][user_id]:
-          session = self.sessions[app_name][user_id][session_id]
-          copied_session = copy.deepcopy(session)
-          copied_session.events = []
-          copied_session = self._merge_state(app_name, user_id, copied_session)
-          sessions_without_events.append(copied_session)
+      sessions = [
+          session
+          for user_sessions in self.sessions[app_name].values()
+          for session in user_sessions.values()
+      ]
     else:
-      for session in self.sessions[app_name][user_id].values():
-        copied_session = copy.deepcopy(session)
-        copied_session.events = []
-        copied_session = self._merge_state(app_name, user_id, copied_session)
-        sessions_without_events.append(copied_session)
-    return ListSessionsResponse(sessions=sessions_without_events)
+      sessions = list(self.sessions[app_name][user_id].values())
+
+    next_page_token = None
+    if config is not None:
+      # Only the sessions of the page are snapshotted.
+      sessions, next_page_token = _session_util.paginate_sessions(
+          sessions, config
+      )
+    return ListSessionsResponse(
+        sessions=[
+            self._snapshot_session(session, events=[]) for session in sessions
+        ],
+        next_page_token=next_page_token,
+    )
 
   @override
   async def delete_session(
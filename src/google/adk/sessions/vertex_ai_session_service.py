@@ -37,6 +37,7 @@ from ..events.event_actions import EventActions
 from ..utils.vertex_ai_utils import get_express_mode_api_key
 from .base_session_service import BaseSessionService
 from .base_session_service import GetSessionConfig
+from .base_session_service import ListSessionsConfig
 from .base_session_service import ListSessionsResponse
 from .session import Session
 
@@ -195,18 +196,40 @@ class VertexAiSessionService(BaseSessionService):
 
   @override
   async def list_sessions(
-      self, *, app_name: str, user_id: Optional[str] = None
+      self,
+      *,
+      app_name: str,
+      user_id: Optional[str] = None,
+      config: Optional[ListSessionsConfig] = None,
   ) -> ListSessionsResponse:
+    """Lists the sessions of an app, optionally for a single user.
+
+    The user and `config.updated_after` filters are applied by the API. The
+    API can't order sessions by update time though, so all the matching
+    sessions are fetched, then ordered and paginated in process: a page size
+    reduces the size of the response, but not the cost of the listing.
+    """
     reasoning_engine_id = self._get_reasoning_engine_id(app_name)
     api_client = self._get_api_client()
 
     sessions = []
-    config = {}
+    list_config = {}
+    filters = []
     if user_id is not None:
-      config['filter'] = f'user_id="{user_id}"'
+      filters.append(f'user_id="{user_id}"')
+    if config and config.updated_after is not None:
+      filters.append(
+          'update_time>"{}"'.format(
+              datetime.datetime.fromtimestamp(
+                  config.updated_after, tz=datetime.timezone.utc
+              ).isoformat()
+          )
+      )
+    if filters:
+      list_config['filter'] = ' AND '.join(filters)
     sessions_iterator = await api_client.aio.agent_engines.sessions.list(
         name=f'reasoningEngines/{reasoning_engine_id}',
-        config=config,
+        config=list_config,
     )
 
     for api_session in sessions_iterator:
@@ -220,7 +243,16 @@ class VertexAiSessionService(BaseSessionService):
           )
       )
 
-    return ListSessionsResponse(sessions=sessions)
+    if config is None:
+      return ListSessionsResponse(sessions=sessions)
+    # The API can't order sessions by update time, so the listing is
+    # ordered and paginated here, after fetching all the matching sessions.
+    sessions, next_page_token = _session_util.paginate_sessions(
+        sessions, config
+    )
+    return ListSessionsResponse(
+        sessions=sessions, next_page_token=next_page_token
+    )
 
   async def delete_session(
       self, *, app_name: str, user_id: str, session_id: str
@@ -24,6 +24,7 @@
 from __future__ import annotations
 
 import json
+import logging
 import os
 from typing import Any
 from typing import Optional
@@ -38,6 +39,13 @@ from ..events.event import Event
 # By default some ADK spans include attributes with potential PII data.
 # This env, when set to false, allows to disable populating those attributes.
 ADK_CAPTURE_MESSAGE_CONTENT_IN_SPANS = 'ADK_CAPTURE_MESSAGE_CONTENT_IN_SPANS'
+# The maximum number of characters of a request or response payload recorded
+# in a span attribute. Longer payloads are truncated. Unset or 0 means no limit.
+ADK_SPAN_PAYLOAD_MAX_CHARS = 'ADK_SPAN_PAYLOAD_MAX_CHARS'
+# The fraction of traces, between 0 and 1, whose spans record request and
+# response payloads. The payloads of failed model calls are always recorded.
+# Defaults to 1.
+ADK_SPAN_PAYLOAD_SAMPLE_RATE = 'ADK_SPAN_PAYLOAD_SAMPLE_RATE'
 # TODO: Replace with constant from opentelemetry.semconv when it reaches version 1.37 in g3.
 GEN_AI_AGENT_DESCRIPTION = 'gen_ai.agent.description'
 GEN_AI_AGENT_NAME = 'gen_ai.agent.name'
@@ -56,6 +64,12 @@ if TYPE_CHECKING:
   from ..models.llm_response import LlmResponse
   from ..tools.base_tool import BaseTool
 
+logger = logging.getLogger('google_adk.' + __name__)
+
+# Trace IDs are sampled on their lower 64 bits, like the ratio based sampler of
+# the OpenTelemetry SDK.
+_TRACE_ID_LIMIT = (1 << 64) - 1
+
 tracer = trace.get_tracer(
     instrumenting_module_name='gcp.vertex.agent',
     instrumenting_library_version=version.__version__,
@@ -143,10 +157,11 @@ def trace_tool_call(
   span.set_attribute('gcp.vertex.agent.llm_request', '{}')
   span.set_attribute('gcp.vertex.agent.llm_response', '{}')
 
-  if _should_add_request_response_to_spans():
+  capture_payloads = _should_capture_payloads(span)
+  if capture_payloads:
     span.set_attribute(
         'gcp.vertex.agent.tool_call_args',
-        _safe_json_serialize(args),
+        _truncate_payload(_safe_json_serialize(args)),
     )
   else:
     span.set_attribute('gcp.vertex.agent.tool_call_args', {})
@@ -173,10 +188,10 @@ def trace_tool_call(
     tool_response = {'result': tool_response}
   if function_response_event is not None:
     span.set_attribute('gcp.vertex.agent.event_id', function_response_event.id)
-  if _should_add_request_response_to_spans():
+  if capture_payloads:
     span.set_attribute(
         'gcp.vertex.agent.tool_response',
-        _safe_json_serialize(tool_response),
+        _truncate_payload(_safe_json_serialize(tool_response)),
     )
   else:
     span.set_attribute('gcp.vertex.agent.tool_response', {})
@@ -206,17 +221,17 @@ def trace_merged_tool_calls(
   # TODO(b/441461932): See if these are still necessary
   span.set_attribute('gcp.vertex.agent.tool_call_args', 'N/A')
   span.set_attribute('gcp.vertex.agent.event_id', response_event_id)
-  try:
-    function_response_event_json = function_response_event.model_dumps_json(
-        exclude_none=True
-    )
-  except Exception:  # pylint: disable=broad-exception-caught
-    function_response_event_json = '<not serializable>'
 
-  if _should_add_request_response_to_spans():
+  if _should_capture_payloads(span):
+    try:
+      function_response_event_json = function_response_event.model_dumps_json(
+          exclude_none=True
+      )
+    except Exception:  # pylint: disable=broad-exception-caught
+      function_response_event_json = '<not serializable>'
     span.set_attribute(
         'gcp.vertex.agent.tool_response',
-        function_response_event_json,
+        _truncate_payload(function_response_event_json),
     )
   else:
     span.set_attribute('gcp.vertex.agent.tool_response', {})
@@ -258,11 +273,21 @@ def trace_call_llm(
       'gcp.vertex.agent.session_id', invocation_context.session.id
   )
   span.set_attribute('gcp.vertex.agent.event_id', event_id)
+  # Failed calls are always captured, as they are the ones worth debugging.
+  capture_payloads = _should_capture_payloads(
+      span, is_error=llm_response.error_code is not None
+  )
   # Consider removing once GenAI SDK provides a way to record this info.
-  if _should_add_request_response_to_spans():
+  if capture_payloads:
     span.set_attribute(
         'gcp.vertex.agent.llm_request',
-        _safe_json_serialize(_build_llm_request_for_trace(llm_request)),
+        _truncate_payload(
+            _safe_json_serialize(
+                _build_llm_request_for_trace(
+                    llm_request, max_chars=_get_payload_max_chars()
+                )
+            )
+        ),
     )
   else:
     span.set_attribute('gcp.vertex.agent.llm_request', {})
@@ -279,15 +304,14 @@ def trace_call_llm(
           llm_request.config.max_output_tokens,
       )
 
-  try:
-    llm_response_json = llm_response.model_dump_json(exclude_none=True)
-  except Exception:  # pylint: disable=broad-exception-caught
-    llm_response_json = '<not serializable>'
-
-  if _should_add_request_response_to_spans():
+  if capture_payloads:
+    try:
+      llm_response_json = llm_response.model_dump_json(exclude_none=True)
+    except Exception:  # pylint: disable=broad-exception-caught
+      llm_response_json = '<not serializable>'
     span.set_attribute(
         'gcp.vertex.agent.llm_response',
-        llm_response_json,
+        _truncate_payload(llm_response_json),
     )
   else:
     span.set_attribute('gcp.vertex.agent.llm_response', {})
@@ -335,21 +359,25 @@ def trace_send_data(
   span.set_attribute('gcp.vertex.agent.event_id', event_id)
   # Once instrumentation is added to the GenAI SDK, consider whether this
   # information still needs to be recorded by the Agent Development Kit.
-  if _should_add_request_response_to_spans():
+  if _should_capture_payloads(span):
     span.set_attribute(
         'gcp.vertex.agent.data',
-        _safe_json_serialize([
-            types.Content(role=content.role, parts=content.parts).model_dump(
-                exclude_none=True
-            )
-            for content in data
-        ]),
+        _truncate_payload(
+            _safe_json_serialize([
+                types.Content(
+                    role=content.role, parts=content.parts
+                ).model_dump(exclude_none=True)
+                for content in data
+            ])
+        ),
     )
   else:
     span.set_attribute('gcp.vertex.agent.data', {})
 
 
-def _build_llm_request_for_trace(llm_request: LlmRequest) -> dict[str, Any]:
+def _build_llm_request_for_trace(
+    llm_request: LlmRequest, max_chars: int = 0
+) -> dict[str, Any]:
   """Builds a dictionary representation of the LLM request for tracing.
 
   This function prepares a dictionary representation of the LlmRequest
@@ -358,6 +386,9 @@ def _build_llm_request_for_trace(llm_request: LlmRequest) -> dict[str, Any]:
 
   Args:
     llm_request: The LlmRequest object.
+    max_chars: If positive, the approximate size budget of the contents. The
+      most recent contents are kept, and the older ones are not serialized at
+      all once the budget is spent.
 
   Returns:
     A dictionary representation of the LLM request.
@@ -370,17 +401,36 @@ def _build_llm_request_for_trace(llm_request: LlmRequest) -> dict[str, Any]:
       ),
       'contents': [],
   }
-  # We do not want to send bytes data to the trace.
-  for content in llm_request.contents:
-    parts = [part for part in content.parts if not part.inline_data]
-    result['contents'].append(
-        types.Content(role=content.role, parts=parts).model_dump(
-            exclude_none=True
-        )
-    )
+  if max_chars <= 0:
+    result['contents'] = [
+        _build_content_for_trace(content) for content in llm_request.contents
+    ]
+    return result
+
+  contents = []
+  remaining_chars = max_chars
+  for content in reversed(llm_request.contents):
+    if remaining_chars <= 0:
+      break
+    content_dict = _build_content_for_trace(content)
+    remaining_chars -= len(_safe_json_serialize(content_dict))
+    contents.append(content_dict)
+  contents.reverse()
+  result['contents'] = contents
+  omitted_count = len(llm_request.contents) - len(contents)
+  if omitted_count:
+    result['omitted_contents_count'] = omitted_count
   return result
 
 
+def _build_content_for_trace(content: types.Content) -> dict[str, Any]:
+  # We do not want to send bytes data to the trace.
+  parts = [part for part in content.parts if not part.inline_data]
+  return types.Content(role=content.role, parts=parts).model_dump(
+      exclude_none=True
+  )
+
+
 # Defaults to true for now to preserve backward compatibility.
 # Once prompt and response logging is well established in ADK, we might start
 # a deprecation of request/response content in spans by switching the default
@@ -390,3 +440,47 @@ def _should_add_request_response_to_spans() -> bool:
       ADK_CAPTURE_MESSAGE_CONTENT_IN_SPANS, 'true'
   ).lower() in ('false', '0')
   return not disabled_via_env_var
+
+
+def _should_capture_payloads(span: trace.Span, is_error: bool = False) -> bool:
+  """Returns whether request and response payloads are recorded on the span.
+
+  Payloads are serialized only if this returns True, so that spans that are
+  not recorded or not sampled don't pay for the JSON encoding.
+  """
+  if not span.is_recording() or not _should_add_request_response_to_spans():
+    return False
+  return is_error or _is_payload_sampled(span)
+
+
+def _is_payload_sampled(span: trace.Span) -> bool:
+  sample_rate = _get_env_number(ADK_SPAN_PAYLOAD_SAMPLE_RATE, float, 1.0)
+  if sample_rate >= 1:
+    return True
+  if sample_rate <= 0:
+    return False
+  # Sampling by trace ID makes all the spans of a trace agree.
+  trace_id = span.get_span_context().trace_id
+  return trace_id & _TRACE_ID_LIMIT < round(sample_rate * (_TRACE_ID_LIMIT + 1))
+
+
+def _get_payload_max_chars() -> int:
+  return _get_env_number(ADK_SPAN_PAYLOAD_MAX_CHARS, int, 0)
+
+
+def _truncate_payload(payload: str) -> str:
+  max_chars = _get_payload_max_chars()
+  if max_chars <= 0 or len(payload) <= max_chars:
+    return payload
+  return f'{payload[:max_chars]}...<truncated {len(payload) - max_chars} chars>'
+
+
+def _get_env_number(name: str, number_type: type, default: Any) -> Any:
+  value = os.getenv(name)
+  if not value:
+    return default
+  try:
+    return number_type(value)
+  except ValueError:
+    logger.warning('Ignoring invalid value %r of %s.', value, name)
+    return default
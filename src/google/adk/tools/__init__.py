@@ -11,52 +11,76 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from __future__ import annotations
+
+import importlib
 import logging
 import sys
+from typing import TYPE_CHECKING
 
-from ..auth.auth_tool import AuthToolArguments
-from .agent_tool import AgentTool
-from .apihub_tool.apihub_toolset import APIHubToolset
-from .base_tool import BaseTool
-from .discovery_engine_search_tool import DiscoveryEngineSearchTool
-from .enterprise_search_tool import enterprise_web_search_tool as enterprise_web_search
-from .example_tool import ExampleTool
-from .exit_loop_tool import exit_loop
-from .function_tool import FunctionTool
-from .get_user_choice_tool import get_user_choice_tool as get_user_choice
-from .google_maps_grounding_tool import google_maps_grounding
-from .google_search_tool import google_search
-from .load_artifacts_tool import load_artifacts_tool as load_artifacts
-from .load_memory_tool import load_memory_tool as load_memory
-from .long_running_tool import LongRunningFunctionTool
-from .preload_memory_tool import preload_memory_tool as preload_memory
-from .tool_context import ToolContext
-from .transfer_to_agent_tool import transfer_to_agent
-from .url_context_tool import url_context
-from .vertex_ai_search_tool import VertexAiSearchTool
+if TYPE_CHECKING:
+  from ..auth.auth_tool import AuthToolArguments
+  from .agent_tool import AgentTool
+  from .apihub_tool.apihub_toolset import APIHubToolset
+  from .base_tool import BaseTool
+  from .discovery_engine_search_tool import DiscoveryEngineSearchTool
+  from .enterprise_search_tool import enterprise_web_search_tool as enterprise_web_search
+  from .example_tool import ExampleTool
+  from .exit_loop_tool import exit_loop
+  from .function_tool import FunctionTool
+  from .get_user_choice_tool import get_user_choice_tool as get_user_choice
+  from .google_maps_grounding_tool import google_maps_grounding
+  from .google_search_tool import google_search
+  from .load_artifacts_tool import load_artifacts_tool as load_artifacts
+  from .load_memory_tool import load_memory_tool as load_memory
+  from .long_running_tool import LongRunningFunctionTool
+  from .mcp_tool.mcp_toolset import MCPToolset
+  from .mcp_tool.mcp_toolset import McpToolset
+  from .preload_memory_tool import preload_memory_tool as preload_memory
+  from .tool_context import ToolContext
+  from .transfer_to_agent_tool import transfer_to_agent
+  from .url_context_tool import url_context
+  from .vertex_ai_search_tool import VertexAiSearchTool
 
-__all__ = [
-    'AgentTool',
-    'APIHubToolset',
-    'AuthToolArguments',
-    'BaseTool',
-    'DiscoveryEngineSearchTool',
-    'enterprise_web_search',
-    'google_maps_grounding',
-    'google_search',
-    'url_context',
-    'VertexAiSearchTool',
-    'ExampleTool',
-    'exit_loop',
-    'FunctionTool',
-    'get_user_choice',
-    'load_artifacts',
-    'load_memory',
-    'LongRunningFunctionTool',
-    'preload_memory',
-    'ToolContext',
-    'transfer_to_agent',
-]
+# Maps the exported names to their module and attribute. They are imported on
+# first access, so that using one tool doesn't import the dependencies of all
+# the others.
+_LAZY_IMPORTS = {
+    'AgentTool': ('.agent_tool', 'AgentTool'),
+    'APIHubToolset': ('.apihub_tool.apihub_toolset', 'APIHubToolset'),
+    'AuthToolArguments': ('..auth.auth_tool', 'AuthToolArguments'),
+    'BaseTool': ('.base_tool', 'BaseTool'),
+    'DiscoveryEngineSearchTool': (
+        '.discovery_engine_search_tool',
+        'DiscoveryEngineSearchTool',
+    ),
+    'enterprise_web_search': (
+        '.enterprise_search_tool',
+        'enterprise_web_search_tool',
+    ),
+    'google_maps_grounding': (
+        '.google_maps_grounding_tool',
+        'google_maps_grounding',
+    ),
+    'google_search': ('.google_search_tool', 'google_search'),
+    'url_context': ('.url_context_tool', 'url_context'),
+    'VertexAiSearchTool': ('.vertex_ai_search_tool', 'VertexAiSearchTool'),
+    'ExampleTool': ('.example_tool', 'ExampleTool'),
+    'exit_loop': ('.exit_loop_tool', 'exit_loop'),
+    'FunctionTool': ('.function_tool', 'FunctionTool'),
+    'get_user_choice': ('.get_user_choice_tool', 'get_user_choice_tool'),
+    'load_artifacts': ('.load_artifacts_tool', 'load_artifacts_tool'),
+    'load_memory': ('.load_memory_tool', 'load_memory_tool'),
+    'LongRunningFunctionTool': (
+        '.long_running_tool',
+        'LongRunningFunctionTool',
+    ),
+    'preload_memory': ('.preload_memory_tool', 'preload_memory_tool'),
+    'ToolContext': ('.tool_context', 'ToolContext'),
+    'transfer_to_agent': ('.transfer_to_agent_tool', 'transfer_to_agent'),
+}
+
+__all__ = list(_LAZY_IMPORTS)
 
 
 if sys.version_info < (3, 10):
@@ -66,10 +90,24 @@ if sys.version_info < (3, 10):
       ' version in order to use it.'
   )
 else:
-  from .mcp_tool.mcp_toolset import MCPToolset
-  from .mcp_tool.mcp_toolset import McpToolset
+  _LAZY_IMPORTS['MCPToolset'] = ('.mcp_tool.mcp_toolset', 'MCPToolset')
+  _LAZY_IMPORTS['McpToolset'] = ('.mcp_tool.mcp_toolset', 'McpToolset')
 
   __all__.extend([
       'MCPToolset',
       'McpToolset',
   ])
+
+
+def __getattr__(name: str):
+  if name not in _LAZY_IMPORTS:
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+  module_name, attribute_name = _LAZY_IMPORTS[name]
+  module = importlib.import_module(module_name, __name__)
+  value = getattr(module, attribute_name)
+  globals()[name] = value
+  return value
+
+
+def __dir__():
+  return sorted(set(globals()) | set(__all__))
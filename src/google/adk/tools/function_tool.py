@@ -14,8 +14,15 @@
 
 from __future__ import annotations
 
+import asyncio
+import atexit
+import concurrent.futures
+import contextvars
+import dataclasses
+import functools
 import inspect
 import logging
+import threading
 from typing import Any
 from typing import Callable
 from typing import get_args
@@ -27,6 +34,8 @@ from google.genai import types
 import pydantic
 from typing_extensions import override
 
+from ..agents.tool_execution_config import ToolExecutionConfig
+from ..agents.tool_execution_config import ToolExecutionMode
 from ..utils.context_utils import Aclosing
 from ._automatic_function_calling_util import build_function_declaration
 from .base_tool import BaseTool
@@ -34,6 +43,111 @@ from .tool_context import ToolContext
 
 logger = logging.getLogger('google_adk.' + __name__)
 
+# Executors shared by all function tools, keyed by execution mode and max
+# number of workers. `max_workers` is thus the size of a pool shared by every
+# tool configured with it, rather than a per-tool concurrency limit.
+_executors: dict[
+    tuple[ToolExecutionMode, Optional[int]], concurrent.futures.Executor
+] = {}
+_executors_lock = threading.Lock()
+
+
+def _get_executor(
+    mode: ToolExecutionMode, max_workers: Optional[int]
+) -> concurrent.futures.Executor:
+  """Returns the shared executor for the execution mode and max workers."""
+  key = (mode, max_workers)
+  with _executors_lock:
+    executor = _executors.get(key)
+    if executor is None:
+      if mode == ToolExecutionMode.PROCESS:
+        executor = concurrent.futures.ProcessPoolExecutor(
+            max_workers=max_workers
+        )
+      else:
+        executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix='adk_function_tool'
+        )
+      _executors[key] = executor
+    return executor
+
+
+def _shutdown_executors() -> None:
+  """Shuts down the shared executors, e.g. so that no worker process outlives
+  the runner.
+
+  The calls already submitted still complete, and the executors are created
+  again by the next calls needing them.
+  """
+  with _executors_lock:
+    executors = list(_executors.values())
+    _executors.clear()
+  for executor in executors:
+    executor.shutdown(wait=False)
+
+
+atexit.register(_shutdown_executors)
+
+
+@dataclasses.dataclass(frozen=True)
+class _CallPlan:
+  """What FunctionTool needs to know about its function to call it.
+
+  It is derived from the function signature once, instead of on every call.
+  """
+
+  func: Callable[..., Any]
+  """The function the plan was built for."""
+  signature: inspect.Signature
+  valid_params: frozenset[str]
+  """The names of all parameters of the function."""
+  mandatory_args: tuple[str, ...]
+  """The names of parameters without default values."""
+  is_async: bool
+  pydantic_params: dict[str, type[pydantic.BaseModel]]
+  """The Pydantic model each Pydantic-typed parameter is converted to."""
+
+  @classmethod
+  def build(cls, func: Callable[..., Any]) -> _CallPlan:
+    signature = inspect.signature(func)
+    mandatory_args = []
+    pydantic_params = {}
+    for name, param in signature.parameters.items():
+      # A parameter is mandatory if:
+      # 1. It has no default value (param.default is inspect.Parameter.empty)
+      # 2. It's not a variable positional (*args) or variable keyword (**kwargs) parameter
+      #
+      # For more refer to: https://docs.python.org/3/library/inspect.html#inspect.Parameter.kind
+      if param.default == inspect.Parameter.empty and param.kind not in (
+          inspect.Parameter.VAR_POSITIONAL,
+          inspect.Parameter.VAR_KEYWORD,
+      ):
+        mandatory_args.append(name)
+
+      if param.annotation == inspect.Parameter.empty:
+        continue
+      target_type = param.annotation
+      # Handle Optional[PydanticModel] types
+      if get_origin(param.annotation) is Union:
+        union_args = get_args(param.annotation)
+        # Find the non-None type in Optional[T] (which is Union[T, None])
+        non_none_types = [arg for arg in union_args if arg is not type(None)]
+        if len(non_none_types) == 1:
+          target_type = non_none_types[0]
+      if inspect.isclass(target_type) and issubclass(
+          target_type, pydantic.BaseModel
+      ):
+        pydantic_params[name] = target_type
+
+    return cls(
+        func=func,
+        signature=signature,
+        valid_params=frozenset(signature.parameters),
+        mandatory_args=tuple(mandatory_args),
+        is_async=_is_async_callable(func),
+        pydantic_params=pydantic_params,
+    )
+
 
 class FunctionTool(BaseTool):
   """A tool that wraps a user-defined Python function.
@@ -47,6 +161,7 @@ class FunctionTool(BaseTool):
       func: Callable[..., Any],
       *,
       require_confirmation: Union[bool, Callable[..., bool]] = False,
+      execution_config: Optional[ToolExecutionConfig] = None,
   ):
     """Initializes the FunctionTool. Extracts metadata from a callable object.
 
@@ -56,6 +171,9 @@ class FunctionTool(BaseTool):
         a callable that takes the function's arguments and returns a boolean. If
         the callable returns True, the tool will require confirmation from the
         user.
+      execution_config: How to execute the function if it is synchronous, e.g.
+        in a thread pool. Defaults to the `tool_execution_config` of the run
+        config.
     """
     name = ''
     doc = ''
@@ -82,6 +200,15 @@ class FunctionTool(BaseTool):
     self.func = func
     self._ignore_params = ['tool_context', 'input_stream']
     self._require_confirmation = require_confirmation
+    self._execution_config = execution_config
+    self._call_plan: Optional[_CallPlan] = None
+
+  def _get_call_plan(self) -> _CallPlan:
+    """Returns the call plan of the function, building it on first use."""
+    # Subclasses may replace `func` after initialization.
+    if self._call_plan is None or self._call_plan.func is not self.func:
+      self._call_plan = _CallPlan.build(self.func)
+    return self._call_plan
 
   @override
   def _get_declaration(self) -> Optional[types.FunctionDeclaration]:
@@ -114,42 +241,31 @@ class FunctionTool(BaseTool):
     Returns:
       Processed arguments ready for function invocation
     """
-    signature = inspect.signature(self.func)
     converted_args = args.copy()
 
-    for param_name, param in signature.parameters.items():
-      if param_name in args and param.annotation != inspect.Parameter.empty:
-        target_type = param.annotation
-
-        # Handle Optional[PydanticModel] types
-        if get_origin(param.annotation) is Union:
-          union_args = get_args(param.annotation)
-          # Find the non-None type in Optional[T] (which is Union[T, None])
-          non_none_types = [arg for arg in union_args if arg is not type(None)]
-          if len(non_none_types) == 1:
-            target_type = non_none_types[0]
-
-        # Check if the target type is a Pydantic model
-        if inspect.isclass(target_type) and issubclass(
-            target_type, pydantic.BaseModel
-        ):
-          # Skip conversion if the value is None and the parameter is Optional
-          if args[param_name] is None:
-            continue
-
-          # Convert to Pydantic model if it's not already the correct type
-          if not isinstance(args[param_name], target_type):
-            try:
-              converted_args[param_name] = target_type.model_validate(
-                  args[param_name]
-              )
-            except Exception as e:
-              logger.warning(
-                  f"Failed to convert argument '{param_name}' to Pydantic model"
-                  f' {target_type.__name__}: {e}'
-              )
-              # Keep the original value if conversion fails
-              pass
+    for (
+        param_name,
+        target_type,
+    ) in self._get_call_plan().pydantic_params.items():
+      if param_name not in args:
+        continue
+      # Skip conversion if the value is None and the parameter is Optional
+      if args[param_name] is None:
+        continue
+
+      # Convert to Pydantic model if it's not already the correct type
+      if not isinstance(args[param_name], target_type):
+        try:
+          converted_args[param_name] = target_type.model_validate(
+              args[param_name]
+          )
+        except Exception as e:
+          logger.warning(
+              f"Failed to convert argument '{param_name}' to Pydantic model"
+              f' {target_type.__name__}: {e}'
+          )
+          # Keep the original value if conversion fails
+          pass
 
     return converted_args
 
@@ -160,8 +276,8 @@ class FunctionTool(BaseTool):
     # Preprocess arguments (includes Pydantic model conversion)
     args_to_call = self._preprocess_args(args)
 
-    signature = inspect.signature(self.func)
-    valid_params = {param for param in signature.parameters}
+    call_plan = self._get_call_plan()
+    valid_params = call_plan.valid_params
     if 'tool_context' in valid_params:
       args_to_call['tool_context'] = tool_context
 
@@ -173,7 +289,7 @@ class FunctionTool(BaseTool):
     # If the check fails, then we don't invoke the tool and let the Agent know
     # that there was a missing input parameter. This will basically help
     # the underlying model fix the issue and retry.
-    mandatory_args = self._get_mandatory_args()
+    mandatory_args = call_plan.mandatory_args
     missing_mandatory_args = [
         arg for arg in mandatory_args if arg not in args_to_call
     ]
@@ -215,21 +331,63 @@ You could retry calling this tool, but it is IMPORTANT for you to provide all th
       elif not tool_context.tool_confirmation.confirmed:
         return {'error': 'This tool call is rejected.'}
 
-    return await self._invoke_callable(self.func, args_to_call)
+    execution_config = self._get_execution_config(tool_context)
+    if (
+        execution_config
+        and execution_config.mode
+        in (ToolExecutionMode.THREAD, ToolExecutionMode.PROCESS)
+        and not call_plan.is_async
+    ):
+      return await self._invoke_in_executor(args_to_call, execution_config)
+    if call_plan.is_async:
+      return await self.func(**args_to_call)
+    return self.func(**args_to_call)
+
+  def _get_execution_config(
+      self, tool_context: ToolContext
+  ) -> Optional[ToolExecutionConfig]:
+    """Returns the tool's execution config, or the run config's default."""
+    if self._execution_config:
+      return self._execution_config
+    run_config = tool_context.run_config
+    return run_config.tool_execution_config if run_config else None
+
+  async def _invoke_in_executor(
+      self,
+      args_to_call: dict[str, Any],
+      execution_config: ToolExecutionConfig,
+  ) -> Any:
+    """Invokes the synchronous function off the event loop."""
+    mode = execution_config.mode
+    if mode == ToolExecutionMode.PROCESS and 'tool_context' in args_to_call:
+      # The tool context can't be sent to another process.
+      mode = ToolExecutionMode.THREAD
+    executor = _get_executor(mode, execution_config.max_workers)
+
+    call = functools.partial(self.func, **args_to_call)
+    if mode == ToolExecutionMode.THREAD:
+      # Propagate context variables, e.g. the current tracing span.
+      call = functools.partial(contextvars.copy_context().run, call)
+
+    future = asyncio.get_running_loop().run_in_executor(executor, call)
+    try:
+      return await asyncio.wait_for(
+          future, timeout=execution_config.timeout_seconds
+      )
+    except asyncio.TimeoutError:
+      return {
+          'error': (
+              f'Invoking `{self.name}()` timed out after'
+              f' {execution_config.timeout_seconds} seconds.'
+          )
+      }
 
   async def _invoke_callable(
       self, target: Callable[..., Any], args_to_call: dict[str, Any]
   ) -> Any:
     """Invokes a callable, handling both sync and async cases."""
 
-    # Functions are callable objects, but not all callable objects are functions
-    # checking coroutine function is not enough. We also need to check whether
-    # Callable's __call__ function is a coroutine function
-    is_async = inspect.iscoroutinefunction(target) or (
-        hasattr(target, '__call__')
-        and inspect.iscoroutinefunction(target.__call__)
-    )
-    if is_async:
+    if _is_async_callable(target):
       return await target(**args_to_call)
     else:
       return target(**args_to_call)
@@ -243,7 +401,7 @@ You could retry calling this tool, but it is IMPORTANT for you to provide all th
       invocation_context,
   ) -> Any:
     args_to_call = args.copy()
-    signature = inspect.signature(self.func)
+    signature = self._get_call_plan().signature
     if (
         self.name in invocation_context.active_streaming_tools
         and invocation_context.active_streaming_tools[self.name].stream
@@ -267,19 +425,15 @@ You could retry calling this tool, but it is IMPORTANT for you to provide all th
     Returns:
       A list of strings, where each string is the name of a mandatory parameter.
     """
-    signature = inspect.signature(self.func)
-    mandatory_params = []
-
-    for name, param in signature.parameters.items():
-      # A parameter is mandatory if:
-      # 1. It has no default value (param.default is inspect.Parameter.empty)
-      # 2. It's not a variable positional (*args) or variable keyword (**kwargs) parameter
-      #
-      # For more refer to: https://docs.python.org/3/library/inspect.html#inspect.Parameter.kind
-      if param.default == inspect.Parameter.empty and param.kind not in (
-          inspect.Parameter.VAR_POSITIONAL,
-          inspect.Parameter.VAR_KEYWORD,
-      ):
-        mandatory_params.append(name)
-
-    return mandatory_params
+    return list(self._get_call_plan().mandatory_args)
+
+
+def _is_async_callable(target: Callable[..., Any]) -> bool:
+  """Returns whether calling the target returns a coroutine."""
+  # Functions are callable objects, but not all callable objects are functions
+  # checking coroutine function is not enough. We also need to check whether
+  # Callable's __call__ function is a coroutine function
+  return inspect.iscoroutinefunction(target) or (
+      hasattr(target, '__call__')
+      and inspect.iscoroutinefunction(target.__call__)
+  )
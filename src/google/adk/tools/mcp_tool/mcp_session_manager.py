@@ -23,6 +23,8 @@ import json
 import logging
 import sys
 from typing import Any
+from typing import Awaitable
+from typing import Callable
 from typing import Dict
 from typing import Optional
 from typing import TextIO
@@ -152,6 +154,7 @@ class MCPSessionManager:
           StreamableHTTPConnectionParams,
       ],
       errlog: TextIO = sys.stderr,
+      message_handler: Optional[Callable[[Any], Awaitable[None]]] = None,
   ):
     """Initializes the MCP session manager.
 
@@ -161,6 +164,8 @@ class MCPSessionManager:
           parameters but it's not configurable for now.
         errlog: (Optional) TextIO stream for error logging. Use only for
           initializing a local stdio MCP session.
+        message_handler: (Optional) Async callback receiving the incoming
+          messages of every session, e.g. server notifications.
     """
     if isinstance(connection_params, StdioServerParameters):
       # So far timeout is not configurable. Given MCP is still evolving, we
@@ -177,6 +182,7 @@ class MCPSessionManager:
     else:
       self._connection_params = connection_params
     self._errlog = errlog
+    self._message_handler = message_handler
 
     # Session pool: maps session keys to (session, exit_stack) tuples
     self._sessions: Dict[str, tuple[ClientSession, AsyncExitStack]] = {}
@@ -353,11 +359,14 @@ class MCPSessionManager:
                   read_timeout_seconds=timedelta(
                       seconds=self._connection_params.timeout
                   ),
+                  message_handler=self._message_handler,
               )
           )
         else:
           session = await exit_stack.enter_async_context(
-              ClientSession(*transports[:2])
+              ClientSession(
+                  *transports[:2], message_handler=self._message_handler
+              )
           )
         await session.initialize()
 
@@ -14,8 +14,12 @@
 
 from __future__ import annotations
 
+import collections
+import json
 import logging
 import sys
+import time
+from typing import Any
 from typing import Callable
 from typing import Dict
 from typing import List
@@ -44,8 +48,11 @@ from .mcp_session_manager import StreamableHTTPConnectionParams
 # Attempt to import MCP Tool from the MCP library, and hints user to upgrade
 # their Python version to 3.10 if it fails.
 try:
+  from mcp import ClientSession
   from mcp import StdioServerParameters
   from mcp.types import ListToolsResult
+  from mcp.types import ServerNotification
+  from mcp.types import ToolListChangedNotification
 except ImportError as e:
   import sys
 
@@ -61,6 +68,20 @@ from .mcp_tool import MCPTool
 
 logger = logging.getLogger("google_adk." + __name__)
 
+_MAX_TOOL_LIST_CACHE_ENTRIES = 128
+"""The maximum number of sets of session headers with cached tools."""
+
+
+class _ToolListCacheEntry:
+  """The tools listed by an MCP session, cached by McpToolset."""
+
+  def __init__(
+      self, session: ClientSession, tools: List[MCPTool], expires_at: float
+  ):
+    self.session = session
+    self.tools = tools
+    self.expires_at = expires_at
+
 
 class McpToolset(BaseToolset):
   """Connects to a MCP Server, and retrieves MCP Tools into ADK Tools.
@@ -110,6 +131,7 @@ class McpToolset(BaseToolset):
       header_provider: Optional[
           Callable[[ReadonlyContext], Dict[str, str]]
       ] = None,
+      tool_list_cache_ttl_seconds: Optional[float] = None,
   ):
     """Initializes the McpToolset.
 
@@ -135,6 +157,13 @@ class McpToolset(BaseToolset):
         tools.
       header_provider: A callable that takes a ReadonlyContext and returns a
         dictionary of headers to be used for the MCP session.
+      tool_list_cache_ttl_seconds: If set, the tools listed by the MCP server
+        are cached for this many seconds per set of session headers, so
+        `get_tools` doesn't call the server on every LLM step. The cache is
+        invalidated when the server sends a `notifications/tools/list_changed`
+        notification or the session is recreated. Expired entries are evicted
+        whenever tools are cached, and the least recently used entries once
+        more than 128 sets of headers, e.g. per-user tokens, are cached.
     """
     super().__init__(tool_filter=tool_filter, tool_name_prefix=tool_name_prefix)
 
@@ -149,10 +178,25 @@ class McpToolset(BaseToolset):
     self._mcp_session_manager = MCPSessionManager(
         connection_params=self._connection_params,
         errlog=self._errlog,
+        message_handler=self._handle_message,
     )
     self._auth_scheme = auth_scheme
     self._auth_credential = auth_credential
     self._require_confirmation = require_confirmation
+    self._tool_list_cache_ttl_seconds = tool_list_cache_ttl_seconds
+    # A map from the serialized session headers to the cached tools, from the
+    # least to the most recently used.
+    self._tool_list_cache: collections.OrderedDict[str, _ToolListCacheEntry] = (
+        collections.OrderedDict()
+    )
+
+  async def _handle_message(self, message: Any) -> None:
+    """Invalidates the tool list cache when the server's tools change."""
+    if isinstance(message, ServerNotification) and isinstance(
+        message.root, ToolListChangedNotification
+    ):
+      logger.debug("MCP tool list changed, invalidating the tool list cache.")
+      self._tool_list_cache.clear()
 
   @retry_on_closed_resource
   async def get_tools(
@@ -176,25 +220,66 @@ class McpToolset(BaseToolset):
     # Get session from session manager
     session = await self._mcp_session_manager.create_session(headers=headers)
 
-    # Fetch available tools from the MCP server
-    tools_response: ListToolsResult = await session.list_tools()
-
     # Apply filtering based on context and tool_filter
     tools = []
-    for tool in tools_response.tools:
-      mcp_tool = MCPTool(
-          mcp_tool=tool,
-          mcp_session_manager=self._mcp_session_manager,
-          auth_scheme=self._auth_scheme,
-          auth_credential=self._auth_credential,
-          require_confirmation=self._require_confirmation,
-          header_provider=self._header_provider,
-      )
-
+    for mcp_tool in await self._list_tools(session, headers):
       if self._is_tool_selected(mcp_tool, readonly_context):
         tools.append(mcp_tool)
     return tools
 
+  async def _list_tools(
+      self, session: ClientSession, headers: Optional[Dict[str, str]]
+  ) -> List[MCPTool]:
+    """Lists the tools of the MCP server, using the cache if enabled."""
+    cache_key = json.dumps(headers, sort_keys=True) if headers else ""
+    if self._tool_list_cache_ttl_seconds is not None:
+      entry = self._tool_list_cache.get(cache_key)
+      if (
+          entry
+          and entry.session is session
+          and entry.expires_at > time.monotonic()
+      ):
+        self._tool_list_cache.move_to_end(cache_key)
+        return entry.tools
+
+    # Fetch available tools from the MCP server
+    tools_response: ListToolsResult = await session.list_tools()
+    tools = [
+        MCPTool(
+            mcp_tool=tool,
+            mcp_session_manager=self._mcp_session_manager,
+            auth_scheme=self._auth_scheme,
+            auth_credential=self._auth_credential,
+            require_confirmation=self._require_confirmation,
+            header_provider=self._header_provider,
+        )
+        for tool in tools_response.tools
+    ]
+
+    if self._tool_list_cache_ttl_seconds is not None:
+      self._cache_tool_list(cache_key, session, tools)
+    return tools
+
+  def _cache_tool_list(
+      self, cache_key: str, session: ClientSession, tools: List[MCPTool]
+  ) -> None:
+    """Caches the listed tools, evicting the expired and oldest entries."""
+    now = time.monotonic()
+    for key in [
+        key
+        for key, entry in self._tool_list_cache.items()
+        if entry.expires_at <= now
+    ]:
+      del self._tool_list_cache[key]
+    self._tool_list_cache.pop(cache_key, None)
+    self._tool_list_cache[cache_key] = _ToolListCacheEntry(
+        session=session,
+        tools=tools,
+        expires_at=now + self._tool_list_cache_ttl_seconds,
+    )
+    while len(self._tool_list_cache) > _MAX_TOOL_LIST_CACHE_ENTRIES:
+      self._tool_list_cache.popitem(last=False)
+
   async def close(self) -> None:
     """Performs cleanup and releases resources held by the toolset.
 
@@ -202,6 +287,7 @@ class McpToolset(BaseToolset):
     It's designed to be safe to call multiple times and handles cleanup errors
     gracefully to avoid blocking application shutdown.
     """
+    self._tool_list_cache.clear()
     try:
       await self._mcp_session_manager.close()
     except Exception as e:
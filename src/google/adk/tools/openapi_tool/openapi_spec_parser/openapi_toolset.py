@@ -30,6 +30,8 @@ import yaml
 from ....agents.readonly_context import ReadonlyContext
 from ....auth.auth_credential import AuthCredential
 from ....auth.auth_schemes import AuthScheme
+from ....utils.http_transport import HttpTransport
+from ....utils.http_transport import HttpTransportConfig
 from ...base_toolset import BaseToolset
 from ...base_toolset import ToolPredicate
 from .openapi_spec_parser import OpenApiSpecParser
@@ -68,6 +70,7 @@ class OpenAPIToolset(BaseToolset):
       auth_scheme: Optional[AuthScheme] = None,
       auth_credential: Optional[AuthCredential] = None,
       tool_filter: Optional[Union[ToolPredicate, List[str]]] = None,
+      http_transport_config: Optional[HttpTransportConfig] = None,
   ):
     """Initializes the OpenAPIToolset.
 
@@ -102,10 +105,13 @@ class OpenAPIToolset(BaseToolset):
         ``google.adk.tools.openapi_tool.auth.auth_helpers``
       tool_filter: The filter used to filter the tools in the toolset. It can be
         either a tool predicate or a list of tool names of the tools to expose.
+      http_transport_config: The configuration of the connection pool, timeouts
+        and retries of the transport shared by the tools of the toolset.
     """
     super().__init__(tool_filter=tool_filter)
     if not spec_dict:
       spec_dict = self._load_spec(spec_str, spec_str_type)
+    self._http_transport = HttpTransport(http_transport_config)
     self._tools: Final[List[RestApiTool]] = list(self._parse(spec_dict))
     if auth_scheme or auth_credential:
       self._configure_auth_all(auth_scheme, auth_credential)
@@ -155,10 +161,11 @@ class OpenAPIToolset(BaseToolset):
     tools = []
     for o in operations:
       tool = RestApiTool.from_parsed_operation(o)
+      tool.set_http_transport(self._http_transport)
       logger.info("Parsed tool: %s", tool.name)
       tools.append(tool)
     return tools
 
   @override
   async def close(self):
-    pass
+    await self._http_transport.aclose()
@@ -24,11 +24,13 @@ from typing import Union
 
 from fastapi.openapi.models import Operation
 from google.genai.types import FunctionDeclaration
-import requests
+import httpx
 from typing_extensions import override
 
 from ....auth.auth_credential import AuthCredential
 from ....auth.auth_schemes import AuthScheme
+from ....utils.http_transport import get_default_http_transport
+from ....utils.http_transport import HttpTransport
 from ..._gemini_schema_util import _to_gemini_schema
 from ..._gemini_schema_util import _to_snake_case
 from ...base_tool import BaseTool
@@ -61,6 +63,20 @@ def snake_to_lower_camel(snake_case_string: str):
   ])
 
 
+def _to_httpx_request_params(request_params: Dict[str, Any]) -> Dict[str, Any]:
+  """Converts the arguments of `requests.request()` to those of httpx."""
+  params = dict(request_params)
+  # httpx takes raw bodies as `content`, and deprecates per-request cookies.
+  if isinstance(params.get("data"), (str, bytes)):
+    params["content"] = params.pop("data")
+  cookies = params.pop("cookies", None)
+  if cookies:
+    headers = dict(params.get("headers") or {})
+    headers["Cookie"] = "; ".join(f"{k}={v}" for k, v in cookies.items())
+    params["headers"] = headers
+  return params
+
+
 AuthPreparationState = Literal["pending", "done"]
 
 
@@ -87,6 +103,7 @@ class RestApiTool(BaseTool):
       auth_scheme: Optional[Union[AuthScheme, str]] = None,
       auth_credential: Optional[Union[AuthCredential, str]] = None,
       should_parse_operation=True,
+      http_transport: Optional[HttpTransport] = None,
   ):
     """Initializes the RestApiTool with the given parameters.
 
@@ -113,6 +130,8 @@ class RestApiTool(BaseTool):
           (https://github.com/OAI/OpenAPI-Specification/blob/main/versions/3.1.0.md#security-scheme-object)
         auth_credential: The authentication credential of the tool.
         should_parse_operation: Whether to parse the operation.
+        http_transport: The transport sending the API requests. Defaults to a
+          transport shared by all the tools without one.
     """
     # Gemini restrict the length of function name to be less than 64 characters
     self.name = name[:60]
@@ -135,6 +154,7 @@ class RestApiTool(BaseTool):
     # Private properties
     self.credential_exchanger = AutoAuthCredentialExchanger()
     self._default_headers: Dict[str, str] = {}
+    self._http_transport = http_transport
     if should_parse_operation:
       self._operation_parser = OperationParser(self.operation)
 
@@ -221,6 +241,10 @@ class RestApiTool(BaseTool):
     """Sets default headers that are merged into every request."""
     self._default_headers = headers
 
+  def set_http_transport(self, http_transport: Optional[HttpTransport]):
+    """Sets the transport sending the API requests."""
+    self._http_transport = http_transport
+
   def _prepare_auth_request_params(
       self,
       auth_scheme: AuthScheme,
@@ -244,8 +268,8 @@ class RestApiTool(BaseTool):
           caller.
 
     Returns:
-        A dictionary containing the  request parameters for the API call. This
-        initializes a requests.request() call.
+        A dictionary containing the  request parameters for the API call, as
+        arguments of a requests.request() call.
 
     Example:
         self._prepare_request_params({"input_id": "test-id"})
@@ -403,13 +427,16 @@ class RestApiTool(BaseTool):
 
     # Got all parameters. Call the API.
     request_params = self._prepare_request_params(api_params, api_args)
-    response = requests.request(**request_params)
+    http_transport = self._http_transport or get_default_http_transport()
+    response = await http_transport.request(
+        **_to_httpx_request_params(request_params)
+    )
 
     # Parse API response
     try:
-      response.raise_for_status()  # Raise HTTPError for bad responses
+      response.raise_for_status()  # Raise HTTPStatusError for bad responses
       return response.json()  # Try to decode JSON
-    except requests.exceptions.HTTPError:
+    except httpx.HTTPStatusError:
       error_details = response.content.decode("utf-8")
       return {
           "error": (
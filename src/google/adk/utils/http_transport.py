@@ -0,0 +1,248 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""An async HTTP transport with connection pooling and retries."""
+
+from __future__ import annotations
+
+import asyncio
+import datetime
+import email.utils
+import importlib.util
+import logging
+import random
+import threading
+from typing import Any
+from typing import Optional
+import weakref
+
+import httpx
+from pydantic import BaseModel
+from pydantic import ConfigDict
+from pydantic import Field
+
+logger = logging.getLogger('google_adk.' + __name__)
+
+_IDEMPOTENT_METHODS = frozenset(
+    ['GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE', 'TRACE']
+)
+_RETRYABLE_STATUS_CODES = frozenset([429, 502, 503, 504])
+_RETRY_AFTER_STATUS_CODES = frozenset([429, 503])
+
+
+class HttpTransportConfig(BaseModel):
+  """The configuration of an `HttpTransport`."""
+
+  model_config = ConfigDict(extra='forbid')
+
+  timeout_seconds: Optional[float] = Field(default=None, gt=0)
+  """The timeout of reading, writing and acquiring a pooled connection. None,
+  the default, waits indefinitely, as slow APIs may legitimately take long to
+  respond. A timeout can also be passed to each request."""
+
+  connect_timeout_seconds: float = Field(default=10.0, gt=0)
+  """The timeout of establishing a connection."""
+
+  max_connections: int = Field(default=100, ge=1)
+  """The maximum number of concurrent connections."""
+
+  max_keepalive_connections: int = Field(default=20, ge=0)
+  """The maximum number of idle connections kept alive."""
+
+  keepalive_expiry_seconds: float = Field(default=30.0, ge=0)
+  """How long an idle connection is kept alive."""
+
+  http2: bool = True
+  """Whether to use HTTP/2 when the server supports it. Requires the `h2`
+  package, and is ignored if it isn't installed."""
+
+  max_retries: int = Field(default=2, ge=0)
+  """The maximum number of retries of a request with an idempotent method,
+  after a connection error or a 429, 502, 503 or 504 status."""
+
+  retry_backoff_seconds: float = Field(default=0.5, ge=0)
+  """The maximum delay before the first retry. The maximum delay doubles
+  after each retry, and the actual delay is random below it.
+
+  A 429 or 503 response with a `Retry-After` header is instead retried after
+  the delay the server asked for."""
+
+  max_retry_backoff_seconds: float = Field(default=8.0, ge=0)
+  """The upper bound of the delay between retries. A response asking to retry
+  later than this is returned without retrying."""
+
+
+def _is_http2_available() -> bool:
+  return importlib.util.find_spec('h2') is not None
+
+
+class HttpTransport:
+  """Sends HTTP requests over pooled connections, retrying idempotent ones.
+
+  The connections are pooled by an `httpx.AsyncClient`. As a client can only
+  be used on the event loop it was first used on, a client is created for each
+  event loop sending requests.
+
+  This class is thread-safe.
+  """
+
+  def __init__(self, config: Optional[HttpTransportConfig] = None):
+    self._config = config or HttpTransportConfig()
+    self._clients: weakref.WeakKeyDictionary[
+        asyncio.AbstractEventLoop, httpx.AsyncClient
+    ] = weakref.WeakKeyDictionary()
+    self._lock = threading.Lock()
+
+  @property
+  def config(self) -> HttpTransportConfig:
+    return self._config
+
+  async def request(
+      self,
+      method: str,
+      url: str,
+      *,
+      max_retries: Optional[int] = None,
+      **kwargs: Any,
+  ) -> httpx.Response:
+    """Sends a request.
+
+    Args:
+      method: The HTTP method.
+      url: The URL of the request.
+      max_retries: Overrides the `max_retries` of the config for this request.
+      **kwargs: The other arguments of `httpx.AsyncClient.request`, e.g.
+        `follow_redirects=False` to not follow the redirects of this request.
+
+    Returns:
+      The response. Error statuses are returned rather than raised.
+
+    Raises:
+      httpx.TransportError: If the request failed after all the retries.
+    """
+    client = self._get_client()
+    if max_retries is None:
+      max_retries = self._config.max_retries
+    retries = max_retries if method.upper() in _IDEMPOTENT_METHODS else 0
+    attempt = 0
+    while True:
+      try:
+        response = await client.request(method, url, **kwargs)
+      except httpx.TransportError as e:
+        if attempt >= retries:
+          raise
+        logger.debug('Retrying %s %s after error: %r', method, url, e)
+        delay = self._get_retry_delay(attempt)
+      else:
+        if (
+            response.status_code not in _RETRYABLE_STATUS_CODES
+            or attempt >= retries
+        ):
+          return response
+        delay = _get_retry_after(response)
+        if delay is None:
+          delay = self._get_retry_delay(attempt)
+        elif delay > self._config.max_retry_backoff_seconds:
+          return response
+        logger.debug(
+            'Retrying %s %s in %.2fs after status %d.',
+            method,
+            url,
+            delay,
+            response.status_code,
+        )
+        await response.aclose()
+      await asyncio.sleep(delay)
+      attempt += 1
+
+  async def aclose(self):
+    """Closes the pooled connections."""
+    with self._lock:
+      clients = list(self._clients.items())
+      self._clients.clear()
+    current_loop = asyncio.get_running_loop()
+    for loop, client in clients:
+      if loop is current_loop:
+        await client.aclose()
+      elif loop.is_running():
+        await asyncio.wrap_future(
+            asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+        )
+      # The connections of the closed event loops are already unusable.
+
+  def _get_client(self) -> httpx.AsyncClient:
+    loop = asyncio.get_running_loop()
+    with self._lock:
+      client = self._clients.get(loop)
+      if client is None or client.is_closed:
+        client = self._clients[loop] = self._create_client()
+      return client
+
+  def _create_client(self) -> httpx.AsyncClient:
+    config = self._config
+    http2 = config.http2 and _is_http2_available()
+    if config.http2 and not http2:
+      logger.debug('The h2 package is not installed, HTTP/2 is disabled.')
+    return httpx.AsyncClient(
+        http2=http2,
+        follow_redirects=True,
+        limits=httpx.Limits(
+            max_connections=config.max_connections,
+            max_keepalive_connections=config.max_keepalive_connections,
+            keepalive_expiry=config.keepalive_expiry_seconds,
+        ),
+        timeout=httpx.Timeout(
+            config.timeout_seconds, connect=config.connect_timeout_seconds
+        ),
+    )
+
+  def _get_retry_delay(self, attempt: int) -> float:
+    max_delay = min(
+        self._config.max_retry_backoff_seconds,
+        self._config.retry_backoff_seconds * 2**attempt,
+    )
+    return random.uniform(0, max_delay)
+
+
+def _get_retry_after(response: httpx.Response) -> Optional[float]:
+  """Returns the delay in seconds asked by the `Retry-After` header, if any."""
+  if response.status_code not in _RETRY_AFTER_STATUS_CODES:
+    return None
+  value = response.headers.get('Retry-After')
+  if not value:
+    return None
+  value = value.strip()
+  if value.isdigit():
+    return float(value)
+  try:
+    retry_at = email.utils.parsedate_to_datetime(value)
+  except (TypeError, ValueError):
+    return None
+  if retry_at.tzinfo is None:
+    retry_at = retry_at.replace(tzinfo=datetime.timezone.utc)
+  now = datetime.datetime.now(datetime.timezone.utc)
+  return max(0.0, (retry_at - now).total_seconds())
+
+
+_default_transport: Optional[HttpTransport] = None
+_default_transport_lock = threading.Lock()
+
+
+def get_default_http_transport() -> HttpTransport:
+  """Returns the transport shared by the clients without their own."""
+  global _default_transport
+  with _default_transport_lock:
+    if _default_transport is None:
+      _default_transport = HttpTransport()
+    return _default_transport
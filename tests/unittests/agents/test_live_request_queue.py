@@ -1,9 +1,11 @@
+import asyncio
 from unittest.mock import AsyncMock
 from unittest.mock import MagicMock
 from unittest.mock import patch
 
 from google.adk.agents.live_request_queue import LiveRequest
 from google.adk.agents.live_request_queue import LiveRequestQueue
+from google.adk.agents.live_request_queue import OverflowPolicy
 from google.genai import types
 import pytest
 
@@ -54,3 +56,102 @@ async def test_get():
 
     assert result == res
     mock_get.assert_called_once()
+
+
+def _audio_blob(data: bytes) -> types.Blob:
+  return types.Blob(data=data, mime_type="audio/pcm")
+
+
+@pytest.mark.asyncio
+async def test_drop_oldest_keeps_latest_blobs_and_control_requests():
+  queue = LiveRequestQueue(
+      max_queued_blobs=2, overflow_policy=OverflowPolicy.DROP_OLDEST
+  )
+  queue.send_realtime(_audio_blob(b"1"))
+  queue.send_activity_end()
+  queue.send_realtime(_audio_blob(b"2"))
+  queue.send_realtime(_audio_blob(b"3"))
+  queue.close()
+
+  assert [await queue.get() for _ in range(4)] == [
+      LiveRequest(activity_end=types.ActivityEnd()),
+      LiveRequest(blob=_audio_blob(b"2")),
+      LiveRequest(blob=_audio_blob(b"3")),
+      LiveRequest(close=True),
+  ]
+  stats = queue.get_stats()
+  assert stats.dropped_blobs == 1
+  assert stats.depth == 0
+
+
+@pytest.mark.asyncio
+async def test_coalesce_audio_merges_adjacent_blobs():
+  queue = LiveRequestQueue(
+      max_queued_blobs=1, overflow_policy=OverflowPolicy.COALESCE_AUDIO
+  )
+  queue.send_realtime(_audio_blob(b"12"))
+  queue.send_realtime(_audio_blob(b"34"))
+
+  assert queue.get_stats().coalesced_blobs == 1
+  assert await queue.get() == LiveRequest(blob=_audio_blob(b"1234"))
+
+
+@pytest.mark.asyncio
+async def test_coalesce_audio_drops_oldest_past_size_cap():
+  queue = LiveRequestQueue(
+      max_queued_blobs=1,
+      overflow_policy=OverflowPolicy.COALESCE_AUDIO,
+      max_coalesced_blob_bytes=4,
+  )
+  queue.send_realtime(_audio_blob(b"12"))
+  queue.send_realtime(_audio_blob(b"34"))
+  queue.send_realtime(_audio_blob(b"56"))
+
+  stats = queue.get_stats()
+  assert stats.coalesced_blobs == 1
+  assert stats.dropped_blobs == 1
+  assert await queue.get() == LiveRequest(blob=_audio_blob(b"56"))
+
+
+@pytest.mark.parametrize(
+    "overflow_policy",
+    [OverflowPolicy.DROP_OLDEST, OverflowPolicy.COALESCE_AUDIO],
+)
+@pytest.mark.asyncio
+async def test_join_returns_after_dropped_and_coalesced_blobs(
+    overflow_policy,
+):
+  queue = LiveRequestQueue(
+      max_queued_blobs=1,
+      overflow_policy=overflow_policy,
+      max_coalesced_blob_bytes=4,
+  )
+  for data in [b"12", b"34", b"56"]:
+    queue.send_realtime(_audio_blob(data))
+
+  while queue.get_stats().depth:
+    await queue.get()
+    queue._queue.task_done()
+
+  await asyncio.wait_for(queue._queue.join(), timeout=5)
+
+
+@pytest.mark.asyncio
+async def test_block_policy_waits_for_capacity():
+  queue = LiveRequestQueue(max_queued_blobs=1)
+  queue.send_realtime(_audio_blob(b"1"))
+
+  with pytest.raises(asyncio.QueueFull):
+    queue.send_realtime(_audio_blob(b"2"))
+
+  send_task = asyncio.create_task(
+      queue.send_async(LiveRequest(blob=_audio_blob(b"2")))
+  )
+  await asyncio.sleep(0)
+  assert not send_task.done()
+  assert queue.get_stats().queued_blobs == 1
+
+  assert await queue.get() == LiveRequest(blob=_audio_blob(b"1"))
+  await asyncio.wait_for(send_task, timeout=5)
+  assert await queue.get() == LiveRequest(blob=_audio_blob(b"2"))
+  assert queue.get_stats().last_request_lag_seconds >= 0
@@ -16,6 +16,7 @@
 
 from datetime import datetime
 import enum
+import tempfile
 from typing import Any
 from typing import Optional
 from typing import Union
@@ -23,6 +24,7 @@ from unittest import mock
 from unittest.mock import patch
 
 from google.adk.artifacts.base_artifact_service import ArtifactVersion
+from google.adk.artifacts.file_artifact_service import FileArtifactService
 from google.adk.artifacts.gcs_artifact_service import GcsArtifactService
 from google.adk.artifacts.in_memory_artifact_service import InMemoryArtifactService
 from google.genai import types
@@ -37,6 +39,7 @@ FIXED_DATETIME = datetime(2025, 1, 1, 12, 0, 0)
 class ArtifactServiceType(Enum):
   IN_MEMORY = "IN_MEMORY"
   GCS = "GCS"
+  FILE = "FILE"
 
 
 class MockBlob:
@@ -165,12 +168,19 @@ def get_artifact_service(
   """Creates an artifact service for testing."""
   if service_type == ArtifactServiceType.GCS:
     return mock_gcs_artifact_service()
+  if service_type == ArtifactServiceType.FILE:
+    return FileArtifactService(root_dir=tempfile.mkdtemp())
   return InMemoryArtifactService()
 
 
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
-    "service_type", [ArtifactServiceType.IN_MEMORY, ArtifactServiceType.GCS]
+    "service_type",
+    [
+        ArtifactServiceType.IN_MEMORY,
+        ArtifactServiceType.GCS,
+        ArtifactServiceType.FILE,
+    ],
 )
 async def test_load_empty(service_type):
   """Tests loading an artifact when none exists."""
@@ -185,7 +195,12 @@ async def test_load_empty(service_type):
 
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
-    "service_type", [ArtifactServiceType.IN_MEMORY, ArtifactServiceType.GCS]
+    "service_type",
+    [
+        ArtifactServiceType.IN_MEMORY,
+        ArtifactServiceType.GCS,
+        ArtifactServiceType.FILE,
+    ],
 )
 async def test_save_load_delete(service_type):
   """Tests saving, loading, and deleting an artifact."""
@@ -238,7 +253,12 @@ async def test_save_load_delete(service_type):
 
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
-    "service_type", [ArtifactServiceType.IN_MEMORY, ArtifactServiceType.GCS]
+    "service_type",
+    [
+        ArtifactServiceType.IN_MEMORY,
+        ArtifactServiceType.GCS,
+        ArtifactServiceType.FILE,
+    ],
 )
 async def test_list_keys(service_type):
   """Tests listing keys in the artifact service."""
@@ -269,7 +289,12 @@ async def test_list_keys(service_type):
 
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
-    "service_type", [ArtifactServiceType.IN_MEMORY, ArtifactServiceType.GCS]
+    "service_type",
+    [
+        ArtifactServiceType.IN_MEMORY,
+        ArtifactServiceType.GCS,
+        ArtifactServiceType.FILE,
+    ],
 )
 async def test_list_versions(service_type):
   """Tests listing versions of an artifact."""
@@ -308,7 +333,12 @@ async def test_list_versions(service_type):
 
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
-    "service_type", [ArtifactServiceType.IN_MEMORY, ArtifactServiceType.GCS]
+    "service_type",
+    [
+        ArtifactServiceType.IN_MEMORY,
+        ArtifactServiceType.GCS,
+        ArtifactServiceType.FILE,
+    ],
 )
 async def test_list_keys_preserves_user_prefix(service_type):
   """Tests that list_artifact_keys preserves 'user:' prefix in returned names."""
@@ -356,7 +386,12 @@ async def test_list_keys_preserves_user_prefix(service_type):
 
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
-    "service_type", [ArtifactServiceType.IN_MEMORY, ArtifactServiceType.GCS]
+    "service_type",
+    [
+        ArtifactServiceType.IN_MEMORY,
+        ArtifactServiceType.GCS,
+        ArtifactServiceType.FILE,
+    ],
 )
 async def test_list_artifact_versions_and_get_artifact_version(service_type):
   """Tests listing artifact versions and getting a specific version."""
@@ -402,6 +437,12 @@ async def test_list_artifact_versions_and_get_artifact_version(service_type):
         uri = (
             f"gs://test_bucket/{app_name}/{user_id}/{session_id}/{filename}/{i}"
         )
+      elif service_type == ArtifactServiceType.FILE:
+        uri = (
+            artifact_service.root_dir
+            / f"{app_name}/{user_id}/sessions/{session_id}/artifacts"
+            / f"{filename}/{i}"
+        ).as_uri()
       else:
         uri = f"memory://apps/{app_name}/users/{user_id}/sessions/{session_id}/artifacts/{filename}/versions/{i}"
       expected_artifact_versions.append(
@@ -441,7 +482,12 @@ async def test_list_artifact_versions_and_get_artifact_version(service_type):
 
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
-    "service_type", [ArtifactServiceType.IN_MEMORY, ArtifactServiceType.GCS]
+    "service_type",
+    [
+        ArtifactServiceType.IN_MEMORY,
+        ArtifactServiceType.GCS,
+        ArtifactServiceType.FILE,
+    ],
 )
 async def test_list_artifact_versions_with_user_prefix(service_type):
   """Tests listing artifact versions with user prefix."""
@@ -486,6 +532,11 @@ async def test_list_artifact_versions_with_user_prefix(service_type):
       metadata = {"key": "value" + str(i)}
       if service_type == ArtifactServiceType.GCS:
         uri = f"gs://test_bucket/{app_name}/{user_id}/user/{user_scoped_filename}/{i}"
+      elif service_type == ArtifactServiceType.FILE:
+        uri = (
+            artifact_service.root_dir
+            / f"{app_name}/{user_id}/user/artifacts/user%3Adocument.pdf/{i}"
+        ).as_uri()
       else:
         uri = f"memory://apps/{app_name}/users/{user_id}/artifacts/{user_scoped_filename}/versions/{i}"
       expected_artifact_versions.append(
@@ -502,7 +553,12 @@ async def test_list_artifact_versions_with_user_prefix(service_type):
 
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
-    "service_type", [ArtifactServiceType.IN_MEMORY, ArtifactServiceType.GCS]
+    "service_type",
+    [
+        ArtifactServiceType.IN_MEMORY,
+        ArtifactServiceType.GCS,
+        ArtifactServiceType.FILE,
+    ],
 )
 async def test_get_artifact_version_artifact_does_not_exist(service_type):
   """Tests getting an artifact version when artifact does not exist."""
@@ -517,7 +573,12 @@ async def test_get_artifact_version_artifact_does_not_exist(service_type):
 
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
-    "service_type", [ArtifactServiceType.IN_MEMORY, ArtifactServiceType.GCS]
+    "service_type",
+    [
+        ArtifactServiceType.IN_MEMORY,
+        ArtifactServiceType.GCS,
+        ArtifactServiceType.FILE,
+    ],
 )
 async def test_get_artifact_version_out_of_index(service_type):
   """Tests loading an artifact with an out-of-index version."""
@@ -544,3 +605,67 @@ async def test_get_artifact_version_out_of_index(service_type):
       filename=filename,
       version=3,
   )
+
+
+@pytest.mark.asyncio
+async def test_file_artifact_service_persists_across_instances(tmp_path):
+  """Tests that artifacts saved on disk are visible to a new service."""
+  artifact_service = FileArtifactService(root_dir=tmp_path)
+  await artifact_service.save_artifact(
+      app_name="app0",
+      user_id="user0",
+      session_id="123",
+      filename="notes.txt",
+      artifact=types.Part.from_text(text="hello"),
+  )
+  await artifact_service.save_artifact(
+      app_name="app0",
+      user_id="user0",
+      session_id="123",
+      filename="user:image.png",
+      artifact=types.Part.from_bytes(data=b"\x89PNG", mime_type="image/png"),
+  )
+
+  reopened_service = FileArtifactService(root_dir=tmp_path)
+
+  assert await reopened_service.list_artifact_keys(
+      app_name="app0", user_id="user0", session_id="123"
+  ) == ["notes.txt", "user:image.png"]
+  assert await reopened_service.load_artifact(
+      app_name="app0",
+      user_id="user0",
+      session_id="123",
+      filename="notes.txt",
+  ) == types.Part.from_text(text="hello")
+  assert await reopened_service.load_artifact(
+      app_name="app0",
+      user_id="user0",
+      filename="user:image.png",
+  ) == types.Part.from_bytes(data=b"\x89PNG", mime_type="image/png")
+
+
+@pytest.mark.asyncio
+async def test_file_artifact_service_stays_under_root_dir(tmp_path):
+  """Tests that ids and filenames cannot escape the root directory."""
+  root_dir = tmp_path / "artifacts"
+  artifact_service = FileArtifactService(root_dir=root_dir)
+  artifact = types.Part.from_bytes(data=b"test_data", mime_type="text/plain")
+
+  await artifact_service.save_artifact(
+      app_name="..",
+      user_id="../..",
+      session_id="..",
+      filename="../../escape",
+      artifact=artifact,
+  )
+
+  assert {path.name for path in tmp_path.iterdir()} == {"artifacts"}
+  assert (
+      await artifact_service.load_artifact(
+          app_name="..",
+          user_id="../..",
+          session_id="..",
+          filename="../../escape",
+      )
+      == artifact
+  )
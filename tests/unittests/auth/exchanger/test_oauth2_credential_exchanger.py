@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import time
 from unittest.mock import Mock
 from unittest.mock import patch
@@ -26,12 +27,21 @@ from google.adk.auth.auth_credential import OAuth2Auth
 from google.adk.auth.auth_schemes import OpenIdConnectWithConfig
 from google.adk.auth.exchanger.base_credential_exchanger import CredentialExchangeError
 from google.adk.auth.exchanger.oauth2_credential_exchanger import OAuth2CredentialExchanger
+from google.adk.auth.oauth2_token_cache import get_default_oauth2_token_cache
+from google.adk.auth.oauth2_token_cache import OAuth2TokenCache
 import pytest
 
 
 class TestOAuth2CredentialExchanger:
   """Test suite for OAuth2CredentialExchanger."""
 
+  @pytest.fixture(autouse=True)
+  def clear_token_cache(self):
+    """Clear the tokens cached by other tests."""
+    get_default_oauth2_token_cache().clear()
+    yield
+    get_default_oauth2_token_cache().clear()
+
   @pytest.mark.asyncio
   async def test_exchange_with_existing_token(self):
     """Test exchange method when access token already exists."""
@@ -298,6 +308,65 @@ class TestOAuth2CredentialExchanger:
     assert result.oauth2.access_token is None
     mock_client.fetch_token.assert_called_once()
 
+  @patch("google.adk.auth.oauth2_credential_util.OAuth2Session")
+  @pytest.mark.asyncio
+  async def test_exchange_client_credentials_concurrently(
+      self, mock_oauth2_session
+  ):
+    """Test concurrent client credentials exchanges fetch a single token."""
+
+    def fetch_token(*args, **kwargs):
+      # Blocks the calling thread, as authlib does.
+      time.sleep(0.05)
+      return OAuth2Token({
+          "access_token": "client_access_token",
+          "expires_in": 3600,
+      })
+
+    mock_client = Mock()
+    mock_client.fetch_token.side_effect = fetch_token
+    mock_oauth2_session.return_value = mock_client
+
+    flows = OAuthFlows(
+        clientCredentials=OAuthFlowClientCredentials(
+            tokenUrl="https://example.com/token", scopes={"read": "Read access"}
+        )
+    )
+    scheme = OAuth2(flows=flows)
+    credentials = [
+        AuthCredential(
+            auth_type=AuthCredentialTypes.OAUTH2,
+            oauth2=OAuth2Auth(
+                client_id="test_client_id",
+                client_secret="test_client_secret",
+            ),
+        )
+        for _ in range(5)
+    ]
+
+    exchanger = OAuth2CredentialExchanger(token_cache=OAuth2TokenCache())
+    results = await asyncio.gather(
+        *(exchanger.exchange(credential, scheme) for credential in credentials)
+    )
+    # Served from the cache.
+    results.append(
+        await exchanger.exchange(
+            AuthCredential(
+                auth_type=AuthCredentialTypes.OAUTH2,
+                oauth2=OAuth2Auth(
+                    client_id="test_client_id",
+                    client_secret="test_client_secret",
+                ),
+            ),
+            scheme,
+        )
+    )
+
+    assert [result.oauth2.access_token for result in results] == [
+        "client_access_token"
+    ] * 6
+    mock_client.fetch_token.assert_called_once()
+
   @pytest.mark.asyncio
   async def test_determine_grant_type_client_credentials(self):
     """Test grant type determination for client credentials."""
@@ -21,6 +21,7 @@ from google.adk.auth.auth_credential import AuthCredential
 from google.adk.auth.auth_credential import AuthCredentialTypes
 from google.adk.auth.auth_credential import OAuth2Auth
 from google.adk.auth.auth_schemes import OpenIdConnectWithConfig
+from google.adk.auth.oauth2_token_cache import get_default_oauth2_token_cache
 from google.adk.auth.refresher.oauth2_credential_refresher import OAuth2CredentialRefresher
 import pytest
 
@@ -28,6 +29,13 @@ import pytest
 class TestOAuth2CredentialRefresher:
   """Test suite for OAuth2CredentialRefresher."""
 
+  @pytest.fixture(autouse=True)
+  def clear_token_cache(self):
+    """Clear the tokens cached by other tests."""
+    get_default_oauth2_token_cache().clear()
+    yield
+    get_default_oauth2_token_cache().clear()
+
   @patch("google.adk.auth.refresher.oauth2_credential_refresher.OAuth2Token")
   @pytest.mark.asyncio
   async def test_needs_refresh_token_not_expired(self, mock_oauth2_token):
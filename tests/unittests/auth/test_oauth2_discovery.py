@@ -17,6 +17,7 @@ from unittest.mock import call
 from unittest.mock import Mock
 from unittest.mock import patch
 
+from google.adk.auth import oauth2_discovery
 from google.adk.auth.oauth2_discovery import AuthorizationServerMetadata
 from google.adk.auth.oauth2_discovery import OAuth2DiscoveryManager
 from google.adk.auth.oauth2_discovery import ProtectedResourceMetadata
@@ -27,6 +28,13 @@ import pytest
 class TestOAuth2Discovery:
   """Tests for the OAuth2DiscoveryManager class."""
 
+  @pytest.fixture(autouse=True)
+  def clear_metadata_cache(self):
+    """Clear the metadata cached by other tests."""
+    oauth2_discovery._metadata_cache.clear()
+    yield
+    oauth2_discovery._metadata_cache.clear()
+
   @pytest.fixture
   def auth_server_metadata(self):
     """Create AuthorizationServerMetadata object."""
@@ -68,13 +76,14 @@ class TestOAuth2Discovery:
     )
     return response
 
-  def mock_success_response(self, json_data):
+  def mock_success_response(self, json_data, headers=None):
     """Create a mock HTTP successful response with auth server metadata."""
     response = Mock()
     response.json = json_data.model_dump
+    response.headers = httpx.Headers(headers)
     return response
 
-  @patch("httpx.AsyncClient.get")
+  @patch("google.adk.utils.http_transport.HttpTransport.request")
   @pytest.mark.asyncio
   async def test_discover_auth_server_metadata_failed(
       self,
@@ -91,12 +100,18 @@ class TestOAuth2Discovery:
     assert not result
     mock_get.assert_has_calls([
         call(
+            "GET",
             "https://auth.example.com/.well-known/oauth-authorization-server",
             timeout=5,
+            follow_redirects=False,
+            max_retries=0,
         ),
         call(
+            "GET",
             "https://auth.example.com/.well-known/openid-configuration",
             timeout=5,
+            follow_redirects=False,
+            max_retries=0,
         ),
     ])
 
@@ -109,7 +124,7 @@ class TestOAuth2Discovery:
     result = await discovery_manager.discover_resource_metadata("bad_url")
     assert not result
 
-  @patch("httpx.AsyncClient.get")
+  @patch("google.adk.utils.http_transport.HttpTransport.request")
   @pytest.mark.asyncio
   async def test_discover_auth_server_metadata_without_path(
       self,
@@ -130,16 +145,22 @@ class TestOAuth2Discovery:
     assert result == auth_server_metadata
     mock_get.assert_has_calls([
         call(
+            "GET",
             "https://auth.example.com/.well-known/oauth-authorization-server",
             timeout=5,
+            follow_redirects=False,
+            max_retries=0,
         ),
         call(
+            "GET",
             "https://auth.example.com/.well-known/openid-configuration",
             timeout=5,
+            follow_redirects=False,
+            max_retries=0,
         ),
     ])
 
-  @patch("httpx.AsyncClient.get")
+  @patch("google.adk.utils.http_transport.HttpTransport.request")
   @pytest.mark.asyncio
   async def test_discover_auth_server_metadata_with_path(
       self,
@@ -163,20 +184,29 @@ class TestOAuth2Discovery:
     assert result == auth_server_metadata
     mock_get.assert_has_calls([
         call(
+            "GET",
             "https://auth.example.com/.well-known/oauth-authorization-server/oauth",
             timeout=5,
+            follow_redirects=False,
+            max_retries=0,
         ),
         call(
+            "GET",
             "https://auth.example.com/.well-known/openid-configuration/oauth",
             timeout=5,
+            follow_redirects=False,
+            max_retries=0,
         ),
         call(
+            "GET",
             "https://auth.example.com/oauth/.well-known/openid-configuration",
             timeout=5,
+            follow_redirects=False,
+            max_retries=0,
         ),
     ])
 
-  @patch("httpx.AsyncClient.get")
+  @patch("google.adk.utils.http_transport.HttpTransport.request")
   @pytest.mark.asyncio
   async def test_discover_auth_server_metadata_discard_mismatched_issuer(
       self,
@@ -199,16 +229,22 @@ class TestOAuth2Discovery:
     assert result == auth_server_metadata
     mock_get.assert_has_calls([
         call(
+            "GET",
             "https://auth.example.com/.well-known/oauth-authorization-server",
             timeout=5,
+            follow_redirects=False,
+            max_retries=0,
         ),
         call(
+            "GET",
             "https://auth.example.com/.well-known/openid-configuration",
             timeout=5,
+            follow_redirects=False,
+            max_retries=0,
         ),
     ])
 
-  @patch("httpx.AsyncClient.get")
+  @patch("google.adk.utils.http_transport.HttpTransport.request")
   @pytest.mark.asyncio
   async def test_discover_resource_metadata_failed(
       self,
@@ -224,11 +260,14 @@ class TestOAuth2Discovery:
     )
     assert not result
     mock_get.assert_called_once_with(
+        "GET",
         "https://resource.example.com/.well-known/oauth-protected-resource",
         timeout=5,
+        follow_redirects=False,
+        max_retries=0,
     )
 
-  @patch("httpx.AsyncClient.get")
+  @patch("google.adk.utils.http_transport.HttpTransport.request")
   @pytest.mark.asyncio
   async def test_discover_resource_metadata_without_path(
       self, mock_get, resource_metadata
@@ -241,11 +280,14 @@ class TestOAuth2Discovery:
     )
     assert result == resource_metadata
     mock_get.assert_called_once_with(
+        "GET",
         "https://resource.example.com/.well-known/oauth-protected-resource",
         timeout=5,
+        follow_redirects=False,
+        max_retries=0,
     )
 
-  @patch("httpx.AsyncClient.get")
+  @patch("google.adk.utils.http_transport.HttpTransport.request")
   @pytest.mark.asyncio
   async def test_discover_resource_metadata_with_path(
       self, mock_get, resource_metadata
@@ -259,11 +301,14 @@ class TestOAuth2Discovery:
     )
     assert result == resource_metadata
     mock_get.assert_called_once_with(
+        "GET",
         "https://resource.example.com/.well-known/oauth-protected-resource/tenant1",
         timeout=5,
+        follow_redirects=False,
+        max_retries=0,
     )
 
-  @patch("httpx.AsyncClient.get")
+  @patch("google.adk.utils.http_transport.HttpTransport.request")
   @pytest.mark.asyncio
   async def test_discover_resource_metadata_discard_mismatched_resource(
       self,
@@ -280,6 +325,109 @@ class TestOAuth2Discovery:
     )
     assert not result
     mock_get.assert_called_once_with(
+        "GET",
         "https://resource.example.com/.well-known/oauth-protected-resource",
         timeout=5,
+        follow_redirects=False,
+        max_retries=0,
     )
+
+  @patch("google.adk.utils.http_transport.HttpTransport.request")
+  @pytest.mark.asyncio
+  async def test_discovered_metadata_is_cached(
+      self, mock_get, auth_server_metadata, resource_metadata
+  ):
+    """Test discovered metadata is reused by later discoveries."""
+    mock_get.side_effect = [
+        self.mock_success_response(auth_server_metadata),
+        self.mock_success_response(resource_metadata),
+    ]
+    result = await OAuth2DiscoveryManager().discover_auth_server_metadata(
+        "https://auth.example.com"
+    )
+    result.issuer = "https://modified.example.com"
+    assert (
+        await OAuth2DiscoveryManager().discover_auth_server_metadata(
+            "https://auth.example.com"
+        )
+        == auth_server_metadata
+    )
+    for _ in range(2):
+      assert (
+          await OAuth2DiscoveryManager().discover_resource_metadata(
+              "https://resource.example.com"
+          )
+          == resource_metadata
+      )
+    assert mock_get.call_count == 2
+
+  @pytest.mark.parametrize(
+      "cache_control, expected_call_count",
+      [
+          ("no-store", 2),
+          ("no-cache", 2),
+          ("public, max-age=0", 2),
+          ("public, max-age=600", 1),
+      ],
+  )
+  @patch("google.adk.utils.http_transport.HttpTransport.request")
+  @pytest.mark.asyncio
+  async def test_metadata_cache_honors_cache_control(
+      self, mock_get, resource_metadata, cache_control, expected_call_count
+  ):
+    """Test the metadata is cached as allowed by the Cache-Control header."""
+    mock_get.return_value = self.mock_success_response(
+        resource_metadata, headers={"Cache-Control": cache_control}
+    )
+    discovery_manager = OAuth2DiscoveryManager()
+    for _ in range(2):
+      assert (
+          await discovery_manager.discover_resource_metadata(
+              "https://resource.example.com"
+          )
+          == resource_metadata
+      )
+    assert mock_get.call_count == expected_call_count
+
+  @patch("google.adk.utils.http_transport.HttpTransport.request")
+  @pytest.mark.asyncio
+  async def test_cached_metadata_expires(
+      self, mock_get, resource_metadata, monkeypatch
+  ):
+    """Test the cached metadata is discovered again after max-age."""
+    mock_get.return_value = self.mock_success_response(
+        resource_metadata, headers={"Cache-Control": "max-age=60"}
+    )
+    now = 1000.0
+    monkeypatch.setattr(oauth2_discovery, "time", Mock(monotonic=lambda: now))
+    discovery_manager = OAuth2DiscoveryManager()
+    await discovery_manager.discover_resource_metadata(
+        "https://resource.example.com"
+    )
+    now += 59
+    await discovery_manager.discover_resource_metadata(
+        "https://resource.example.com"
+    )
+    assert mock_get.call_count == 1
+    now += 1
+    await discovery_manager.discover_resource_metadata(
+        "https://resource.example.com"
+    )
+    assert mock_get.call_count == 2
+
+  def test_metadata_cache_is_bounded(self, resource_metadata, monkeypatch):
+    """Test the cache drops the expired, then least recently used entries."""
+    now = 1000.0
+    monkeypatch.setattr(oauth2_discovery, "time", Mock(monotonic=lambda: now))
+    cache = oauth2_discovery._MetadataCache(max_entries=2)
+    cache.put("https://short.example.com", resource_metadata, 10)
+    cache.put("https://a.example.com", resource_metadata, 60)
+    now += 10
+    cache.put("https://b.example.com", resource_metadata, 60)
+    assert cache.get(ProtectedResourceMetadata, "https://a.example.com")
+
+    cache.put("https://c.example.com", resource_metadata, 60)
+
+    assert cache.get(ProtectedResourceMetadata, "https://a.example.com")
+    assert cache.get(ProtectedResourceMetadata, "https://c.example.com")
+    assert not cache.get(ProtectedResourceMetadata, "https://b.example.com")
@@ -0,0 +1,136 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import time
+
+from google.adk.auth.oauth2_token_cache import create_token_cache_key
+from google.adk.auth.oauth2_token_cache import OAuth2TokenCache
+import pytest
+
+
+class _TokenEndpoint:
+  """Issues numbered tokens, expiring after the given lifetime."""
+
+  def __init__(self, expires_in=3600):
+    self.expires_in = expires_in
+    self.fetch_count = 0
+
+  async def fetch_token(self):
+    self.fetch_count += 1
+    await asyncio.sleep(0.01)
+    token = {"access_token": f"token-{self.fetch_count}"}
+    if self.expires_in is not None:
+      token["expires_at"] = int(time.time()) + self.expires_in
+    return token
+
+
+@pytest.mark.asyncio
+async def test_concurrent_fetches_are_coalesced():
+  cache = OAuth2TokenCache()
+  endpoint = _TokenEndpoint()
+
+  tokens = await asyncio.gather(
+      *(cache.get_token("key", endpoint.fetch_token) for _ in range(10))
+  )
+  tokens.append(await cache.get_token("key", endpoint.fetch_token))
+
+  assert [token["access_token"] for token in tokens] == ["token-1"] * 11
+  assert endpoint.fetch_count == 1
+  other_token = await cache.get_token("other-key", endpoint.fetch_token)
+  assert other_token["access_token"] == "token-2"
+
+
+@pytest.mark.asyncio
+async def test_tokens_are_refreshed_before_expiry():
+  cache = OAuth2TokenCache(refresh_margin_seconds=60)
+  endpoint = _TokenEndpoint(expires_in=30)
+
+  await cache.get_token("key", endpoint.fetch_token)
+  token = await cache.get_token("key", endpoint.fetch_token)
+
+  assert token["access_token"] == "token-2"
+
+
+@pytest.mark.asyncio
+async def test_tokens_without_expiry_are_not_cached():
+  cache = OAuth2TokenCache()
+  endpoint = _TokenEndpoint(expires_in=None)
+
+  await cache.get_token("key", endpoint.fetch_token)
+  token = await cache.get_token("key", endpoint.fetch_token)
+
+  assert token["access_token"] == "token-2"
+
+
+@pytest.mark.asyncio
+async def test_fetch_errors_are_raised_to_all_waiters():
+  cache = OAuth2TokenCache()
+  fetch_count = 0
+
+  async def fetch_token():
+    nonlocal fetch_count
+    fetch_count += 1
+    await asyncio.sleep(0.01)
+    raise ValueError("invalid_client")
+
+  results = await asyncio.gather(
+      *(cache.get_token("key", fetch_token) for _ in range(3)),
+      return_exceptions=True,
+  )
+
+  assert all(isinstance(result, ValueError) for result in results)
+  assert fetch_count == 1
+  with pytest.raises(ValueError):
+    await cache.get_token("key", fetch_token)
+  assert fetch_count == 2
+
+
+@pytest.mark.asyncio
+async def test_cancelling_a_waiter_does_not_cancel_the_fetch():
+  cache = OAuth2TokenCache()
+  endpoint = _TokenEndpoint()
+
+  cancelled = asyncio.create_task(cache.get_token("key", endpoint.fetch_token))
+  waiter = asyncio.create_task(cache.get_token("key", endpoint.fetch_token))
+  await asyncio.sleep(0)
+  cancelled.cancel()
+
+  assert (await waiter)["access_token"] == "token-1"
+  assert endpoint.fetch_count == 1
+
+
+@pytest.mark.asyncio
+async def test_expired_tokens_are_evicted():
+  cache = OAuth2TokenCache(refresh_margin_seconds=0)
+  endpoint = _TokenEndpoint(expires_in=1)
+
+  await cache.get_token("rotated-key", endpoint.fetch_token)
+  await asyncio.sleep(1.1)
+  endpoint.expires_in = 3600
+  await cache.get_token("key", endpoint.fetch_token)
+
+  assert list(cache._tokens) == ["key"]
+
+
+def test_create_token_cache_key_hides_secrets():
+  key = create_token_cache_key("https://example.com/token", "id", "secret")
+
+  assert "secret" not in key
+  assert key == create_token_cache_key(
+      "https://example.com/token", "id", "secret"
+  )
+  assert key != create_token_cache_key(
+      "https://example.com/token", "id", "other_secret"
+  )
@@ -30,6 +30,7 @@ from fastapi.testclient import TestClient
 from google.adk.agents.base_agent import BaseAgent
 from google.adk.agents.run_config import RunConfig
 from google.adk.apps.app import App
+from google.adk.cli.adk_web_server import _accepts_list_sessions_config
 from google.adk.cli.fast_api import get_fast_api_app
 from google.adk.evaluation.eval_case import EvalCase
 from google.adk.evaluation.eval_case import Invocation
@@ -625,6 +626,18 @@ def test_list_sessions(test_app, create_test_session):
   logger.info(f"Listed {len(data)} sessions")
 
 
+def test_list_sessions_config_is_only_passed_to_services_accepting_it():
+  """Test session services without a `config` argument are still supported."""
+
+  class LegacySessionService:
+
+    async def list_sessions(self, *, app_name, user_id=None):
+      pass
+
+  assert _accepts_list_sessions_config(InMemorySessionService())
+  assert not _accepts_list_sessions_config(LegacySessionService())
+
+
 def test_delete_session(test_app, create_test_session):
   """Test deleting a session."""
   info = create_test_session
@@ -14,7 +14,6 @@
 
 """Tests for utilities in cli_tool_click."""
 
-
 from __future__ import annotations
 
 import builtins
@@ -520,6 +519,37 @@ def test_cli_web_passes_service_uris(
   assert called_kwargs.get("memory_service_uri") == "rag://mycorpus"
 
 
+def test_cli_api_server_passes_trace_store_options(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, _patch_uvicorn: _Recorder
+) -> None:
+  """`adk api_server` should pass the trace store options to get_fast_api_app."""
+  agents_dir = tmp_path / "agents"
+  agents_dir.mkdir()
+
+  mock_get_app = _Recorder()
+  monkeypatch.setattr(cli_tools_click, "get_fast_api_app", mock_get_app)
+
+  runner = CliRunner()
+  result = runner.invoke(
+      cli_tools_click.main,
+      [
+          "api_server",
+          str(agents_dir),
+          "--trace_max_traces",
+          "10",
+          "--trace_ttl_seconds",
+          "60",
+          "--trace_spill_path",
+          str(tmp_path / "traces.db"),
+      ],
+  )
+  assert result.exit_code == 0
+  called_kwargs = mock_get_app.calls[0][1]
+  assert called_kwargs.get("trace_max_traces") == 10
+  assert called_kwargs.get("trace_ttl_seconds") == 60
+  assert called_kwargs.get("trace_spill_path") == str(tmp_path / "traces.db")
+
+
 def test_cli_web_passes_deprecated_uris(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch, _patch_uvicorn: _Recorder
 ) -> None:
@@ -0,0 +1,114 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from unittest import mock
+
+from google.adk.cli.utils.trace_store import TraceStore
+import pytest
+
+
+def _span(trace_id: int, name: str) -> dict:
+  return {"name": name, "trace_id": trace_id, "attributes": {}}
+
+
+def test_session_spans_include_whole_traces():
+  store = TraceStore()
+  store.add_span(1, _span(1, "execute_tool"), None)
+  store.add_span(1, _span(1, "call_llm"), "session_1")
+  store.add_span(2, _span(2, "call_llm"), "session_2")
+  store.add_span(1, _span(1, "invocation"), None)
+
+  assert [s["name"] for s in store.get_session_spans("session_1")] == [
+      "execute_tool",
+      "call_llm",
+      "invocation",
+  ]
+  assert [s["name"] for s in store.get_session_spans("session_2")] == [
+      "call_llm"
+  ]
+  assert store.get_session_spans("unknown") == []
+
+
+def test_event_attributes():
+  store = TraceStore()
+  store.add_event_attributes(1, "event_1", {"key": "value"})
+
+  assert store.get_event_attributes("event_1") == {"key": "value"}
+  assert store.get_event_attributes("unknown") is None
+
+
+def test_least_recently_used_traces_are_evicted():
+  store = TraceStore(max_traces=2)
+  store.add_span(1, _span(1, "call_llm"), "session_1")
+  store.add_event_attributes(1, "event_1", {})
+  store.add_span(2, _span(2, "call_llm"), "session_2")
+  # Reading the first trace makes the second one the least recently used.
+  store.get_session_spans("session_1")
+  store.add_span(3, _span(3, "call_llm"), "session_3")
+
+  assert store.get_session_spans("session_1")
+  assert store.get_event_attributes("event_1") == {}
+  assert store.get_session_spans("session_2") == []
+  assert store.get_session_spans("session_3")
+
+
+def test_expired_traces_are_dropped():
+  store = TraceStore(ttl_seconds=60)
+  with mock.patch("time.time", return_value=1000.0):
+    store.add_span(1, _span(1, "call_llm"), "session_1")
+    store.add_event_attributes(1, "event_1", {})
+
+  with mock.patch("time.time", return_value=1061.0):
+    assert store.get_session_spans("session_1") == []
+    assert store.get_event_attributes("event_1") is None
+
+
+def test_evicted_traces_are_spilled(tmp_path):
+  store = TraceStore(max_traces=1, spill_path=str(tmp_path / "traces.db"))
+  store.add_span(1, _span(1, "execute_tool"), None)
+  store.add_span(1, _span(1, "call_llm"), "session_1")
+  store.add_event_attributes(1, "event_1", {"key": "value"})
+  store.add_span(2, _span(2, "call_llm"), "session_2")
+
+  assert [s["name"] for s in store.get_session_spans("session_1")] == [
+      "execute_tool",
+      "call_llm",
+  ]
+  assert store.get_event_attributes("event_1") == {"key": "value"}
+
+  store.clear()
+  assert store.get_session_spans("session_1") == []
+  store.close()
+
+
+def test_late_spans_of_spilled_traces_keep_their_session(tmp_path):
+  store = TraceStore(max_traces=1, spill_path=str(tmp_path / "traces.db"))
+  store.add_span(1, _span(1, "call_llm"), "session_1")
+  store.add_span(2, _span(2, "call_llm"), "session_2")
+  # The root span of the first trace ends after the trace was spilled.
+  store.add_span(1, _span(1, "invocation"), None)
+
+  assert [s["name"] for s in store.get_session_spans("session_1")] == [
+      "call_llm",
+      "invocation",
+  ]
+  assert [s["name"] for s in store.get_session_spans("session_2")] == [
+      "call_llm"
+  ]
+  store.close()
+
+
+def test_invalid_max_traces():
+  with pytest.raises(ValueError):
+    TraceStore(max_traces=0)
@@ -0,0 +1,273 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import gc
+from unittest.mock import MagicMock
+
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.code_executors.code_execution_utils import CodeExecutionInput
+from google.adk.code_executors.local_interpreter_pool_code_executor import LocalInterpreterPoolCodeExecutor
+import pytest
+
+
+@pytest.fixture
+def mock_invocation_context() -> InvocationContext:
+  return MagicMock(spec=InvocationContext)
+
+
+@pytest.fixture
+def executor():
+  executor = LocalInterpreterPoolCodeExecutor(preload_modules=[])
+  yield executor
+  executor.close()
+
+
+def test_execute_code(executor, mock_invocation_context):
+  result = executor.execute_code(
+      mock_invocation_context, CodeExecutionInput(code='print("hello")')
+  )
+
+  assert result.stdout == "hello\n"
+  assert result.stderr == ""
+
+
+def test_execute_code_error(executor, mock_invocation_context):
+  result = executor.execute_code(
+      mock_invocation_context,
+      CodeExecutionInput(code='raise ValueError("Test error")'),
+  )
+
+  assert result.stdout == ""
+  assert result.stderr == "Test error"
+
+
+def test_workers_are_reused(executor, mock_invocation_context):
+  code_input = CodeExecutionInput(code="import os\nprint(os.getpid())")
+  first = executor.execute_code(mock_invocation_context, code_input)
+  second = executor.execute_code(mock_invocation_context, code_input)
+
+  assert first.stdout == second.stdout
+  assert len(executor._workers) == 1
+
+
+def test_stateless_executions_do_not_share_globals(
+    executor, mock_invocation_context
+):
+  executor.execute_code(
+      mock_invocation_context,
+      CodeExecutionInput(code="x = 1", execution_id="session_1"),
+  )
+  result = executor.execute_code(
+      mock_invocation_context,
+      CodeExecutionInput(code="print(x)", execution_id="session_1"),
+  )
+
+  assert result.stderr == "name 'x' is not defined"
+
+
+def test_stateful_sessions_are_pinned_to_workers(mock_invocation_context):
+  executor = LocalInterpreterPoolCodeExecutor(preload_modules=[], stateful=True)
+  try:
+    executor.execute_code(
+        mock_invocation_context,
+        CodeExecutionInput(code="x = 1", execution_id="session_1"),
+    )
+    executor.execute_code(
+        mock_invocation_context,
+        CodeExecutionInput(code="x = 2", execution_id="session_2"),
+    )
+    result = executor.execute_code(
+        mock_invocation_context,
+        CodeExecutionInput(code="print(x)", execution_id="session_1"),
+    )
+
+    assert result.stdout == "1\n"
+    assert len(executor._workers) == 2
+  finally:
+    executor.close()
+
+
+def test_least_recently_used_session_is_evicted_at_capacity(
+    mock_invocation_context,
+):
+  executor = LocalInterpreterPoolCodeExecutor(
+      preload_modules=[], stateful=True, max_workers=1
+  )
+  try:
+    executor.execute_code(
+        mock_invocation_context,
+        CodeExecutionInput(code="x = 1", execution_id="session_1"),
+    )
+    executor.execute_code(
+        mock_invocation_context,
+        CodeExecutionInput(code="x = 2", execution_id="session_2"),
+    )
+    result = executor.execute_code(
+        mock_invocation_context,
+        CodeExecutionInput(code="print(x)", execution_id="session_1"),
+    )
+
+    assert result.stderr == "name 'x' is not defined"
+    assert len(executor._workers) == 1
+  finally:
+    executor.close()
+
+
+def test_timeout_kills_worker(mock_invocation_context):
+  executor = LocalInterpreterPoolCodeExecutor(
+      preload_modules=[], timeout_seconds=0.5
+  )
+  try:
+    result = executor.execute_code(
+        mock_invocation_context,
+        CodeExecutionInput(code="while True:\n  pass"),
+    )
+    assert result.stderr == "Code execution timed out after 0.5 seconds."
+
+    result = executor.execute_code(
+        mock_invocation_context, CodeExecutionInput(code='print("ok")')
+    )
+    assert result.stdout == "ok\n"
+  finally:
+    executor.close()
+
+
+def test_timeout_excludes_worker_startup(
+    mock_invocation_context, tmp_path, monkeypatch
+):
+  (tmp_path / "slow_module.py").write_text("import time\ntime.sleep(1)\n")
+  monkeypatch.setenv("PYTHONPATH", str(tmp_path))
+  executor = LocalInterpreterPoolCodeExecutor(
+      preload_modules=["slow_module"], timeout_seconds=0.5
+  )
+  try:
+    result = executor.execute_code(
+        mock_invocation_context, CodeExecutionInput(code='print("ok")')
+    )
+    assert result.stdout == "ok\n"
+  finally:
+    executor.close()
+
+
+@pytest.mark.asyncio
+async def test_async_timeout_excludes_worker_startup(
+    mock_invocation_context, tmp_path, monkeypatch
+):
+  (tmp_path / "slow_module.py").write_text("import time\ntime.sleep(1)\n")
+  monkeypatch.setenv("PYTHONPATH", str(tmp_path))
+  executor = LocalInterpreterPoolCodeExecutor(
+      preload_modules=["slow_module"], timeout_seconds=0.5
+  )
+  try:
+    result = await executor.execute_code_async(
+        mock_invocation_context, CodeExecutionInput(code='print("ok")')
+    )
+    assert result.stdout == "ok\n"
+
+    result = await executor.execute_code_async(
+        mock_invocation_context,
+        CodeExecutionInput(code="while True:\n  pass"),
+    )
+    assert result.stderr == "Code execution timed out after 0.5 seconds."
+  finally:
+    executor.close()
+
+
+def test_startup_timeout_kills_hanging_worker(
+    mock_invocation_context, tmp_path, monkeypatch
+):
+  (tmp_path / "hanging_module.py").write_text("import time\ntime.sleep(60)\n")
+  monkeypatch.setenv("PYTHONPATH", str(tmp_path))
+  executor = LocalInterpreterPoolCodeExecutor(
+      preload_modules=["hanging_module"], startup_timeout_seconds=0.5
+  )
+  try:
+    result = executor.execute_code(
+        mock_invocation_context, CodeExecutionInput(code='print("ok")')
+    )
+
+    assert result.stderr == (
+        "The interpreter process did not start within 0.5 seconds."
+    )
+    assert not executor._workers
+  finally:
+    executor.close()
+
+
+def test_code_cannot_read_the_protocol_stream(
+    executor, mock_invocation_context
+):
+  result = executor.execute_code(
+      mock_invocation_context,
+      CodeExecutionInput(code="import sys\nprint(repr(sys.stdin.read()))"),
+  )
+  assert result.stdout == "''\n"
+
+  result = executor.execute_code(
+      mock_invocation_context, CodeExecutionInput(code="input()")
+  )
+  assert result.stderr == "EOF when reading a line"
+
+  result = executor.execute_code(
+      mock_invocation_context, CodeExecutionInput(code='print("ok")')
+  )
+  assert result.stdout == "ok\n"
+  assert len(executor._workers) == 1
+
+
+def test_min_workers_are_started_and_kept_warm(mock_invocation_context):
+  executor = LocalInterpreterPoolCodeExecutor(preload_modules=[], min_workers=2)
+  try:
+    workers = list(executor._workers)
+    assert len(workers) == 2
+    for worker in workers:
+      worker.last_used -= executor.idle_timeout_seconds + 1
+
+    executor.execute_code(mock_invocation_context, CodeExecutionInput(code=""))
+
+    assert executor._workers == workers
+    assert all(w.is_alive() for w in workers)
+  finally:
+    executor.close()
+
+
+def test_min_workers_must_not_exceed_max_workers():
+  with pytest.raises(ValueError):
+    LocalInterpreterPoolCodeExecutor(min_workers=2, max_workers=1)
+
+
+def test_workers_are_stopped_when_executor_is_collected(
+    mock_invocation_context,
+):
+  executor = LocalInterpreterPoolCodeExecutor(
+      preload_modules=[], idle_timeout_seconds=60
+  )
+  executor.execute_code(mock_invocation_context, CodeExecutionInput(code=""))
+  worker = executor._workers[0]
+
+  del executor
+  gc.collect()
+
+  assert not worker.is_alive()
+
+
+def test_idle_workers_are_evicted(executor, mock_invocation_context):
+  executor.execute_code(mock_invocation_context, CodeExecutionInput(code=""))
+  worker = executor._workers[0]
+  worker.last_used -= executor.idle_timeout_seconds + 1
+
+  executor.execute_code(mock_invocation_context, CodeExecutionInput(code=""))
+
+  assert not worker.is_alive()
+  assert executor._workers and executor._workers[0] is not worker
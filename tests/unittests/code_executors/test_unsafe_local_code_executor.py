@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 from unittest.mock import MagicMock
 
 from google.adk.agents.base_agent import BaseAgent
@@ -101,3 +102,121 @@ class TestUnsafeLocalCodeExecutor:
     result = executor.execute_code(mock_invocation_context, code_input)
     assert result.stdout == ""
     assert result.stderr == ""
+
+  @pytest.mark.asyncio
+  async def test_execute_code_async(
+      self, mock_invocation_context: InvocationContext
+  ):
+    executor = UnsafeLocalCodeExecutor()
+    code_input = CodeExecutionInput(code='print("hello world")')
+    result = await executor.execute_code_async(
+        mock_invocation_context, code_input
+    )
+
+    assert result.stdout == "hello world\n"
+    assert result.stderr == ""
+
+  @pytest.mark.asyncio
+  async def test_execute_code_async_timeout_does_not_block_event_loop(
+      self, mock_invocation_context: InvocationContext
+  ):
+    executor = UnsafeLocalCodeExecutor(timeout_seconds=0.1)
+    code_input = CodeExecutionInput(code="import time\ntime.sleep(0.5)")
+    ticks = 0
+
+    async def _tick():
+      nonlocal ticks
+      while True:
+        ticks += 1
+        await asyncio.sleep(0.01)
+
+    ticker = asyncio.create_task(_tick())
+    result = await executor.execute_code_async(
+        mock_invocation_context, code_input
+    )
+    ticker.cancel()
+
+    assert result.stderr == "Code execution timed out after 0.1 seconds."
+    assert ticks > 1
+
+  @pytest.mark.asyncio
+  async def test_execute_code_async_kills_timed_out_code(
+      self, mock_invocation_context: InvocationContext
+  ):
+    executor = UnsafeLocalCodeExecutor(timeout_seconds=0.5)
+    result = await executor.execute_code_async(
+        mock_invocation_context, CodeExecutionInput(code="while True: pass")
+    )
+    assert result.stderr == "Code execution timed out after 0.5 seconds."
+
+    # The timed out code doesn't hold up the following executions.
+    result = await UnsafeLocalCodeExecutor().execute_code_async(
+        mock_invocation_context, CodeExecutionInput(code='print("done")')
+    )
+    assert result.stdout == "done\n"
+
+  @pytest.mark.asyncio
+  async def test_execute_code_async_isolates_stdout(
+      self, mock_invocation_context: InvocationContext, capsys
+  ):
+    executor = UnsafeLocalCodeExecutor()
+    code_input = CodeExecutionInput(
+        code="import time\ntime.sleep(0.2)\nprint('from code')"
+    )
+
+    async def _print():
+      await asyncio.sleep(0.05)
+      print("from event loop")
+
+    result, _ = await asyncio.gather(
+        executor.execute_code_async(mock_invocation_context, code_input),
+        _print(),
+    )
+
+    assert result.stdout == "from code\n"
+    assert "from event loop" in capsys.readouterr().out
+
+  @pytest.mark.asyncio
+  async def test_execute_code_async_with_error(
+      self, mock_invocation_context: InvocationContext
+  ):
+    executor = UnsafeLocalCodeExecutor()
+    code_input = CodeExecutionInput(
+        code='if __name__ == "__main__":\n  raise ValueError("Test error")'
+    )
+    result = await executor.execute_code_async(
+        mock_invocation_context, code_input
+    )
+    assert result.stdout == ""
+    assert result.stderr == "Test error"
+
+  @pytest.mark.asyncio
+  async def test_execute_code_async_ignores_warnings(
+      self, mock_invocation_context: InvocationContext
+  ):
+    executor = UnsafeLocalCodeExecutor()
+    code_input = CodeExecutionInput(
+        code=(
+            "import sys\nimport warnings\n"
+            'warnings.warn("deprecated", FutureWarning)\n'
+            'sys.stderr.write("log line\\n")\n'
+            'print("ok")'
+        )
+    )
+    result = await executor.execute_code_async(
+        mock_invocation_context, code_input
+    )
+    assert result.stdout == "ok\n"
+    assert result.stderr == ""
+
+  @pytest.mark.asyncio
+  async def test_execute_code_async_with_exit(
+      self, mock_invocation_context: InvocationContext
+  ):
+    executor = UnsafeLocalCodeExecutor()
+    code_input = CodeExecutionInput(code='print("before")\nraise SystemExit(3)')
+    result = await executor.execute_code_async(
+        mock_invocation_context, code_input
+    )
+    assert result.stdout == "before\n"
+    assert result.stderr == "3"
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import time
 from unittest.mock import AsyncMock
 from unittest.mock import Mock
@@ -253,6 +254,196 @@ class TestAudioCacheManager:
     # Verify session event was created
     mock_session_service.append_event.assert_not_called()
 
+  @pytest.mark.asyncio
+  async def test_flush_caches_over_size_limit(self):
+    """Test that caches are flushed once they exceed the size limit."""
+    manager = AudioCacheManager(AudioCacheConfig(max_cache_size_bytes=10))
+    invocation_context = await testing_utils.create_invocation_context(
+        testing_utils.create_test_agent()
+    )
+    mock_artifact_service = AsyncMock()
+    mock_artifact_service.save_artifact.return_value = 0
+    invocation_context.artifact_service = mock_artifact_service
+
+    manager.cache_audio(
+        invocation_context,
+        types.Blob(data=b'123456', mime_type='audio/pcm'),
+        'input',
+    )
+    await manager.flush_caches_over_limits(invocation_context)
+    mock_artifact_service.save_artifact.assert_not_called()
+
+    manager.cache_audio(
+        invocation_context,
+        types.Blob(data=b'7890', mime_type='audio/pcm'),
+        'input',
+    )
+    manager.cache_audio(
+        invocation_context,
+        types.Blob(data=b'model', mime_type='audio/pcm'),
+        'output',
+    )
+    await manager.flush_caches_over_limits(invocation_context)
+
+    mock_artifact_service.save_artifact.assert_called_once()
+    saved_artifact = mock_artifact_service.save_artifact.call_args.kwargs[
+        'artifact'
+    ]
+    assert saved_artifact.inline_data.data == b'1234567890'
+    assert invocation_context.input_realtime_cache == []
+    assert len(invocation_context.output_realtime_cache) == 1
+
+  @pytest.mark.asyncio
+  async def test_flush_caches_over_duration_limit(self):
+    """Test that caches are flushed once they exceed the duration limit."""
+    manager = AudioCacheManager(
+        AudioCacheConfig(max_cache_duration_seconds=60.0)
+    )
+    invocation_context = await testing_utils.create_invocation_context(
+        testing_utils.create_test_agent()
+    )
+    mock_artifact_service = AsyncMock()
+    mock_artifact_service.save_artifact.return_value = 0
+    invocation_context.artifact_service = mock_artifact_service
+
+    manager.cache_audio(
+        invocation_context,
+        types.Blob(data=b'first', mime_type='audio/pcm'),
+        'output',
+    )
+    invocation_context.output_realtime_cache[0].timestamp -= 61.0
+    manager.cache_audio(
+        invocation_context,
+        types.Blob(data=b'second', mime_type='audio/pcm'),
+        'output',
+    )
+    await manager.flush_caches_over_limits(invocation_context)
+
+    mock_artifact_service.save_artifact.assert_called_once()
+    assert invocation_context.output_realtime_cache == []
+
+  @pytest.mark.asyncio
+  async def test_flush_caches_over_limits_drops_audio_on_failure(self):
+    """Test a failed save doesn't keep growing the cache."""
+    manager = AudioCacheManager(AudioCacheConfig(max_cache_size_bytes=4))
+    invocation_context = await testing_utils.create_invocation_context(
+        testing_utils.create_test_agent()
+    )
+    mock_artifact_service = AsyncMock()
+    mock_artifact_service.save_artifact.side_effect = Exception('Save failed')
+    invocation_context.artifact_service = mock_artifact_service
+
+    for data in [b'1234', b'5678']:
+      manager.cache_audio(
+          invocation_context,
+          types.Blob(data=data, mime_type='audio/pcm'),
+          'input',
+      )
+      await manager.flush_caches_over_limits(invocation_context)
+      assert invocation_context.input_realtime_cache == []
+
+    saved_data = [
+        call.kwargs['artifact'].inline_data.data
+        for call in mock_artifact_service.save_artifact.call_args_list
+    ]
+    assert saved_data == [b'1234', b'5678']
+
+  @pytest.mark.asyncio
+  async def test_start_flush_caches_over_limits(self):
+    """Test caches over the limits are emptied now and saved in background."""
+    manager = AudioCacheManager(AudioCacheConfig(max_cache_size_bytes=4))
+    invocation_context = await testing_utils.create_invocation_context(
+        testing_utils.create_test_agent()
+    )
+    save_started = asyncio.Event()
+    finish_save = asyncio.Event()
+
+    async def save_artifact(**kwargs):
+      save_started.set()
+      await finish_save.wait()
+      return 0
+
+    mock_artifact_service = AsyncMock()
+    mock_artifact_service.save_artifact.side_effect = save_artifact
+    invocation_context.artifact_service = mock_artifact_service
+
+    manager.cache_audio(
+        invocation_context,
+        types.Blob(data=b'1234', mime_type='audio/pcm'),
+        'input',
+    )
+    manager.start_flush_caches_over_limits(invocation_context)
+
+    assert invocation_context.input_realtime_cache == []
+    await asyncio.wait_for(save_started.wait(), timeout=5)
+    assert manager._flush_tasks
+    finish_save.set()
+    await manager.wait_for_flushes()
+    mock_artifact_service.save_artifact.assert_called_once()
+    assert not manager._flush_tasks
+
+  @pytest.mark.asyncio
+  async def test_start_flush_caches_over_limits_runs_one_flush_per_type(self):
+    """Test a cache isn't flushed again while its previous flush is running."""
+    manager = AudioCacheManager(AudioCacheConfig(max_cache_size_bytes=4))
+    invocation_context = await testing_utils.create_invocation_context(
+        testing_utils.create_test_agent()
+    )
+    finish_save = asyncio.Event()
+
+    async def save_artifact(**kwargs):
+      await finish_save.wait()
+      return 0
+
+    mock_artifact_service = AsyncMock()
+    mock_artifact_service.save_artifact.side_effect = save_artifact
+    invocation_context.artifact_service = mock_artifact_service
+
+    for data in [b'1234', b'5678']:
+      manager.cache_audio(
+          invocation_context,
+          types.Blob(data=data, mime_type='audio/pcm'),
+          'input',
+      )
+      manager.start_flush_caches_over_limits(invocation_context)
+
+    assert len(manager._flush_tasks) == 1
+    assert invocation_context.input_realtime_cache[0].data.data == b'5678'
+    finish_save.set()
+    await manager.wait_for_flushes()
+    manager.start_flush_caches_over_limits(invocation_context)
+    await manager.wait_for_flushes()
+
+    saved_data = [
+        call.kwargs['artifact'].inline_data.data
+        for call in mock_artifact_service.save_artifact.call_args_list
+    ]
+    assert saved_data == [b'1234', b'5678']
+
+  @pytest.mark.asyncio
+  async def test_cancel_flushes(self):
+    """Test cancelling stops the flushes running in the background."""
+    manager = AudioCacheManager(AudioCacheConfig(max_cache_size_bytes=4))
+    invocation_context = await testing_utils.create_invocation_context(
+        testing_utils.create_test_agent()
+    )
+    mock_artifact_service = AsyncMock()
+    mock_artifact_service.save_artifact.side_effect = asyncio.Event().wait
+    invocation_context.artifact_service = mock_artifact_service
+
+    manager.cache_audio(
+        invocation_context,
+        types.Blob(data=b'1234', mime_type='audio/pcm'),
+        'output',
+    )
+    manager.start_flush_caches_over_limits(invocation_context)
+    task = manager._flush_tasks['output']
+    manager.cancel_flushes()
+    await manager.wait_for_flushes()
+
+    assert task.cancelled()
+    assert not manager._flush_tasks
+
   def test_get_cache_stats_empty(self):
     """Test getting statistics for empty caches."""
     invocation_context = Mock()
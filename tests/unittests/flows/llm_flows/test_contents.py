@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from unittest import mock
+
 from google.adk.agents.llm_agent import Agent
 from google.adk.events.event import Event
 from google.adk.events.event_actions import EventActions
@@ -427,3 +429,104 @@ async def test_events_with_empty_content_are_skipped():
       types.UserContent("Hello"),
       types.UserContent("How are you?"),
   ]
+
+
+@pytest.mark.asyncio
+async def test_contents_are_built_incrementally_across_llm_calls():
+  """Test that only newly appended events are filtered on later LLM calls."""
+  agent = Agent(model="gemini-2.5-flash", name="test_agent")
+  invocation_context = await testing_utils.create_invocation_context(
+      agent=agent
+  )
+  events = [
+      Event(
+          invocation_id="inv1",
+          author="user",
+          content=types.UserContent("Hello"),
+      ),
+      Event(
+          invocation_id="inv1",
+          author="test_agent",
+          content=types.ModelContent("Hi"),
+      ),
+  ]
+  invocation_context.session.events = events
+
+  llm_request = LlmRequest(model="gemini-2.5-flash")
+  async for _ in contents.request_processor.run_async(
+      invocation_context, llm_request
+  ):
+    pass
+
+  events.append(
+      Event(
+          invocation_id="inv2",
+          author="user",
+          content=types.UserContent("How are you?"),
+      )
+  )
+  filtered = []
+  original_should_include_event = contents._should_include_event
+
+  def _tracking_should_include_event(current_branch, event):
+    filtered.append(event)
+    return original_should_include_event(current_branch, event)
+
+  llm_request = LlmRequest(model="gemini-2.5-flash")
+  with mock.patch.object(
+      contents, "_should_include_event", _tracking_should_include_event
+  ):
+    async for _ in contents.request_processor.run_async(
+        invocation_context, llm_request
+    ):
+      pass
+
+  assert filtered == [events[-1]]
+  assert llm_request.contents == [
+      types.UserContent("Hello"),
+      types.ModelContent("Hi"),
+      types.UserContent("How are you?"),
+  ]
+
+
+@pytest.mark.asyncio
+async def test_contents_cache_recomputes_on_rewind_event():
+  """Test that an appended rewind event invalidates the cached history."""
+  agent = Agent(model="gemini-2.5-flash", name="test_agent")
+  invocation_context = await testing_utils.create_invocation_context(
+      agent=agent
+  )
+  events = [
+      Event(
+          invocation_id="inv1",
+          author="user",
+          content=types.UserContent("First message"),
+      ),
+      Event(
+          invocation_id="inv2",
+          author="user",
+          content=types.UserContent("Second message"),
+      ),
+  ]
+  invocation_context.session.events = events
+
+  llm_request = LlmRequest(model="gemini-2.5-flash")
+  async for _ in contents.request_processor.run_async(
+      invocation_context, llm_request
+  ):
+    pass
+
+  events.append(
+      Event(
+          invocation_id="inv3",
+          author="user",
+          actions=EventActions(rewind_before_invocation_id="inv2"),
+      )
+  )
+  llm_request = LlmRequest(model="gemini-2.5-flash")
+  async for _ in contents.request_processor.run_async(
+      invocation_context, llm_request
+  ):
+    pass
+
+  assert llm_request.contents == [types.UserContent("First message")]
@@ -217,3 +217,43 @@ async def test_search_memory_is_scoped_by_user():
   assert (
       result_other_user.memories[0].content.parts[0].text == 'This is a secret.'
   )
+
+
+@pytest.mark.asyncio
+async def test_search_memory_ranks_by_relevance():
+  """Tests that the memories matching more query words come first."""
+  memory_service = InMemoryMemoryService(max_results=1)
+  await memory_service.add_session_to_memory(MOCK_SESSION_1)
+  await memory_service.add_session_to_memory(MOCK_SESSION_2)
+
+  result = await memory_service.search_memory(
+      app_name=MOCK_APP_NAME, user_id=MOCK_USER_ID, query='ADK rocks'
+  )
+
+  assert len(result.memories) == 1
+  assert (
+      result.memories[0].content.parts[0].text
+      == 'I agree. The Agent Development Kit (ADK) rocks!'
+  )
+
+
+@pytest.mark.asyncio
+async def test_re_adding_session_replaces_its_memories():
+  """Tests that re-adding a session doesn't duplicate its memories."""
+  memory_service = InMemoryMemoryService()
+  await memory_service.add_session_to_memory(MOCK_SESSION_1)
+  updated_session = MOCK_SESSION_1.model_copy(
+      update={'events': MOCK_SESSION_1.events[:1]}
+  )
+  await memory_service.add_session_to_memory(updated_session)
+
+  result = await memory_service.search_memory(
+      app_name=MOCK_APP_NAME, user_id=MOCK_USER_ID, query='ADK'
+  )
+
+  assert len(result.memories) == 1
+  assert result.memories[0].content.parts[0].text == (
+      'The ADK is a great toolkit.'
+  )
+  index = memory_service._indexes[f'{MOCK_APP_NAME}/{MOCK_USER_ID}']
+  assert 'rocks' not in index.postings
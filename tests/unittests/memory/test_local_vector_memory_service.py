@@ -0,0 +1,136 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from google.adk.events.event import Event
+from google.adk.memory.local_vector_memory_service import LocalVectorMemoryService
+from google.adk.sessions.session import Session
+from google.genai import types
+import pytest
+
+MOCK_APP_NAME = 'test-app'
+MOCK_USER_ID = 'test-user'
+
+_VOCABULARY = ['pets', 'cat', 'dog', 'car', 'engine']
+
+
+class _FakeEmbedder:
+  """Embeds texts as the counts of the vocabulary words they contain."""
+
+  def __init__(self):
+    self.embedded_texts = []
+
+  async def __call__(self, texts):
+    self.embedded_texts.extend(texts)
+    return [
+        [float(text.lower().count(word)) for word in _VOCABULARY]
+        for text in texts
+    ]
+
+
+def _event(event_id: str, text: str) -> Event:
+  return Event(
+      id=event_id,
+      invocation_id='inv',
+      author='user',
+      timestamp=12345,
+      content=types.Content(parts=[types.Part(text=text)]),
+  )
+
+
+def _session(session_id: str, events: list[Event], user_id=MOCK_USER_ID):
+  return Session(
+      app_name=MOCK_APP_NAME,
+      user_id=user_id,
+      id=session_id,
+      last_update_time=1000,
+      events=events,
+  )
+
+
+async def _search(memory_service, query: str, user_id=MOCK_USER_ID):
+  response = await memory_service.search_memory(
+      app_name=MOCK_APP_NAME, user_id=user_id, query=query
+  )
+  return [memory.content.parts[0].text for memory in response.memories]
+
+
+@pytest.mark.asyncio
+async def test_search_memory_ranks_by_similarity():
+  memory_service = LocalVectorMemoryService(_FakeEmbedder(), top_k=2)
+  await memory_service.add_session_to_memory(
+      _session(
+          'session-1',
+          [
+              _event('event-1', 'My car has a new engine.'),
+              _event('event-2', 'I have a cat.'),
+              _event('event-3', 'Cat and dog are pets.'),
+              Event(id='event-4', invocation_id='inv', author='user'),
+          ],
+      )
+  )
+
+  assert await _search(memory_service, 'cat pets') == [
+      'Cat and dog are pets.',
+      'I have a cat.',
+  ]
+  assert await _search(memory_service, 'cat pets', user_id='another-user') == []
+
+
+@pytest.mark.asyncio
+async def test_re_adding_session_only_embeds_new_events():
+  embedder = _FakeEmbedder()
+  memory_service = LocalVectorMemoryService(embedder, embedding_batch_size=1)
+  events = [_event('event-1', 'I have a cat.'), _event('event-2', 'A car.')]
+  await memory_service.add_session_to_memory(_session('session-1', events))
+  await memory_service.add_session_to_memory(
+      _session('session-1', events[1:] + [_event('event-3', 'A dog.')])
+  )
+
+  assert embedder.embedded_texts == ['I have a cat.', 'A car.', 'A dog.']
+  assert sorted(await _search(memory_service, 'cat')) == ['A car.', 'A dog.']
+
+
+@pytest.mark.asyncio
+async def test_memories_are_persisted(tmp_path):
+  memory_service = LocalVectorMemoryService(
+      _FakeEmbedder(), persist_directory=str(tmp_path)
+  )
+  # Exceed the initial capacity of the embedding matrix.
+  await memory_service.add_session_to_memory(
+      _session(
+          'session-1',
+          [_event(f'event-{i}', f'Car number {i}.') for i in range(100)]
+          + [_event('event-cat', 'I have a cat.')],
+      )
+  )
+  await memory_service.add_session_to_memory(
+      _session('session-1', [_event('event-cat', 'I have a cat.')])
+  )
+
+  reloaded_service = LocalVectorMemoryService(
+      _FakeEmbedder(), persist_directory=str(tmp_path)
+  )
+  assert await _search(reloaded_service, 'cat') == ['I have a cat.']
+
+
+@pytest.mark.asyncio
+async def test_embedding_count_mismatch():
+  async def embed(texts):
+    return []
+
+  memory_service = LocalVectorMemoryService(embed)
+  with pytest.raises(ValueError):
+    await memory_service.add_session_to_memory(
+        _session('session-1', [_event('event-1', 'I have a cat.')])
+    )
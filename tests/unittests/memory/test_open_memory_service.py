@@ -83,28 +83,26 @@ MOCK_SESSION_WITH_EMPTY_EVENTS = Session(
 
 
 @pytest.fixture
-def mock_httpx_client():
-  """Mock httpx.AsyncClient for testing."""
-  with patch('google.adk.memory.open_memory_service.httpx.AsyncClient') as mock_client_class:
-    mock_client = MagicMock()
+def mock_http_transport():
+  """Mock the shared HTTP transport for testing."""
+  with patch('google.adk.memory.open_memory_service.get_default_http_transport') as mock_get_transport:
+    mock_transport = MagicMock()
     mock_response = MagicMock()
     mock_response.json.return_value = {"matches": []}
     mock_response.raise_for_status = MagicMock()
-    mock_client.post = AsyncMock(return_value=mock_response)
-    mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-    mock_client.__aexit__ = AsyncMock(return_value=None)
-    mock_client_class.return_value = mock_client
-    yield mock_client
+    mock_transport.request = AsyncMock(return_value=mock_response)
+    mock_get_transport.return_value = mock_transport
+    yield mock_transport
 
 
 @pytest.fixture
-def memory_service(mock_httpx_client):
+def memory_service(mock_http_transport):
   """Create OpenMemoryService instance for testing."""
   return OpenMemoryService(base_url='http://localhost:3000', api_key='test-key')
 
 
 @pytest.fixture
-def memory_service_with_config(mock_httpx_client):
+def memory_service_with_config(mock_http_transport):
   """Create OpenMemoryService with custom config."""
   config = OpenMemoryServiceConfig(
       search_top_k=5,
@@ -161,15 +159,15 @@ class TestOpenMemoryService:
   """Tests for OpenMemoryService."""
 
   @pytest.mark.asyncio
-  async def test_add_session_to_memory_success(self, memory_service, mock_httpx_client):
+  async def test_add_session_to_memory_success(self, memory_service, mock_http_transport):
     """Test successful addition of session memories."""
     await memory_service.add_session_to_memory(MOCK_SESSION)
 
     # Should make 2 POST calls (one per valid event)
-    assert mock_httpx_client.post.call_count == 2
+    assert mock_http_transport.request.call_count == 2
 
     # Check first call (user event)
-    call_args = mock_httpx_client.post.call_args_list[0]
+    call_args = mock_http_transport.request.call_args_list[0]
     request_data = call_args.kwargs['json']
     assert '[Author: user' in request_data['content']
     assert 'Hello, I like Python.' in request_data['content']
@@ -178,7 +176,7 @@ class TestOpenMemoryService:
     assert request_data['salience'] == 0.8  # User content salience
 
     # Check second call (model event)
-    call_args = mock_httpx_client.post.call_args_list[1]
+    call_args = mock_http_transport.request.call_args_list[1]
     request_data = call_args.kwargs['json']
     assert '[Author: model' in request_data['content']
     assert 'Python is a great programming language.' in request_data['content']
@@ -187,33 +185,33 @@ class TestOpenMemoryService:
 
   @pytest.mark.asyncio
   async def test_add_session_filters_empty_events(
-      self, memory_service, mock_httpx_client
+      self, memory_service, mock_http_transport
   ):
     """Test that events without content are filtered out."""
     await memory_service.add_session_to_memory(MOCK_SESSION_WITH_EMPTY_EVENTS)
 
     # Should make 0 POST calls (no valid events)
-    assert mock_httpx_client.post.call_count == 0
+    assert mock_http_transport.request.call_count == 0
 
   @pytest.mark.asyncio
   async def test_add_session_uses_config_salience(
-      self, memory_service_with_config, mock_httpx_client
+      self, memory_service_with_config, mock_http_transport
   ):
     """Test that salience values from config are used."""
     await memory_service_with_config.add_session_to_memory(MOCK_SESSION)
 
     # Check that custom salience values are used
-    call_args = mock_httpx_client.post.call_args_list[0]
+    call_args = mock_http_transport.request.call_args_list[0]
     request_data = call_args.kwargs['json']
     assert request_data['salience'] == 0.9  # Custom user salience
 
-    call_args = mock_httpx_client.post.call_args_list[1]
+    call_args = mock_http_transport.request.call_args_list[1]
     request_data = call_args.kwargs['json']
     assert request_data['salience'] == 0.6  # Custom model salience
 
   @pytest.mark.asyncio
   async def test_add_session_without_metadata_tags(
-      self, mock_httpx_client
+      self, mock_http_transport
   ):
     """Test adding memories without metadata tags."""
     config = OpenMemoryServiceConfig(enable_metadata_tags=False)
@@ -223,23 +221,23 @@ class TestOpenMemoryService:
 
     await memory_service.add_session_to_memory(MOCK_SESSION)
 
-    call_args = mock_httpx_client.post.call_args_list[0]
+    call_args = mock_http_transport.request.call_args_list[0]
     request_data = call_args.kwargs['json']
     assert request_data.get('tags', []) == []
 
   @pytest.mark.asyncio
-  async def test_add_session_error_handling(self, memory_service, mock_httpx_client):
+  async def test_add_session_error_handling(self, memory_service, mock_http_transport):
     """Test error handling during memory addition."""
-    mock_httpx_client.post.side_effect = Exception('API Error')
+    mock_http_transport.request.side_effect = Exception('API Error')
 
     # Should not raise exception, just log error
     await memory_service.add_session_to_memory(MOCK_SESSION)
 
     # Should still attempt to make POST calls
-    assert mock_httpx_client.post.call_count == 2
+    assert mock_http_transport.request.call_count == 2
 
   @pytest.mark.asyncio
-  async def test_search_memory_success(self, memory_service, mock_httpx_client):
+  async def test_search_memory_success(self, memory_service, mock_http_transport):
     """Test successful memory search."""
     # Mock response with enriched content format
     mock_response = MagicMock()
@@ -254,7 +252,7 @@ class TestOpenMemoryService:
         ]
     }
     mock_response.raise_for_status = MagicMock()
-    mock_httpx_client.post = AsyncMock(return_value=mock_response)
+    mock_http_transport.request = AsyncMock(return_value=mock_response)
 
     result = await memory_service.search_memory(
         app_name=MOCK_APP_NAME,
@@ -263,7 +261,7 @@ class TestOpenMemoryService:
     )
 
     # Verify API call
-    call_args = mock_httpx_client.post.call_args
+    call_args = mock_http_transport.request.call_args
     request_data = call_args.kwargs['json']
     assert request_data['query'] == 'Python programming'
     assert request_data['k'] == 10
@@ -279,7 +277,7 @@ class TestOpenMemoryService:
 
   @pytest.mark.asyncio
   async def test_search_memory_applies_filters(
-      self, memory_service, mock_httpx_client
+      self, memory_service, mock_http_transport
   ):
     """Test that app_name/user_id filters are applied."""
     # Mock response - server-side filtering ensures only matching results
@@ -292,7 +290,7 @@ class TestOpenMemoryService:
         ]
     }
     mock_response.raise_for_status = MagicMock()
-    mock_httpx_client.post = AsyncMock(return_value=mock_response)
+    mock_http_transport.request = AsyncMock(return_value=mock_response)
 
     result = await memory_service.search_memory(
         app_name=MOCK_APP_NAME,
@@ -301,7 +299,7 @@ class TestOpenMemoryService:
     )
 
     # Verify filters were passed correctly
-    call_args = mock_httpx_client.post.call_args
+    call_args = mock_http_transport.request.call_args
     request_data = call_args.kwargs['json']
     assert request_data['filter']['user_id'] == MOCK_USER_ID
     assert f"app:{MOCK_APP_NAME}" in request_data['filter']['tags']
@@ -312,13 +310,13 @@ class TestOpenMemoryService:
 
   @pytest.mark.asyncio
   async def test_search_memory_respects_top_k(
-      self, memory_service_with_config, mock_httpx_client
+      self, memory_service_with_config, mock_http_transport
   ):
     """Test that config.search_top_k is used."""
     mock_response = MagicMock()
     mock_response.json.return_value = {'matches': []}
     mock_response.raise_for_status = MagicMock()
-    mock_httpx_client.post = AsyncMock(return_value=mock_response)
+    mock_http_transport.request = AsyncMock(return_value=mock_response)
 
     await memory_service_with_config.search_memory(
         app_name=MOCK_APP_NAME,
@@ -326,16 +324,16 @@ class TestOpenMemoryService:
         query='test query'
     )
 
-    call_args = mock_httpx_client.post.call_args
+    call_args = mock_http_transport.request.call_args
     request_data = call_args.kwargs['json']
     assert request_data['k'] == 5  # Custom config value
 
   @pytest.mark.asyncio
   async def test_search_memory_error_handling(
-      self, memory_service, mock_httpx_client
+      self, memory_service, mock_http_transport
   ):
     """Test graceful error handling during memory search."""
-    mock_httpx_client.post.side_effect = Exception('API Error')
+    mock_http_transport.request.side_effect = Exception('API Error')
 
     result = await memory_service.search_memory(
         app_name=MOCK_APP_NAME,
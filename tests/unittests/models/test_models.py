@@ -13,12 +13,30 @@
 # limitations under the License.
 
 from google.adk import models
+from google.adk.models import registry
 from google.adk.models.anthropic_llm import Claude
 from google.adk.models.google_llm import Gemini
 from google.adk.models.registry import LLMRegistry
 import pytest
 
 
+@pytest.fixture
+def restore_llm_registry(monkeypatch):
+  """Restores the LLM registry and its caches after the test."""
+  monkeypatch.setattr(
+      registry, '_llm_registry_dict', dict(registry._llm_registry_dict)
+  )
+  monkeypatch.setattr(
+      registry, '_compiled_regex_dict', dict(registry._compiled_regex_dict)
+  )
+  monkeypatch.setattr(
+      registry, '_shared_llm_instances', dict(registry._shared_llm_instances)
+  )
+  LLMRegistry.resolve.cache_clear()
+  yield
+  LLMRegistry.resolve.cache_clear()
+
+
 @pytest.mark.parametrize(
     'model_name',
     [
@@ -60,3 +78,31 @@ def test_non_exist_model():
   with pytest.raises(ValueError) as e_info:
     models.LLMRegistry.resolve('non-exist-model')
   assert 'Model non-exist-model not found.' in str(e_info.value)
+
+
+def test_register_invalidates_resolve_cache(restore_llm_registry):
+  class CustomGemini(Gemini):
+
+    @classmethod
+    def supported_models(cls) -> list[str]:
+      return [r'custom-gemini-.*']
+
+  with pytest.raises(ValueError):
+    LLMRegistry.resolve('custom-gemini-1')
+
+  LLMRegistry.register(CustomGemini)
+
+  assert LLMRegistry.resolve('custom-gemini-1') is CustomGemini
+
+
+def test_new_llm_shared_instances():
+  LLMRegistry.set_instance_sharing(True)
+  try:
+    llm = LLMRegistry.new_llm('gemini-1.5-flash')
+
+    assert LLMRegistry.new_llm('gemini-1.5-flash') is llm
+    assert LLMRegistry.new_llm('gemini-1.5-pro') is not llm
+  finally:
+    LLMRegistry.set_instance_sharing(False)
+
+  assert LLMRegistry.new_llm('gemini-1.5-flash') is not llm
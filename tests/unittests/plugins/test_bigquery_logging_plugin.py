@@ -114,12 +114,18 @@ class TestBigQueryAgentAnalyticsPlugin(PluginTestBase):
         dataset_id=self.dataset_id,
         table_id=self.table_id,
     )
-    # Trigger lazy initialization by calling an async method once.
-    asyncio.run(self.plugin._log_to_bigquery_async({"event_type": "INIT"}))
+
+    # Trigger lazy initialization by writing a row once.
+    async def _initialize():
+      await self.plugin._log_to_bigquery_async({"event_type": "INIT"})
+      await self.plugin.flush()
+
+    asyncio.run(_initialize())
     self.mock_bq_client.insert_rows_json.reset_mock()
 
-  def _get_logged_entry(self):
+  async def _get_logged_entry(self):
     """Helper to get the single logged entry from the mocked client."""
+    await self.plugin.flush()
     self.mock_bq_client.insert_rows_json.assert_called_once()
     args, _ = self.mock_bq_client.insert_rows_json.call_args
     rows = args[1]
@@ -141,7 +147,7 @@ class TestBigQueryAgentAnalyticsPlugin(PluginTestBase):
         invocation_context=self.invocation_context, user_message=user_message
     )
 
-    log_entry = self._get_logged_entry()
+    log_entry = await self._get_logged_entry()
     self._assert_common_fields(log_entry, "USER_MESSAGE_RECEIVED")
     assert log_entry["content"] == "User Content: text: 'What is up?'"
 
@@ -159,7 +165,7 @@ class TestBigQueryAgentAnalyticsPlugin(PluginTestBase):
         invocation_context=self.invocation_context, event=event
     )
 
-    log_entry = self._get_logged_entry()
+    log_entry = await self._get_logged_entry()
     self._assert_common_fields(log_entry, "TOOL_CALL")
     logged_content = json.loads(log_entry["content"])
     assert logged_content[0]["function_call"]["args"] == {"location": "Paris"}
@@ -179,7 +185,7 @@ class TestBigQueryAgentAnalyticsPlugin(PluginTestBase):
         invocation_context=self.invocation_context, event=event
     )
 
-    log_entry = self._get_logged_entry()
+    log_entry = await self._get_logged_entry()
     self._assert_common_fields(log_entry, "MODEL_RESPONSE")
     logged_content = json.loads(log_entry["content"])
     assert logged_content[0]["text"] == "Hello there!"
@@ -205,6 +211,7 @@ class TestBigQueryAgentAnalyticsPlugin(PluginTestBase):
       await plugin_with_fail.before_run_callback(
           invocation_context=self.invocation_context
       )
+      await plugin_with_fail.flush()
       mock_log_exception.assert_called_once()
 
     # Ensure insert_rows_json was never called because init failed
@@ -220,6 +227,7 @@ class TestBigQueryAgentAnalyticsPlugin(PluginTestBase):
           invocation_context=self.invocation_context,
           user_message=types.Content(parts=[types.Part(text="Test")]),
       )
+      await self.plugin.flush()
       # The plugin should handle the error internally without raising
       mock_log_error.assert_called_with(
           "Errors occurred while inserting to BigQuery table %s.%s: %s",
@@ -230,12 +238,39 @@ class TestBigQueryAgentAnalyticsPlugin(PluginTestBase):
 
     self.mock_bq_client.insert_rows_json.assert_called_once()
 
+  @pytest.mark.asyncio
+  async def test_unexpected_insert_exception_does_not_stop_flushing(self):
+    plugin = bigquery_logging_plugin.BigQueryAgentAnalyticsPlugin(
+        project_id=self.project_id,
+        dataset_id=self.dataset_id,
+        table_id=self.table_id,
+        batch_size=1,
+        flush_interval_seconds=60,
+    )
+    self.mock_bq_client.insert_rows_json.side_effect = [
+        ValueError("Unexpected"),
+        [],
+    ]
+
+    with mock.patch.object(logging, "exception") as mock_log_exception:
+      for event_type in ["A", "B"]:
+        await plugin._log_to_bigquery_async({"event_type": event_type})
+        for _ in range(10):
+          await asyncio.sleep(0)
+      mock_log_exception.assert_called_once()
+      assert mock_log_exception.call_args.args[1] == 1
+
+    assert not plugin._flush_task.done()
+    rows = self.mock_bq_client.insert_rows_json.call_args.args[1]
+    assert [row["event_type"] for row in rows] == ["B"]
+    await plugin.close()
+
   @pytest.mark.asyncio
   async def test_before_run_callback_logs_correctly(self):
     await self.plugin.before_run_callback(
         invocation_context=self.invocation_context
     )
-    log_entry = self._get_logged_entry()
+    log_entry = await self._get_logged_entry()
     self._assert_common_fields(log_entry, "INVOCATION_STARTING")
     assert log_entry["content"] is None
 
@@ -244,7 +279,7 @@ class TestBigQueryAgentAnalyticsPlugin(PluginTestBase):
     await self.plugin.after_run_callback(
         invocation_context=self.invocation_context
     )
-    log_entry = self._get_logged_entry()
+    log_entry = await self._get_logged_entry()
     self._assert_common_fields(log_entry, "INVOCATION_COMPLETED")
     assert log_entry["content"] is None
 
@@ -253,7 +288,7 @@ class TestBigQueryAgentAnalyticsPlugin(PluginTestBase):
     await self.plugin.before_agent_callback(
         agent=self.mock_agent, callback_context=self.callback_context
     )
-    log_entry = self._get_logged_entry()
+    log_entry = await self._get_logged_entry()
     self._assert_common_fields(log_entry, "AGENT_STARTING")
     assert log_entry["content"] == "Agent Name: MyTestAgent"
 
@@ -262,7 +297,7 @@ class TestBigQueryAgentAnalyticsPlugin(PluginTestBase):
     await self.plugin.after_agent_callback(
         agent=self.mock_agent, callback_context=self.callback_context
     )
-    log_entry = self._get_logged_entry()
+    log_entry = await self._get_logged_entry()
     self._assert_common_fields(log_entry, "AGENT_COMPLETED")
     assert log_entry["content"] == "Agent Name: MyTestAgent"
 
@@ -287,7 +322,7 @@ class TestBigQueryAgentAnalyticsPlugin(PluginTestBase):
     await self.plugin.before_model_callback(
         callback_context=self.callback_context, llm_request=llm_request
     )
-    log_entry = self._get_logged_entry()
+    log_entry = await self._get_logged_entry()
     self._assert_common_fields(log_entry, "LLM_REQUEST")
     assert "Model: gemini-pro" in log_entry["content"]
     assert "System Prompt: Be helpful" in log_entry["content"]
@@ -309,7 +344,7 @@ class TestBigQueryAgentAnalyticsPlugin(PluginTestBase):
     await self.plugin.after_model_callback(
         callback_context=self.callback_context, llm_response=llm_response
     )
-    log_entry = self._get_logged_entry()
+    log_entry = await self._get_logged_entry()
     self._assert_common_fields(log_entry, "LLM_RESPONSE")
     assert (
         "Tool Name: text_response, text: 'Model response'"
@@ -333,7 +368,7 @@ class TestBigQueryAgentAnalyticsPlugin(PluginTestBase):
     await self.plugin.after_model_callback(
         callback_context=self.callback_context, llm_response=llm_response
     )
-    log_entry = self._get_logged_entry()
+    log_entry = await self._get_logged_entry()
     self._assert_common_fields(log_entry, "LLM_RESPONSE")
     assert "Tool Name: tool1" in log_entry["content"]
 
@@ -346,7 +381,7 @@ class TestBigQueryAgentAnalyticsPlugin(PluginTestBase):
     await self.plugin.before_tool_callback(
         tool=mock_tool, tool_args=tool_args, tool_context=self.tool_context
     )
-    log_entry = self._get_logged_entry()
+    log_entry = await self._get_logged_entry()
     self._assert_common_fields(log_entry, "TOOL_STARTING")
     assert "Tool Name: MyTool" in log_entry["content"]
     assert "Description: Does something" in log_entry["content"]
@@ -364,7 +399,7 @@ class TestBigQueryAgentAnalyticsPlugin(PluginTestBase):
         tool_context=self.tool_context,
         result=result,
     )
-    log_entry = self._get_logged_entry()
+    log_entry = await self._get_logged_entry()
     self._assert_common_fields(log_entry, "TOOL_COMPLETED")
     assert "Tool Name: MyTool" in log_entry["content"]
     assert "Result: {'status': 'success'}" in log_entry["content"]
@@ -380,7 +415,7 @@ class TestBigQueryAgentAnalyticsPlugin(PluginTestBase):
         llm_request=llm_request,
         error=error,
     )
-    log_entry = self._get_logged_entry()
+    log_entry = await self._get_logged_entry()
     self._assert_common_fields(log_entry, "LLM_ERROR")
     assert log_entry["content"] is None
     assert log_entry["error_message"] == "LLM failed"
@@ -396,7 +431,76 @@ class TestBigQueryAgentAnalyticsPlugin(PluginTestBase):
         tool_context=self.tool_context,
         error=error,
     )
-    log_entry = self._get_logged_entry()
+    log_entry = await self._get_logged_entry()
     self._assert_common_fields(log_entry, "TOOL_ERROR")
     assert log_entry["content"] == "Tool Name: MyTool"
     assert log_entry["error_message"] == "Tool timed out"
+
+  @pytest.mark.asyncio
+  async def test_rows_are_written_in_batches(self):
+    for _ in range(3):
+      await self.plugin.before_run_callback(
+          invocation_context=self.invocation_context
+      )
+    self.mock_bq_client.insert_rows_json.assert_not_called()
+
+    await self.plugin.flush()
+
+    self.mock_bq_client.insert_rows_json.assert_called_once()
+    rows = self.mock_bq_client.insert_rows_json.call_args.args[1]
+    assert [row["event_type"] for row in rows] == ["INVOCATION_STARTING"] * 3
+
+  @pytest.mark.asyncio
+  async def test_full_batch_is_flushed_in_background(self):
+    plugin = bigquery_logging_plugin.BigQueryAgentAnalyticsPlugin(
+        project_id=self.project_id,
+        dataset_id=self.dataset_id,
+        table_id=self.table_id,
+        batch_size=2,
+        flush_interval_seconds=60,
+    )
+    for _ in range(2):
+      await plugin.before_run_callback(
+          invocation_context=self.invocation_context
+      )
+
+    for _ in range(10):
+      if self.mock_bq_client.insert_rows_json.called:
+        break
+      await asyncio.sleep(0)
+
+    self.mock_bq_client.insert_rows_json.assert_called_once()
+    assert len(self.mock_bq_client.insert_rows_json.call_args.args[1]) == 2
+    await plugin.close()
+
+  @pytest.mark.asyncio
+  async def test_oldest_rows_are_dropped_when_buffer_is_full(self):
+    plugin = bigquery_logging_plugin.BigQueryAgentAnalyticsPlugin(
+        project_id=self.project_id,
+        dataset_id=self.dataset_id,
+        table_id=self.table_id,
+        batch_size=2,
+        max_buffered_rows=2,
+        flush_interval_seconds=60,
+    )
+    for event_type in ["A", "B", "C"]:
+      await plugin._log_to_bigquery_async({"event_type": event_type})
+
+    with mock.patch.object(logging, "warning") as mock_log_warning:
+      await plugin.close()
+      mock_log_warning.assert_called_once()
+
+    rows = self.mock_bq_client.insert_rows_json.call_args.args[1]
+    assert [row["event_type"] for row in rows] == ["B", "C"]
+
+  @pytest.mark.asyncio
+  async def test_close_flushes_buffered_rows(self):
+    await self.plugin.after_run_callback(
+        invocation_context=self.invocation_context
+    )
+
+    await plugin_manager_lib.PluginManager(plugins=[self.plugin]).close()
+
+    log_entry = await self._get_logged_entry()
+    self._assert_common_fields(log_entry, "INVOCATION_COMPLETED")
+    assert self.plugin._flush_task is None
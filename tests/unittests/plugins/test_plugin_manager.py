@@ -16,6 +16,9 @@
 
 from __future__ import annotations
 
+import asyncio
+import typing
+from unittest.mock import AsyncMock
 from unittest.mock import Mock
 
 from google.adk.models.llm_response import LlmResponse
@@ -267,3 +270,103 @@ async def test_all_callbacks_are_supported(
       "on_model_error_callback",
   ]
   assert set(plugin1.call_log) == set(expected_callbacks)
+
+
+class SlowObserverPlugin(BasePlugin):
+  """An observe-only plugin that waits for its peer to start."""
+
+  observe_only_callbacks = frozenset({"on_event_callback"})
+
+  def __init__(self, name: str, started: asyncio.Event, peer: asyncio.Event):
+    super().__init__(name)
+    self.started = started
+    self.peer = peer
+    self.observed = False
+
+  async def on_event_callback(self, **kwargs):
+    self.started.set()
+    # Only completes if the other observer runs concurrently.
+    await self.peer.wait()
+    self.observed = True
+
+
+@pytest.mark.asyncio
+async def test_observe_only_callbacks_run_concurrently(service: PluginManager):
+  """Tests that observe-only callbacks of several plugins overlap."""
+  started1 = asyncio.Event()
+  started2 = asyncio.Event()
+  observer1 = SlowObserverPlugin("observer1", started1, started2)
+  observer2 = SlowObserverPlugin("observer2", started2, started1)
+  service.register_plugin(observer1)
+  service.register_plugin(observer2)
+
+  result = await asyncio.wait_for(
+      service.run_on_event_callback(invocation_context=Mock(), event=Mock()),
+      timeout=5,
+  )
+
+  assert result is None
+  assert observer1.observed
+  assert observer2.observed
+
+
+@pytest.mark.asyncio
+async def test_observe_only_callbacks_run_after_early_exit(
+    service: PluginManager, plugin1: TestPlugin, plugin2: TestPlugin
+):
+  """Tests that an early exit only skips the intercepting callbacks."""
+  mock_event = Mock()
+  plugin1.return_values["on_event_callback"] = mock_event
+  plugin2.observe_only_callbacks = frozenset({"on_event_callback"})
+  plugin3 = TestPlugin(name="plugin3")
+  service.register_plugin(plugin1)
+  service.register_plugin(plugin3)
+  service.register_plugin(plugin2)
+
+  result = await service.run_on_event_callback(
+      invocation_context=Mock(), event=Mock()
+  )
+
+  assert result is mock_event
+  assert "on_event_callback" not in plugin3.call_log
+  assert "on_event_callback" in plugin2.call_log
+
+
+@pytest.mark.asyncio
+async def test_observe_only_callback_return_value_is_ignored(
+    service: PluginManager, plugin1: TestPlugin
+):
+  """Tests that observe-only callbacks cannot short circuit the chain."""
+  plugin1.observe_only_callbacks = frozenset({"before_run_callback"})
+  plugin1.return_values["before_run_callback"] = Mock()
+  service.register_plugin(plugin1)
+
+  result = await service.run_before_run_callback(invocation_context=Mock())
+
+  assert result is None
+  assert "before_run_callback" in plugin1.call_log
+
+
+def test_all_callbacks_lists_every_plugin_callback():
+  """Tests that BasePlugin.ALL_CALLBACKS names every plugin callback."""
+  assert BasePlugin.ALL_CALLBACKS == frozenset(
+      typing.get_args(PluginCallbackName)
+  )
+  for callback_name in BasePlugin.ALL_CALLBACKS:
+    assert callable(getattr(BasePlugin, callback_name))
+
+
+@pytest.mark.asyncio
+async def test_close_closes_all_plugins(
+    service: PluginManager, plugin1: TestPlugin, plugin2: TestPlugin
+):
+  """Tests that a failing plugin doesn't prevent the others from closing."""
+  plugin1.close = AsyncMock(side_effect=ValueError("close failed"))
+  plugin2.close = AsyncMock()
+  service.register_plugin(plugin1)
+  service.register_plugin(plugin2)
+
+  await service.close()
+
+  plugin1.close.assert_awaited_once()
+  plugin2.close.assert_awaited_once()
@@ -11,16 +11,20 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-
+import asyncio
 from datetime import datetime
 from datetime import timezone
 import enum
+from unittest import mock
 
 from google.adk.errors.already_exists_error import AlreadyExistsError
 from google.adk.events.event import Event
 from google.adk.events.event_actions import EventActions
+from google.adk.sessions import database_session_service
 from google.adk.sessions.base_session_service import GetSessionConfig
+from google.adk.sessions.base_session_service import ListSessionsConfig
 from google.adk.sessions.database_session_service import DatabaseSessionService
+from google.adk.sessions.database_session_service import WriteBehindConfig
 from google.adk.sessions.in_memory_session_service import InMemorySessionService
 from google.genai import types
 import pytest
@@ -29,6 +33,7 @@ import pytest
 class SessionServiceType(enum.Enum):
   IN_MEMORY = 'IN_MEMORY'
   DATABASE = 'DATABASE'
+  ASYNC_DATABASE = 'ASYNC_DATABASE'
 
 
 def get_session_service(
@@ -37,12 +42,19 @@ def get_session_service(
   """Creates a session service for testing."""
   if service_type == SessionServiceType.DATABASE:
     return DatabaseSessionService('sqlite:///:memory:')
+  if service_type == SessionServiceType.ASYNC_DATABASE:
+    return DatabaseSessionService('sqlite+aiosqlite:///:memory:')
   return InMemorySessionService()
 
 
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
-    'service_type', [SessionServiceType.IN_MEMORY, SessionServiceType.DATABASE]
+    'service_type',
+    [
+        SessionServiceType.IN_MEMORY,
+        SessionServiceType.DATABASE,
+        SessionServiceType.ASYNC_DATABASE,
+    ],
 )
 async def test_get_empty_session(service_type):
   session_service = get_session_service(service_type)
@@ -53,7 +65,12 @@ async def test_get_empty_session(service_type):
 
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
-    'service_type', [SessionServiceType.IN_MEMORY, SessionServiceType.DATABASE]
+    'service_type',
+    [
+        SessionServiceType.IN_MEMORY,
+        SessionServiceType.DATABASE,
+        SessionServiceType.ASYNC_DATABASE,
+    ],
 )
 async def test_create_get_session(service_type):
   session_service = get_session_service(service_type)
@@ -97,7 +114,12 @@ async def test_create_get_session(service_type):
 
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
-    'service_type', [SessionServiceType.IN_MEMORY, SessionServiceType.DATABASE]
+    'service_type',
+    [
+        SessionServiceType.IN_MEMORY,
+        SessionServiceType.DATABASE,
+        SessionServiceType.ASYNC_DATABASE,
+    ],
 )
 async def test_create_and_list_sessions(service_type):
   session_service = get_session_service(service_type)
@@ -125,7 +147,12 @@ async def test_create_and_list_sessions(service_type):
 
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
-    'service_type', [SessionServiceType.IN_MEMORY, SessionServiceType.DATABASE]
+    'service_type',
+    [
+        SessionServiceType.IN_MEMORY,
+        SessionServiceType.DATABASE,
+        SessionServiceType.ASYNC_DATABASE,
+    ],
 )
 async def test_list_sessions_all_users(service_type):
   session_service = get_session_service(service_type)
@@ -185,7 +212,89 @@ async def test_list_sessions_all_users(service_type):
 
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
-    'service_type', [SessionServiceType.IN_MEMORY, SessionServiceType.DATABASE]
+    'service_type',
+    [
+        SessionServiceType.IN_MEMORY,
+        SessionServiceType.DATABASE,
+        SessionServiceType.ASYNC_DATABASE,
+    ],
+)
+@pytest.mark.parametrize('descending', [False, True])
+async def test_list_sessions_with_pagination(service_type, descending):
+  session_service = get_session_service(service_type)
+  app_name = 'my_app'
+  for user_id in ['user1', 'user2']:
+    for i in range(3):
+      await session_service.create_session(
+          app_name=app_name,
+          user_id=user_id,
+          session_id=f'session{i}',
+          state={'key': 'value'},
+      )
+  await session_service.create_session(
+      app_name=app_name, user_id='user1', session_id='___eval___session'
+  )
+
+  listed_sessions = []
+  config = ListSessionsConfig(
+      page_size=4,
+      exclude_id_prefixes=['___eval___'],
+      descending=descending,
+  )
+  while True:
+    response = await session_service.list_sessions(
+        app_name=app_name, config=config
+    )
+    assert len(response.sessions) <= 4
+    listed_sessions.extend(response.sessions)
+    if response.next_page_token is None:
+      break
+    config = config.model_copy(update={'page_token': response.next_page_token})
+
+  sort_keys = [(s.last_update_time, s.user_id, s.id) for s in listed_sessions]
+  assert sort_keys == sorted(sort_keys, reverse=descending)
+  assert len(set(sort_keys)) == 6
+  assert all(s.state == {'key': 'value'} for s in listed_sessions)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    'service_type',
+    [
+        SessionServiceType.IN_MEMORY,
+        SessionServiceType.DATABASE,
+        SessionServiceType.ASYNC_DATABASE,
+    ],
+)
+async def test_list_sessions_updated_after(service_type):
+  session_service = get_session_service(service_type)
+  session = await session_service.create_session(
+      app_name='my_app', user_id='user'
+  )
+
+  response = await session_service.list_sessions(
+      app_name='my_app',
+      user_id='user',
+      config=ListSessionsConfig(updated_after=session.last_update_time - 10),
+  )
+  assert [s.id for s in response.sessions] == [session.id]
+
+  response = await session_service.list_sessions(
+      app_name='my_app',
+      user_id='user',
+      config=ListSessionsConfig(updated_after=session.last_update_time + 10),
+  )
+  assert not response.sessions
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    'service_type',
+    [
+        SessionServiceType.IN_MEMORY,
+        SessionServiceType.DATABASE,
+        SessionServiceType.ASYNC_DATABASE,
+    ],
 )
 async def test_app_state_is_shared_by_all_users_of_app(service_type):
   session_service = get_session_service(service_type)
@@ -218,7 +327,12 @@ async def test_app_state_is_shared_by_all_users_of_app(service_type):
 
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
-    'service_type', [SessionServiceType.IN_MEMORY, SessionServiceType.DATABASE]
+    'service_type',
+    [
+        SessionServiceType.IN_MEMORY,
+        SessionServiceType.DATABASE,
+        SessionServiceType.ASYNC_DATABASE,
+    ],
 )
 async def test_user_state_is_shared_only_by_user_sessions(service_type):
   session_service = get_session_service(service_type)
@@ -250,7 +364,12 @@ async def test_user_state_is_shared_only_by_user_sessions(service_type):
 
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
-    'service_type', [SessionServiceType.IN_MEMORY, SessionServiceType.DATABASE]
+    'service_type',
+    [
+        SessionServiceType.IN_MEMORY,
+        SessionServiceType.DATABASE,
+        SessionServiceType.ASYNC_DATABASE,
+    ],
 )
 async def test_session_state_is_not_shared(service_type):
   session_service = get_session_service(service_type)
@@ -283,7 +402,12 @@ async def test_session_state_is_not_shared(service_type):
 
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
-    'service_type', [SessionServiceType.IN_MEMORY, SessionServiceType.DATABASE]
+    'service_type',
+    [
+        SessionServiceType.IN_MEMORY,
+        SessionServiceType.DATABASE,
+        SessionServiceType.ASYNC_DATABASE,
+    ],
 )
 async def test_temp_state_is_not_persisted_in_state_or_events(service_type):
   session_service = get_session_service(service_type)
@@ -313,7 +437,12 @@ async def test_temp_state_is_not_persisted_in_state_or_events(service_type):
 
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
-    'service_type', [SessionServiceType.IN_MEMORY, SessionServiceType.DATABASE]
+    'service_type',
+    [
+        SessionServiceType.IN_MEMORY,
+        SessionServiceType.DATABASE,
+        SessionServiceType.ASYNC_DATABASE,
+    ],
 )
 async def test_get_session_respects_user_id(service_type):
   session_service = get_session_service(service_type)
@@ -339,7 +468,12 @@ async def test_get_session_respects_user_id(service_type):
 
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
-    'service_type', [SessionServiceType.IN_MEMORY, SessionServiceType.DATABASE]
+    'service_type',
+    [
+        SessionServiceType.IN_MEMORY,
+        SessionServiceType.DATABASE,
+        SessionServiceType.ASYNC_DATABASE,
+    ],
 )
 async def test_create_session_with_existing_id_raises_error(service_type):
   session_service = get_session_service(service_type)
@@ -365,7 +499,12 @@ async def test_create_session_with_existing_id_raises_error(service_type):
 
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
-    'service_type', [SessionServiceType.IN_MEMORY, SessionServiceType.DATABASE]
+    'service_type',
+    [
+        SessionServiceType.IN_MEMORY,
+        SessionServiceType.DATABASE,
+        SessionServiceType.ASYNC_DATABASE,
+    ],
 )
 async def test_append_event_bytes(service_type):
   session_service = get_session_service(service_type)
@@ -406,7 +545,12 @@ async def test_append_event_bytes(service_type):
 
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
-    'service_type', [SessionServiceType.IN_MEMORY, SessionServiceType.DATABASE]
+    'service_type',
+    [
+        SessionServiceType.IN_MEMORY,
+        SessionServiceType.DATABASE,
+        SessionServiceType.ASYNC_DATABASE,
+    ],
 )
 async def test_append_event_complete(service_type):
   session_service = get_session_service(service_type)
@@ -454,7 +598,12 @@ async def test_append_event_complete(service_type):
 
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
-    'service_type', [SessionServiceType.IN_MEMORY, SessionServiceType.DATABASE]
+    'service_type',
+    [
+        SessionServiceType.IN_MEMORY,
+        SessionServiceType.DATABASE,
+        SessionServiceType.ASYNC_DATABASE,
+    ],
 )
 async def test_get_session_with_config(service_type):
   session_service = get_session_service(service_type)
@@ -518,7 +667,12 @@ async def test_get_session_with_config(service_type):
 
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
-    'service_type', [SessionServiceType.IN_MEMORY, SessionServiceType.DATABASE]
+    'service_type',
+    [
+        SessionServiceType.IN_MEMORY,
+        SessionServiceType.DATABASE,
+        SessionServiceType.ASYNC_DATABASE,
+    ],
 )
 async def test_partial_events_are_not_persisted(service_type):
   session_service = get_session_service(service_type)
@@ -537,3 +691,214 @@ async def test_partial_events_are_not_persisted(service_type):
       app_name=app_name, user_id=user_id, session_id=session.id
   )
   assert len(session_got.events) == 0
+
+
+@pytest.mark.asyncio
+async def test_in_memory_get_session_returns_snapshot():
+  session_service = get_session_service(SessionServiceType.IN_MEMORY)
+  app_name = 'my_app'
+  user_id = 'user'
+  session = await session_service.create_session(
+      app_name=app_name, user_id=user_id, state={'key': {'nested': 1}}
+  )
+  await session_service.append_event(session, Event(author='user', timestamp=1))
+
+  got_session = await session_service.get_session(
+      app_name=app_name, user_id=user_id, session_id=session.id
+  )
+  got_session.events.append(Event(author='user', timestamp=2))
+  got_session.state['key']['nested'] = 2
+
+  session_again = await session_service.get_session(
+      app_name=app_name, user_id=user_id, session_id=session.id
+  )
+  assert len(session_again.events) == 1
+  assert session_again.state['key'] == {'nested': 1}
+
+
+@pytest.mark.asyncio
+async def test_in_memory_snapshots_share_immutable_events():
+  session_service = get_session_service(SessionServiceType.IN_MEMORY)
+  session = await session_service.create_session(
+      app_name='my_app', user_id='user'
+  )
+  event = Event(author='user', timestamp=1)
+  await session_service.append_event(session, event)
+
+  got_session = await session_service.get_session(
+      app_name='my_app', user_id='user', session_id=session.id
+  )
+  session_again = await session_service.get_session(
+      app_name='my_app', user_id='user', session_id=session.id
+  )
+
+  # The events are not copied, so callers must not mutate them, but each
+  # snapshot has its own list of events.
+  assert got_session.events[0] is event
+  assert session_again.events[0] is event
+  assert got_session.events is not session_again.events
+
+
+@pytest.mark.asyncio
+async def test_database_write_behind_batches_events():
+  session_service = DatabaseSessionService(
+      'sqlite:///:memory:',
+      write_behind_config=WriteBehindConfig(
+          max_batch_size=3, max_delay_seconds=60
+      ),
+  )
+  app_name = 'my_app'
+  user_id = 'user'
+  session = await session_service.create_session(
+      app_name=app_name, user_id=user_id
+  )
+
+  with mock.patch(
+      'google.adk.sessions.database_session_service._persist_events',
+      wraps=database_session_service._persist_events,
+  ) as mock_persist:
+    for i in range(1, 3):
+      await session_service.append_event(
+          session,
+          Event(
+              author='user',
+              timestamp=i,
+              actions=EventActions(state_delta={f'key{i}': i}),
+          ),
+      )
+    # The events are buffered, but the in-memory session is up to date.
+    mock_persist.assert_not_called()
+    assert len(session.events) == 2
+    assert session.state == {'key1': 1, 'key2': 2}
+
+    # Reading the session flushes the buffered events in one transaction.
+    got_session = await session_service.get_session(
+        app_name=app_name, user_id=user_id, session_id=session.id
+    )
+    mock_persist.assert_called_once()
+    assert [e.timestamp for e in got_session.events] == [1, 2]
+    assert got_session.state == {'key1': 1, 'key2': 2}
+
+    # Reaching max_batch_size flushes the buffered events.
+    for i in range(3, 6):
+      await session_service.append_event(
+          session, Event(author='user', timestamp=i)
+      )
+    assert mock_persist.call_count == 2
+
+  got_session = await session_service.get_session(
+      app_name=app_name, user_id=user_id, session_id=session.id
+  )
+  assert len(got_session.events) == 5
+
+
+@pytest.mark.asyncio
+async def test_database_write_behind_flush_events():
+  session_service = DatabaseSessionService(
+      'sqlite:///:memory:', write_behind_config=WriteBehindConfig()
+  )
+  session = await session_service.create_session(
+      app_name='my_app', user_id='user'
+  )
+  await session_service.append_event(session, Event(author='user'))
+
+  await session_service.flush_events(session)
+
+  assert not session_service._pending_events
+  got_session = await session_service.get_session(
+      app_name='my_app', user_id='user', session_id=session.id
+  )
+  assert len(got_session.events) == 1
+  assert got_session.last_update_time == session.last_update_time
+
+
+@pytest.mark.asyncio
+async def test_database_write_behind_failed_flush_keeps_events():
+  session_service = DatabaseSessionService(
+      'sqlite:///:memory:', write_behind_config=WriteBehindConfig()
+  )
+  session = await session_service.create_session(
+      app_name='my_app', user_id='user'
+  )
+  await session_service.append_event(session, Event(author='user'))
+
+  with mock.patch(
+      'google.adk.sessions.database_session_service._persist_events',
+      side_effect=ValueError('Database error'),
+  ):
+    with pytest.raises(ValueError):
+      await session_service.flush_events(session)
+  assert session_service._pending_events
+
+  await session_service.flush_events(session)
+  got_session = await session_service.get_session(
+      app_name='my_app', user_id='user', session_id=session.id
+  )
+  assert len(got_session.events) == 1
+
+
+@pytest.mark.asyncio
+async def test_database_write_behind_stale_flush_does_not_break_reads():
+  session_service = DatabaseSessionService(
+      'sqlite:///:memory:', write_behind_config=WriteBehindConfig()
+  )
+  session = await session_service.create_session(
+      app_name='my_app', user_id='user'
+  )
+  # As if another writer updated the session since it was read.
+  session.last_update_time -= 10
+  await session_service.append_event(session, Event(author='user'))
+
+  # Reads drop the stale batch instead of failing.
+  got_session = await session_service.get_session(
+      app_name='my_app', user_id='user', session_id=session.id
+  )
+  assert not got_session.events
+  assert not session_service._pending_events
+  sessions = await session_service.list_sessions(app_name='my_app')
+  assert len(sessions.sessions) == 1
+
+  # The error is raised to the writer of the stale session, once.
+  with pytest.raises(ValueError, match='stale session'):
+    await session_service.flush_events(session)
+  await session_service.flush_events(session)
+
+
+@pytest.mark.asyncio
+async def test_database_write_behind_stale_flush_raises_to_writer():
+  session_service = DatabaseSessionService(
+      'sqlite:///:memory:', write_behind_config=WriteBehindConfig()
+  )
+  session = await session_service.create_session(
+      app_name='my_app', user_id='user'
+  )
+  # As if another writer updated the session since it was read.
+  session.last_update_time -= 10
+  await session_service.append_event(session, Event(author='user'))
+
+  with pytest.raises(ValueError, match='stale session'):
+    await session_service.flush_events(session)
+
+  assert not session_service._pending_events
+  got_session = await session_service.get_session(
+      app_name='my_app', user_id='user', session_id=session.id
+  )
+  assert not got_session.events
+
+
+@pytest.mark.asyncio
+async def test_database_write_behind_flushes_idle_session_on_timer():
+  session_service = DatabaseSessionService(
+      'sqlite:///:memory:',
+      write_behind_config=WriteBehindConfig(max_delay_seconds=0.05),
+  )
+  session = await session_service.create_session(
+      app_name='my_app', user_id='user'
+  )
+  await session_service.append_event(session, Event(author='user'))
+  assert session_service._pending_events
+
+  await asyncio.sleep(0.2)
+
+  assert not session_service._pending_events
+  assert not session_service._timer_flushes
@@ -28,6 +28,7 @@ from google.adk.auth.auth_tool import AuthConfig
 from google.adk.events.event import Event
 from google.adk.events.event_actions import EventActions
 from google.adk.sessions.base_session_service import GetSessionConfig
+from google.adk.sessions.base_session_service import ListSessionsConfig
 from google.adk.sessions.session import Session
 from google.adk.sessions.vertex_ai_session_service import VertexAiSessionService
 from google.api_core import exceptions as api_core_exceptions
@@ -521,6 +522,48 @@ async def test_list_sessions_all_users():
   assert {s.id for s in sessions.sessions} == {'1', '2', '3', 'page1', 'page2'}
 
 
+@pytest.mark.asyncio
+@pytest.mark.usefixtures('mock_get_api_client')
+async def test_list_sessions_with_config():
+  session_service = mock_vertex_ai_session_service()
+  config = ListSessionsConfig(page_size=2, descending=True)
+
+  response = await session_service.list_sessions(
+      app_name='123', user_id=None, config=config
+  )
+  assert [s.id for s in response.sessions] == ['page2', 'page1']
+  assert response.next_page_token
+
+  response = await session_service.list_sessions(
+      app_name='123',
+      user_id=None,
+      config=config.model_copy(update={'page_token': response.next_page_token}),
+  )
+  assert [s.id for s in response.sessions] == ['3', '2']
+
+
+@pytest.mark.asyncio
+async def test_list_sessions_filters_updated_after_in_api(
+    mock_api_client_instance, mock_get_api_client
+):
+  session_service = mock_vertex_ai_session_service()
+
+  await session_service.list_sessions(
+      app_name='123',
+      user_id='user',
+      config=ListSessionsConfig(updated_after=0),
+  )
+
+  list_config = (
+      mock_api_client_instance.aio.agent_engines.sessions.list.call_args.kwargs[
+          'config'
+      ]
+  )
+  assert list_config['filter'] == (
+      'user_id="user" AND update_time>"1970-01-01T00:00:00+00:00"'
+  )
+
+
 @pytest.mark.asyncio
 @pytest.mark.usefixtures('mock_get_api_client')
 async def test_create_session():
@@ -25,6 +25,8 @@ from google.adk.models.llm_request import LlmRequest
 from google.adk.models.llm_response import LlmResponse
 from google.adk.sessions.in_memory_session_service import InMemorySessionService
 from google.adk.telemetry.tracing import ADK_CAPTURE_MESSAGE_CONTENT_IN_SPANS
+from google.adk.telemetry.tracing import ADK_SPAN_PAYLOAD_MAX_CHARS
+from google.adk.telemetry.tracing import ADK_SPAN_PAYLOAD_SAMPLE_RATE
 from google.adk.telemetry.tracing import trace_agent_invocation
 from google.adk.telemetry.tracing import trace_call_llm
 from google.adk.telemetry.tracing import trace_merged_tool_calls
@@ -517,3 +519,113 @@ def test_trace_merged_tool_disabling_request_response_content(
       "Attribute 'gcp.vertex.agent.tool_response' was incorrectly set on the"
       ' span.'
   )
+
+
+def _get_span_attribute(mock_span, name: str) -> Any:
+  return next(
+      call_obj.args[1]
+      for call_obj in mock_span.set_attribute.call_args_list
+      if call_obj.args[0] == name
+  )
+
+
+@pytest.mark.asyncio
+async def test_trace_call_llm_skips_serialization_if_span_not_recording(
+    monkeypatch, mock_span_fixture
+):
+  """Test trace_call_llm doesn't serialize payloads for unrecorded spans."""
+  mock_span_fixture.is_recording.return_value = False
+  monkeypatch.setattr(
+      'opentelemetry.trace.get_current_span', lambda: mock_span_fixture
+  )
+  invocation_context = await _create_invocation_context(
+      LlmAgent(name='test_agent')
+  )
+  llm_request = LlmRequest(model='gemini-pro')
+  llm_response = LlmResponse(turn_complete=True)
+
+  with mock.patch.object(LlmResponse, 'model_dump_json') as mock_dump:
+    trace_call_llm(
+        invocation_context, 'test_event_id', llm_request, llm_response
+    )
+
+  mock_dump.assert_not_called()
+  assert (
+      _get_span_attribute(mock_span_fixture, 'gcp.vertex.agent.llm_response')
+      == {}
+  )
+
+
+@pytest.mark.asyncio
+async def test_trace_call_llm_payload_sampling(monkeypatch, mock_span_fixture):
+  """Test unsampled traces only record the payloads of failed calls."""
+  monkeypatch.setenv(ADK_SPAN_PAYLOAD_SAMPLE_RATE, '0')
+  monkeypatch.setattr(
+      'opentelemetry.trace.get_current_span', lambda: mock_span_fixture
+  )
+  invocation_context = await _create_invocation_context(
+      LlmAgent(name='test_agent')
+  )
+  llm_request = LlmRequest(model='gemini-pro')
+
+  trace_call_llm(
+      invocation_context,
+      'test_event_id',
+      llm_request,
+      LlmResponse(turn_complete=True),
+  )
+  assert (
+      _get_span_attribute(mock_span_fixture, 'gcp.vertex.agent.llm_response')
+      == {}
+  )
+
+  mock_span_fixture.reset_mock()
+  trace_call_llm(
+      invocation_context,
+      'test_event_id',
+      llm_request,
+      LlmResponse(error_code='500', error_message='Internal error'),
+  )
+  llm_response_json = _get_span_attribute(
+      mock_span_fixture, 'gcp.vertex.agent.llm_response'
+  )
+  assert json.loads(llm_response_json)['error_code'] == '500'
+
+
+@pytest.mark.asyncio
+async def test_trace_call_llm_payload_max_chars(monkeypatch, mock_span_fixture):
+  """Test only the most recent contents are recorded within the size cap."""
+  monkeypatch.setenv(ADK_SPAN_PAYLOAD_MAX_CHARS, '200')
+  monkeypatch.setattr(
+      'opentelemetry.trace.get_current_span', lambda: mock_span_fixture
+  )
+  invocation_context = await _create_invocation_context(
+      LlmAgent(name='test_agent')
+  )
+  llm_request = LlmRequest(
+      model='gemini-pro',
+      contents=[
+          types.Content(role='user', parts=[types.Part(text=f'message {i}')])
+          for i in range(100)
+      ],
+  )
+  llm_response = LlmResponse(
+      content=types.Content(role='model', parts=[types.Part(text='x' * 1000)])
+  )
+
+  trace_call_llm(invocation_context, 'test_event_id', llm_request, llm_response)
+
+  llm_request_json = _get_span_attribute(
+      mock_span_fixture, 'gcp.vertex.agent.llm_request'
+  )
+  assert llm_request_json.endswith('chars>')
+  assert len(llm_request_json) < 250
+  assert '"message 96"' in llm_request_json
+  assert '"message 0"' not in llm_request_json
+  llm_response_json = _get_span_attribute(
+      mock_span_fixture, 'gcp.vertex.agent.llm_response'
+  )
+  assert llm_response_json.startswith(
+      llm_response.model_dump_json(exclude_none=True)[:200]
+  )
+  assert llm_response_json.endswith('chars>')
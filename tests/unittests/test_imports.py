@@ -0,0 +1,92 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Guards the import time of the package against regressions."""
+
+import json
+import subprocess
+import sys
+import textwrap
+
+import google.adk
+import google.adk.agents
+import google.adk.tools
+import pytest
+
+_HEAVY_MODULES = [
+    "google.adk.agents.llm_agent",
+    "google.adk.runners",
+    "google.adk.tools.apihub_tool",
+    "google.adk.tools.discovery_engine_search_tool",
+    "google.adk.tools.openapi_tool",
+    "google.adk.tools.vertex_ai_search_tool",
+    "google.cloud.aiplatform",
+]
+
+
+def _imported_heavy_modules(statement: str) -> list[str]:
+  """Runs the import statement in a new interpreter.
+
+  Returns:
+    The heavy modules imported by the statement.
+  """
+  code = textwrap.dedent(f"""
+      import json
+      import sys
+      {statement}
+      print(json.dumps([m for m in {_HEAVY_MODULES!r} if m in sys.modules]))
+  """)
+  result = subprocess.run(
+      [sys.executable, "-c", code],
+      capture_output=True,
+      text=True,
+      check=True,
+  )
+  return json.loads(result.stdout.splitlines()[-1])
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "import google.adk",
+        "import google.adk.agents",
+        "from google.adk.tools import FunctionTool",
+        "from google.adk.tools.function_tool import FunctionTool",
+    ],
+)
+def test_import_does_not_load_heavy_modules(statement):
+  assert _imported_heavy_modules(statement) == []
+
+
+@pytest.mark.parametrize(
+    "module",
+    [google.adk, google.adk.agents, google.adk.tools],
+    ids=lambda module: module.__name__,
+)
+def test_lazy_exports(module):
+  for name in module.__all__:
+    assert getattr(module, name) is not None
+  assert set(module.__all__) <= set(dir(module))
+  with pytest.raises(AttributeError):
+    getattr(module, "NotExported")
+
+
+def test_lazy_exports_are_the_original_objects():
+  from google.adk.agents.llm_agent import LlmAgent
+  from google.adk.runners import Runner
+  from google.adk.tools.load_memory_tool import load_memory_tool
+
+  assert google.adk.Agent is LlmAgent
+  assert google.adk.Runner is Runner
+  assert google.adk.tools.load_memory is load_memory_tool
@@ -12,9 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 from pathlib import Path
 import textwrap
 from typing import Optional
+from unittest import mock
 
 from google.adk.agents.base_agent import BaseAgent
 from google.adk.agents.context_cache_config import ContextCacheConfig
@@ -775,5 +777,105 @@ class TestRunnerCacheConfig:
     assert str(runner.context_cache_config) == expected_str
 
 
+class LoopRecordingAgent(BaseAgent):
+  """Agent recording the event loop it runs on."""
+
+  loops: list = []
+
+  async def _run_async_impl(self, invocation_context):
+    self.loops.append(asyncio.get_running_loop())
+    yield Event(
+        invocation_id=invocation_context.invocation_id,
+        author=self.name,
+        content=types.Content(role="model", parts=[types.Part(text="Hi")]),
+    )
+
+
+@pytest.mark.parametrize("reuse_event_loop", [False, True])
+def test_run_event_loop_reuse(reuse_event_loop):
+  agent = LoopRecordingAgent(name="loop_agent", loops=[])
+  session_service = InMemorySessionService()
+  session_service.create_session_sync(
+      app_name=TEST_APP_ID, user_id=TEST_USER_ID, session_id=TEST_SESSION_ID
+  )
+  runner = Runner(
+      app_name=TEST_APP_ID,
+      agent=agent,
+      session_service=session_service,
+      reuse_event_loop=reuse_event_loop,
+  )
+  new_message = types.Content(role="user", parts=[types.Part(text="Hello")])
+
+  for _ in range(2):
+    events = list(
+        runner.run(
+            user_id=TEST_USER_ID,
+            session_id=TEST_SESSION_ID,
+            new_message=new_message,
+        )
+    )
+    assert [event.content.parts[0].text for event in events] == ["Hi"]
+
+  assert (agent.loops[0] is agent.loops[1]) == reuse_event_loop
+  asyncio.run(runner.close())
+  assert agent.loops[1].is_closed()
+
+
+@pytest.mark.asyncio
+async def test_close_shuts_down_function_tool_executors():
+  runner = Runner(
+      app_name=TEST_APP_ID,
+      agent=LoopRecordingAgent(name="loop_agent", loops=[]),
+      session_service=InMemorySessionService(),
+  )
+
+  with mock.patch(
+      "google.adk.runners._shutdown_executors"
+  ) as shutdown_executors:
+    await runner.close()
+
+  shutdown_executors.assert_called_once_with()
+
+
+class FailingAgent(BaseAgent):
+  """Agent raising an error after its first event."""
+
+  async def _run_async_impl(self, invocation_context):
+    yield Event(
+        invocation_id=invocation_context.invocation_id,
+        author=self.name,
+        content=types.Content(role="model", parts=[types.Part(text="Hi")]),
+    )
+    raise ValueError("Agent error")
+
+
+@pytest.mark.asyncio
+async def test_buffered_events_are_flushed_when_agent_fails():
+  session_service = InMemorySessionService()
+  await session_service.create_session(
+      app_name=TEST_APP_ID, user_id=TEST_USER_ID, session_id=TEST_SESSION_ID
+  )
+  runner = Runner(
+      app_name=TEST_APP_ID,
+      agent=FailingAgent(name="failing_agent"),
+      session_service=session_service,
+  )
+
+  with mock.patch.object(
+      session_service, "flush_events", wraps=session_service.flush_events
+  ) as mock_flush:
+    with pytest.raises(ValueError):
+      async for _ in runner.run_async(
+          user_id=TEST_USER_ID,
+          session_id=TEST_SESSION_ID,
+          new_message=types.Content(
+              role="user", parts=[types.Part(text="Hello")]
+          ),
+      ):
+        pass
+
+  mock_flush.assert_awaited_once()
+
+
 if __name__ == "__main__":
   pytest.main([__file__])
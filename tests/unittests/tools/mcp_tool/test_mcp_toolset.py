@@ -14,6 +14,7 @@
 
 from io import StringIO
 import sys
+import time
 import unittest
 from unittest.mock import AsyncMock
 from unittest.mock import Mock
@@ -37,6 +38,8 @@ try:
   from google.adk.tools.mcp_tool.mcp_tool import MCPTool
   from google.adk.tools.mcp_tool.mcp_toolset import MCPToolset
   from mcp import StdioServerParameters
+  from mcp.types import ServerNotification
+  from mcp.types import ToolListChangedNotification
 except ImportError as e:
   if sys.version_info < (3, 10):
     # Create dummy classes to prevent NameError during test collection
@@ -272,6 +275,125 @@ class TestMCPToolset:
         headers=expected_headers
     )
 
+  @pytest.mark.asyncio
+  async def test_get_tools_with_tool_list_cache(self):
+    """Test that cached tool listings are reused until they expire."""
+    self.mock_session.list_tools = AsyncMock(
+        return_value=MockListToolsResult([MockMCPTool("tool1")])
+    )
+
+    toolset = MCPToolset(
+        connection_params=self.mock_stdio_params,
+        tool_list_cache_ttl_seconds=60,
+    )
+    toolset._mcp_session_manager = self.mock_session_manager
+
+    tools1 = await toolset.get_tools()
+    tools2 = await toolset.get_tools()
+
+    assert self.mock_session.list_tools.call_count == 1
+    assert tools1[0] is tools2[0]
+
+    with patch(
+        "google.adk.tools.mcp_tool.mcp_toolset.time.monotonic",
+        return_value=time.monotonic() + 61,
+    ):
+      await toolset.get_tools()
+
+    assert self.mock_session.list_tools.call_count == 2
+
+  @pytest.mark.asyncio
+  async def test_get_tools_tool_list_cache_invalidated_on_list_changed(self):
+    """Test that a tools/list_changed notification invalidates the cache."""
+    self.mock_session.list_tools = AsyncMock(
+        return_value=MockListToolsResult([MockMCPTool("tool1")])
+    )
+
+    toolset = MCPToolset(
+        connection_params=self.mock_stdio_params,
+        tool_list_cache_ttl_seconds=60,
+    )
+    toolset._mcp_session_manager = self.mock_session_manager
+
+    await toolset.get_tools()
+    await toolset._handle_message(
+        ServerNotification(
+            ToolListChangedNotification(
+                method="notifications/tools/list_changed"
+            )
+        )
+    )
+    await toolset.get_tools()
+
+    assert self.mock_session.list_tools.call_count == 2
+
+  @pytest.mark.asyncio
+  async def test_get_tools_tool_list_cache_evicts_expired_entries(self):
+    """Test that caching tools evicts the entries of other expired headers."""
+    self.mock_session.list_tools = AsyncMock(
+        return_value=MockListToolsResult([MockMCPTool("tool1")])
+    )
+    header_provider = Mock(side_effect=[{"token": "a"}, {"token": "b"}])
+
+    toolset = MCPToolset(
+        connection_params=self.mock_stdio_params,
+        header_provider=header_provider,
+        tool_list_cache_ttl_seconds=60,
+    )
+    toolset._mcp_session_manager = self.mock_session_manager
+
+    await toolset.get_tools(readonly_context=Mock(spec=ReadonlyContext))
+    with patch(
+        "google.adk.tools.mcp_tool.mcp_toolset.time.monotonic",
+        return_value=time.monotonic() + 61,
+    ):
+      await toolset.get_tools(readonly_context=Mock(spec=ReadonlyContext))
+
+    assert list(toolset._tool_list_cache) == ['{"token": "b"}']
+
+  @pytest.mark.asyncio
+  async def test_get_tools_tool_list_cache_is_bounded(self):
+    """Test that the least recently used headers are evicted from the cache."""
+    self.mock_session.list_tools = AsyncMock(
+        return_value=MockListToolsResult([MockMCPTool("tool1")])
+    )
+    headers = [{"token": "a"}, {"token": "b"}, {"token": "a"}, {"token": "c"}]
+    header_provider = Mock(side_effect=headers)
+
+    toolset = MCPToolset(
+        connection_params=self.mock_stdio_params,
+        header_provider=header_provider,
+        tool_list_cache_ttl_seconds=60,
+    )
+    toolset._mcp_session_manager = self.mock_session_manager
+
+    with patch(
+        "google.adk.tools.mcp_tool.mcp_toolset._MAX_TOOL_LIST_CACHE_ENTRIES", 2
+    ):
+      for _ in headers:
+        await toolset.get_tools(readonly_context=Mock(spec=ReadonlyContext))
+
+    assert self.mock_session.list_tools.call_count == 3
+    assert list(toolset._tool_list_cache) == [
+        '{"token": "a"}',
+        '{"token": "c"}',
+    ]
+
+  @pytest.mark.asyncio
+  async def test_get_tools_without_tool_list_cache(self):
+    """Test that tools are listed on every call by default."""
+    self.mock_session.list_tools = AsyncMock(
+        return_value=MockListToolsResult([MockMCPTool("tool1")])
+    )
+
+    toolset = MCPToolset(connection_params=self.mock_stdio_params)
+    toolset._mcp_session_manager = self.mock_session_manager
+
+    await toolset.get_tools()
+    await toolset.get_tools()
+
+    assert self.mock_session.list_tools.call_count == 2
+
   @pytest.mark.asyncio
   async def test_close_success(self):
     """Test successful cleanup."""
@@ -28,11 +28,13 @@ from google.adk.tools.openapi_tool.auth.auth_helpers import token_to_scheme_cred
 from google.adk.tools.openapi_tool.common.common import ApiParameter
 from google.adk.tools.openapi_tool.openapi_spec_parser.openapi_spec_parser import OperationEndpoint
 from google.adk.tools.openapi_tool.openapi_spec_parser.operation_parser import OperationParser
+from google.adk.tools.openapi_tool.openapi_spec_parser.rest_api_tool import _to_httpx_request_params
 from google.adk.tools.openapi_tool.openapi_spec_parser.rest_api_tool import RestApiTool
 from google.adk.tools.openapi_tool.openapi_spec_parser.rest_api_tool import snake_to_lower_camel
 from google.adk.tools.tool_context import ToolContext
 from google.genai.types import FunctionDeclaration
 from google.genai.types import Schema
+import httpx
 import pytest
 
 
@@ -193,7 +195,8 @@ class TestRestApiTool:
     assert isinstance(declaration.parameters, Schema)
 
   @patch(
-      "google.adk.tools.openapi_tool.openapi_spec_parser.rest_api_tool.requests.request"
+      "google.adk.utils.http_transport.HttpTransport.request",
+      new_callable=AsyncMock,
   )
   @pytest.mark.asyncio
   async def test_call_success(
@@ -224,8 +227,60 @@ class TestRestApiTool:
     # Check the result
     assert result == {"result": "success"}
 
+  @pytest.mark.asyncio
+  async def test_call_uses_http_transport(
+      self, mock_tool_context, sample_endpoint
+  ):
+    operation = Operation(
+        operationId="test_op",
+        parameters=[
+            OpenAPIParameter(
+                name="session_id",
+                **{"in": "cookie"},
+                schema=OpenAPISchema(type="string"),
+            )
+        ],
+    )
+    http_transport = MagicMock()
+    http_transport.request = AsyncMock(
+        return_value=httpx.Response(
+            500,
+            text="Internal error",
+            request=httpx.Request("GET", "https://example.com/test"),
+        )
+    )
+    tool = RestApiTool(
+        name="test_tool",
+        description="Test Tool",
+        endpoint=sample_endpoint,
+        operation=operation,
+        http_transport=http_transport,
+    )
+
+    result = await tool.call(
+        args={"session_id": "abc"},
+        tool_context=mock_tool_context,
+    )
+
+    assert "Internal error" in result["error"]
+    request_params = http_transport.request.call_args.kwargs
+    assert request_params["headers"]["Cookie"] == "session_id=abc"
+    assert "cookies" not in request_params
+
+  def test_to_httpx_request_params_raw_body(self):
+    request_params = _to_httpx_request_params(
+        {"method": "post", "url": "https://example.com", "data": b"raw"}
+    )
+
+    assert request_params == {
+        "method": "post",
+        "url": "https://example.com",
+        "content": b"raw",
+    }
+
   @patch(
-      "google.adk.tools.openapi_tool.openapi_spec_parser.rest_api_tool.requests.request"
+      "google.adk.utils.http_transport.HttpTransport.request",
+      new_callable=AsyncMock,
   )
   @pytest.mark.asyncio
   async def test_call_auth_pending(
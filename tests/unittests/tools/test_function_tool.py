@@ -12,10 +12,18 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+import threading
+import time
 from unittest.mock import MagicMock
+from unittest.mock import patch
 
 from google.adk.agents.invocation_context import InvocationContext
+from google.adk.agents.run_config import RunConfig
+from google.adk.agents.tool_execution_config import ToolExecutionConfig
+from google.adk.agents.tool_execution_config import ToolExecutionMode
 from google.adk.sessions.session import Session
+from google.adk.tools import function_tool
 from google.adk.tools.function_tool import FunctionTool
 from google.adk.tools.tool_confirmation import ToolConfirmation
 from google.adk.tools.tool_context import ToolContext
@@ -28,6 +36,7 @@ def mock_tool_context() -> ToolContext:
   mock_invocation_context = MagicMock(spec=InvocationContext)
   mock_invocation_context.session = MagicMock(spec=Session)
   mock_invocation_context.session.state = MagicMock()
+  mock_invocation_context.run_config = None
   return ToolContext(invocation_context=mock_invocation_context)
 
 
@@ -200,9 +209,11 @@ async def test_run_async_1_missing_arg_sync_func():
   args = {"arg1": "test_value_1"}
   result = await tool.run_async(args=args, tool_context=MagicMock())
   assert result == {
-      "error": """Invoking `function_for_testing_with_2_arg_and_no_tool_context()` failed as the following mandatory input parameters are not present:
+      "error": (
+          """Invoking `function_for_testing_with_2_arg_and_no_tool_context()` failed as the following mandatory input parameters are not present:
 arg2
 You could retry calling this tool, but it is IMPORTANT for you to provide all the mandatory parameters."""
+      )
   }
 
 
@@ -213,9 +224,11 @@ async def test_run_async_1_missing_arg_async_func():
   args = {"arg2": "test_value_1"}
   result = await tool.run_async(args=args, tool_context=MagicMock())
   assert result == {
-      "error": """Invoking `async_function_for_testing_with_2_arg_and_no_tool_context()` failed as the following mandatory input parameters are not present:
+      "error": (
+          """Invoking `async_function_for_testing_with_2_arg_and_no_tool_context()` failed as the following mandatory input parameters are not present:
 arg1
 You could retry calling this tool, but it is IMPORTANT for you to provide all the mandatory parameters."""
+      )
   }
 
 
@@ -226,11 +239,13 @@ async def test_run_async_3_missing_arg_sync_func():
   args = {"arg2": "test_value_1"}
   result = await tool.run_async(args=args, tool_context=MagicMock())
   assert result == {
-      "error": """Invoking `function_for_testing_with_4_arg_and_no_tool_context()` failed as the following mandatory input parameters are not present:
+      "error": (
+          """Invoking `function_for_testing_with_4_arg_and_no_tool_context()` failed as the following mandatory input parameters are not present:
 arg1
 arg3
 arg4
 You could retry calling this tool, but it is IMPORTANT for you to provide all the mandatory parameters."""
+      )
   }
 
 
@@ -241,11 +256,13 @@ async def test_run_async_3_missing_arg_async_func():
   args = {"arg3": "test_value_1"}
   result = await tool.run_async(args=args, tool_context=MagicMock())
   assert result == {
-      "error": """Invoking `async_function_for_testing_with_4_arg_and_no_tool_context()` failed as the following mandatory input parameters are not present:
+      "error": (
+          """Invoking `async_function_for_testing_with_4_arg_and_no_tool_context()` failed as the following mandatory input parameters are not present:
 arg1
 arg2
 arg4
 You could retry calling this tool, but it is IMPORTANT for you to provide all the mandatory parameters."""
+      )
   }
 
 
@@ -256,12 +273,14 @@ async def test_run_async_missing_all_arg_sync_func():
   args = {}
   result = await tool.run_async(args=args, tool_context=MagicMock())
   assert result == {
-      "error": """Invoking `function_for_testing_with_4_arg_and_no_tool_context()` failed as the following mandatory input parameters are not present:
+      "error": (
+          """Invoking `function_for_testing_with_4_arg_and_no_tool_context()` failed as the following mandatory input parameters are not present:
 arg1
 arg2
 arg3
 arg4
 You could retry calling this tool, but it is IMPORTANT for you to provide all the mandatory parameters."""
+      )
   }
 
 
@@ -272,12 +291,14 @@ async def test_run_async_missing_all_arg_async_func():
   args = {}
   result = await tool.run_async(args=args, tool_context=MagicMock())
   assert result == {
-      "error": """Invoking `async_function_for_testing_with_4_arg_and_no_tool_context()` failed as the following mandatory input parameters are not present:
+      "error": (
+          """Invoking `async_function_for_testing_with_4_arg_and_no_tool_context()` failed as the following mandatory input parameters are not present:
 arg1
 arg2
 arg3
 arg4
 You could retry calling this tool, but it is IMPORTANT for you to provide all the mandatory parameters."""
+      )
   }
 
 
@@ -321,6 +342,7 @@ async def test_run_async_with_unexpected_argument():
   mock_invocation_context.session = MagicMock(spec=Session)
   # Add the missing state attribute to the session mock
   mock_invocation_context.session.state = MagicMock()
+  mock_invocation_context.run_config = None
   tool_context_mock = ToolContext(invocation_context=mock_invocation_context)
 
   result = await tool.run_async(
@@ -342,6 +364,7 @@ async def test_run_async_with_tool_context_and_unexpected_argument():
   mock_invocation_context.session = MagicMock(spec=Session)
   # Add the missing state attribute to the session mock
   mock_invocation_context.session.state = MagicMock()
+  mock_invocation_context.run_config = None
   mock_tool_context = ToolContext(invocation_context=mock_invocation_context)
 
   result = await tool.run_async(
@@ -368,6 +391,7 @@ async def test_run_async_with_require_confirmation():
   mock_invocation_context = MagicMock(spec=InvocationContext)
   mock_invocation_context.session = MagicMock(spec=Session)
   mock_invocation_context.session.state = MagicMock()
+  mock_invocation_context.run_config = None
   mock_invocation_context.agent = MagicMock()
   mock_invocation_context.agent.name = "test_agent"
   tool_context_mock = ToolContext(invocation_context=mock_invocation_context)
@@ -428,3 +452,102 @@ async def test_run_async_parameter_filtering(mock_tool_context):
   assert result == {"arg1": "test", "arg2": 42}
   # Explicitly verify that unexpected_param was filtered out and not passed to the function
   assert "unexpected_param" not in result
+
+
+def blocking_function_returning_thread_name(arg1):
+  """Blocking function for testing executor offloading."""
+  time.sleep(0.2)
+  return threading.current_thread().name
+
+
+@pytest.mark.asyncio
+async def test_run_async_sync_func_in_thread_pool_runs_in_parallel():
+  """Test that sync functions run concurrently with a thread execution mode."""
+  tool = FunctionTool(
+      blocking_function_returning_thread_name,
+      execution_config=ToolExecutionConfig(
+          mode=ToolExecutionMode.THREAD, max_workers=4
+      ),
+  )
+
+  start = time.monotonic()
+  results = await asyncio.gather(*[
+      tool.run_async(args={"arg1": i}, tool_context=MagicMock())
+      for i in range(4)
+  ])
+
+  assert time.monotonic() - start < 0.6
+  assert all(name.startswith("adk_function_tool") for name in results)
+
+
+@pytest.mark.asyncio
+async def test_run_async_sync_func_uses_run_config_execution_config(
+    mock_tool_context,
+):
+  """Test that the run config provides the default execution config."""
+  mock_tool_context._invocation_context.run_config = RunConfig(
+      tool_execution_config=ToolExecutionConfig(mode=ToolExecutionMode.THREAD)
+  )
+  tool = FunctionTool(blocking_function_returning_thread_name)
+
+  result = await tool.run_async(
+      args={"arg1": "value"}, tool_context=mock_tool_context
+  )
+
+  assert result.startswith("adk_function_tool")
+
+
+@pytest.mark.asyncio
+async def test_run_async_sync_func_in_thread_pool_timeout():
+  """Test that a timed out tool returns an error to the model."""
+  tool = FunctionTool(
+      blocking_function_returning_thread_name,
+      execution_config=ToolExecutionConfig(
+          mode=ToolExecutionMode.THREAD, timeout_seconds=0.05
+      ),
+  )
+
+  result = await tool.run_async(args={"arg1": 1}, tool_context=MagicMock())
+
+  assert result == {
+      "error": (
+          "Invoking `blocking_function_returning_thread_name()` timed out"
+          " after 0.05 seconds."
+      )
+  }
+
+
+@pytest.mark.asyncio
+async def test_shutdown_executors():
+  """Test the shared executors are shut down and recreated on demand."""
+  tool = FunctionTool(
+      blocking_function_returning_thread_name,
+      execution_config=ToolExecutionConfig(mode=ToolExecutionMode.THREAD),
+  )
+  await tool.run_async(args={"arg1": 1}, tool_context=MagicMock())
+  executors = list(function_tool._executors.values())
+  assert executors
+
+  function_tool._shutdown_executors()
+
+  assert not function_tool._executors
+  assert all(executor._shutdown for executor in executors)
+  result = await tool.run_async(args={"arg1": 1}, tool_context=MagicMock())
+  assert result.startswith("adk_function_tool")
+
+
+@pytest.mark.asyncio
+async def test_run_async_reuses_call_plan():
+  """Test that the function signature is only inspected on the first call."""
+  tool = FunctionTool(function_for_testing_with_2_arg_and_no_tool_context)
+  args = {"arg1": "test_value_1", "arg2": "test_value_2"}
+  await tool.run_async(args=args, tool_context=MagicMock())
+
+  with patch(
+      "google.adk.tools.function_tool.inspect.signature"
+  ) as mock_signature:
+    for _ in range(3):
+      result = await tool.run_async(args=args, tool_context=MagicMock())
+      assert result == "test_value_1"
+
+  mock_signature.assert_not_called()
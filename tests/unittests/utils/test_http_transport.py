@@ -0,0 +1,169 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+from unittest import mock
+
+from google.adk.utils.http_transport import HttpTransport
+from google.adk.utils.http_transport import HttpTransportConfig
+import httpx
+import pytest
+
+
+def _create_transport(handler, max_retries=2) -> HttpTransport:
+  transport = HttpTransport(
+      HttpTransportConfig(max_retries=max_retries, retry_backoff_seconds=0)
+  )
+  transport._create_client = lambda: httpx.AsyncClient(
+      transport=httpx.MockTransport(handler)
+  )
+  return transport
+
+
+@pytest.mark.asyncio
+async def test_idempotent_requests_are_retried():
+  statuses = [503, 429, 200]
+  methods = []
+
+  def handler(request):
+    methods.append(request.method)
+    return httpx.Response(statuses[len(methods) - 1])
+
+  transport = _create_transport(handler)
+  response = await transport.request("GET", "https://example.com")
+
+  assert response.status_code == 200
+  assert methods == ["GET", "GET", "GET"]
+
+
+@pytest.mark.asyncio
+async def test_retries_are_limited():
+  attempts = []
+
+  def handler(request):
+    attempts.append(request)
+    raise httpx.ConnectError("Connection refused", request=request)
+
+  transport = _create_transport(handler, max_retries=1)
+  with pytest.raises(httpx.ConnectError):
+    await transport.request("DELETE", "https://example.com")
+
+  assert len(attempts) == 2
+
+
+@pytest.mark.asyncio
+async def test_non_idempotent_requests_are_not_retried():
+  attempts = []
+
+  def handler(request):
+    attempts.append(request)
+    return httpx.Response(503)
+
+  transport = _create_transport(handler)
+  response = await transport.request("POST", "https://example.com", json={})
+
+  assert response.status_code == 503
+  assert len(attempts) == 1
+
+
+@pytest.mark.asyncio
+async def test_client_is_reused_until_closed():
+  transport = _create_transport(lambda request: httpx.Response(200))
+  with mock.patch.object(
+      transport, "_create_client", wraps=transport._create_client
+  ) as create_client:
+    await transport.request("GET", "https://example.com")
+    await transport.request("GET", "https://example.com")
+    client = transport._get_client()
+    assert create_client.call_count == 1
+
+    await transport.aclose()
+
+    assert client.is_closed
+    await transport.request("GET", "https://example.com")
+    assert create_client.call_count == 2
+
+
+def test_clients_are_not_shared_across_event_loops():
+  transport = _create_transport(lambda request: httpx.Response(200))
+
+  async def get_client():
+    await transport.request("GET", "https://example.com")
+    return transport._get_client()
+
+  assert asyncio.run(get_client()) is not asyncio.run(get_client())
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "retry_after", ["3", "Wed, 21 Oct 2015 07:28:00 GMT", "invalid"]
+)
+async def test_retry_after_is_honored(retry_after):
+  statuses = [429, 200]
+  attempts = []
+
+  def handler(request):
+    attempts.append(request)
+    return httpx.Response(
+        statuses[len(attempts) - 1], headers={"Retry-After": retry_after}
+    )
+
+  transport = _create_transport(handler)
+  with mock.patch("asyncio.sleep", new=mock.AsyncMock()) as sleep:
+    response = await transport.request("GET", "https://example.com")
+
+  assert response.status_code == 200
+  # A date in the past retries immediately, and an invalid header falls back
+  # to the backoff, which is 0 in these tests.
+  expected_delay = 3 if retry_after == "3" else 0
+  sleep.assert_awaited_once_with(expected_delay)
+
+
+@pytest.mark.asyncio
+async def test_retry_after_beyond_max_backoff_is_not_retried():
+  attempts = []
+
+  def handler(request):
+    attempts.append(request)
+    return httpx.Response(503, headers={"Retry-After": "120"})
+
+  transport = _create_transport(handler)
+  response = await transport.request("GET", "https://example.com")
+
+  assert response.status_code == 503
+  assert len(attempts) == 1
+
+
+def test_default_config_has_no_read_timeout():
+  client = HttpTransport()._create_client()
+
+  assert client.timeout.read is None
+  assert client.timeout.connect == 10.0
+
+
+@pytest.mark.asyncio
+async def test_max_retries_can_be_overridden_per_request():
+  attempts = []
+
+  def handler(request):
+    attempts.append(request)
+    return httpx.Response(503)
+
+  transport = _create_transport(handler)
+  response = await transport.request(
+      "GET", "https://example.com", max_retries=0
+  )
+
+  assert response.status_code == 503
+  assert len(attempts) == 1